@@ -4,9 +4,12 @@ Ce fichier contient les fixtures et hooks globaux pour les tests
 """
 
 import os
+import glob
+import json
 import pytest
 import yaml
 import allure
+import allure_commons
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -17,7 +20,49 @@ load_dotenv()
 from tests.data import (
     load_test_data,
     DatabaseManager,
+    DataRepository,
+    TestDataManager,
+    get_db,
+    reset_database,
 )
+from tests.data.change_tracking import ChangeTracker
+from tests.data.datasets import build_dataset, load_dataset
+from tests.data.database import SNAPSHOTS_ENV
+from tests.data.instrumentation import SQLRecorder, format_summary
+from tests.utils.emulation import (
+    resolve_emulation_profile,
+    resolve_performance_thresholds,
+    apply_emulation_profile,
+    NO_PROFILE,
+)
+from tests.utils.browser_metrics import (
+    BrowserMetricsSampler,
+    write_metrics_record,
+    METRICS_DIR,
+)
+from tests.utils.asset_budget import (
+    AssetRecorder,
+    write_asset_report,
+    ASSETS_DIR,
+)
+from tests.utils.perf_baseline import (
+    PerfRecorder,
+    PerfBaselineStore,
+    RUN_ID_ENV,
+    compare_run,
+    current_branch,
+    current_commit,
+    new_run_id,
+    write_result,
+)
+
+# Clés de stockage sur l'objet config (base de référence des performances)
+PERF_RECORDER_KEY = pytest.StashKey()
+PERF_RESULT_KEY = pytest.StashKey()
+# Instrumentation SQL (enregistreur, tests signalés : N+1, requêtes lentes, mode d'attachement)
+SQL_RECORDER_KEY = pytest.StashKey()
+SQL_FLAGGED_KEY = pytest.StashKey()
+SQL_ATTACH_KEY = pytest.StashKey()
 
 
 def load_config(config_file):
@@ -41,6 +86,86 @@ def pytest_addoption(parser):
         default="desktop",
         help="Résolution: desktop (défaut), mobile, tablet",
     )
+    parser.addoption(
+        "--perf-profile",
+        action="store",
+        default=os.getenv("PERF_PROFILE") or NO_PROFILE,
+        help="Profil d'émulation CPU/réseau: none (défaut), auto, "
+        "ou un profil de test_config.yaml (mobile-3g, tablet-wifi...)",
+    )
+    parser.addoption(
+        "--soak-duration",
+        action="store",
+        type=float,
+        default=0,
+        help="Durée du test soak en minutes (0 = désactivé)",
+    )
+    parser.addoption(
+        "--soak-flows",
+        action="store",
+        default="",
+        help="Parcours du test soak séparés par des virgules "
+        "(défaut: soak.flows de test_config.yaml)",
+    )
+    parser.addoption(
+        "--seed-db",
+        action="store_true",
+        default=False,
+        help="Seede une fois la base modèle de l'environnement, "
+        "puis une copie par worker xdist (supprimées en fin de session)",
+    )
+    parser.addoption(
+        "--db-backend",
+        action="store",
+        default=os.getenv("DB_BACKEND") or "file",
+        choices=["file", "memory", "server"],
+        help="Base des fixtures test_db/db_session: file (défaut), "
+        "memory (SQLite en mémoire partagée, sans I/O disque) "
+        "ou server (bloc database de environments.yaml, repli sur file)",
+    )
+    parser.addoption(
+        "--allow-server-reset",
+        action="store_true",
+        default=False,
+        help="Avec --db-backend=server : autorise fresh_db à vider et reseeder la base "
+        "serveur (partagée sur int/uat/preprod) ; sinon utiliser db_session",
+    )
+    parser.addoption(
+        "--delta-reset",
+        action="store_true",
+        default=False,
+        help="Reset différentiel de la base (suivi des lignes modifiées par triggers) ; "
+        "restauration en fin de session, en parallèle des autres tâches de fin de session",
+    )
+    parser.addoption(
+        "--dataset",
+        action="store",
+        default=os.getenv("DATASET_PROFILE") or None,
+        metavar="PROFIL",
+        help="Jeu de données reproductible (small, medium, large, xl) : généré une fois "
+        "avec une graine fixe, puis copié depuis tests/data/db/cache",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store_true",
+        default=bool(os.getenv("PERF_BASELINE")),
+        help="Enregistre les durées du run dans la base de référence et compare aux runs "
+        "précédents de la branche (section performance_baseline de test_config.yaml)",
+    )
+    parser.addoption(
+        "--sql-instrumentation",
+        action="store_true",
+        default=False,
+        help="Bilan SQL par test (requêtes lentes, motifs N+1) attaché à Allure "
+        "(seuils: section sql_instrumentation de test_config.yaml)",
+    )
+    parser.addoption(
+        "--db-persist",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Avec --db-backend=memory : copie la base en mémoire dans DIR en fin de session",
+    )
     # --browser et --headed sont gérés nativement par pytest-playwright
 
 
@@ -97,16 +222,97 @@ def browser_context_args(request, browser_context_args):
     return {**browser_context_args, "viewport": {"width": width, "height": height}}
 
 
+@pytest.fixture(scope="session")
+def test_config():
+    """Configuration des tests (config/test_config.yaml)"""
+    return load_config("test_config.yaml")
+
+
+@pytest.fixture(scope="session")
+def perf_profile(request, test_config):
+    """
+    Profil d'émulation CPU/réseau sélectionné via --perf-profile
+
+    Returns:
+        Dictionnaire du profil (clé 'name' incluse), ou None si aucune émulation
+    """
+    profiles = test_config.get("emulation_profiles", {})
+    return resolve_emulation_profile(
+        profiles,
+        request.config.getoption("--perf-profile"),
+        request.config.getoption("--viewport"),
+    )
+
+
+@pytest.fixture(scope="session")
+def performance_thresholds(test_config, perf_profile):
+    """Seuils performance_thresholds de test_config.yaml, surchargés par le profil actif"""
+    return resolve_performance_thresholds(test_config.get("performance_thresholds"), perf_profile)
+
+
+@pytest.fixture(scope="function")
+def browser_metrics(request, page, browser_name):
+    """
+    Métriques mémoire/DOM du navigateur (tas JS, noeuds DOM, listeners, documents)
+
+    Échantillon 'start' pris par web_driver après le chargement de la page,
+    échantillon 'end' pris en fin de test. Les résultats sont ajoutés au
+    fichier reports/metrics/browser-metrics-<worker>.jsonl et attachés à
+    Allure en cas d'échec.
+    """
+    sampler = BrowserMetricsSampler(page, browser_name)
+    yield sampler
+
+    sampler.sample("end")
+    report = getattr(request.node, "rep_call", None)
+    outcome = report.outcome if report is not None else "error"
+    record = sampler.to_record(request.node.nodeid, outcome)
+    try:
+        write_metrics_record(record)
+    except OSError:
+        pass
+
+    if report is not None and report.failed:
+        allure.attach(
+            json.dumps(record, indent=2, ensure_ascii=False),
+            name="Métriques navigateur",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="function")
+def asset_recorder(request, page):
+    """
+    Enregistre les ressources réseau chargées pendant le test
+
+    Démarré avant la navigation initiale de web_driver. Le bilan par
+    page/onglet est ajouté à reports/assets/asset-report-<worker>.jsonl.
+    """
+    recorder = AssetRecorder(page)
+    yield recorder
+
+    recorder.stop()
+    try:
+        write_asset_report(request.node.nodeid, recorder)
+    except OSError:
+        pass
+
+
 @pytest.fixture(scope="function")
-def web_driver(page, environment):
+def web_driver(page, environment, browser_name, perf_profile, browser_metrics, asset_recorder):
     """
     Fixture principale (web) — wraps la page pytest-playwright.
     Navigateur : --browser chromium|firefox|webkit (headless par défaut, --headed pour GUI)
     Viewport   : --viewport desktop|mobile|tablet
+    Émulation  : --perf-profile none|auto|mobile-3g|tablet-wifi|...
     """
     base_url = os.getenv("BASE_URL", environment["base_url"])
     page.set_default_navigation_timeout(60000)
+    if perf_profile:
+        apply_emulation_profile(page, browser_name, perf_profile)
+        allure.dynamic.parameter("perf_profile", perf_profile["name"])
     page.goto(base_url, wait_until="domcontentloaded")
+    browser_metrics.sample("start")
     yield page
 
 
@@ -126,6 +332,112 @@ def test_data():
     return load_test_data()
 
 
+@pytest.fixture(scope="session")
+def test_db(request):
+    """
+    Base de données SQLite de l'environnement
+
+    Avec --seed-db : copie de la base modèle propre au worker xdist.
+    Avec --db-backend=memory : base en mémoire partagée (chargée depuis la
+    base modèle si --seed-db, sinon depuis le jeu --dataset).
+    """
+    db = get_db(
+        request.config.getoption("--env"), backend=request.config.getoption("--db-backend")
+    )
+    dataset = request.config.getoption("--dataset")
+    if dataset and db.is_memory and not request.config.getoption("--seed-db"):
+        load_dataset(db, dataset)
+    return db
+
+
+@pytest.fixture(scope="function")
+def fresh_db(request, test_db):
+    """
+    Base de données remise dans son état initial avant le test
+
+    Avec --seed-db : recopie de la base modèle (API backup SQLite).
+    Avec --delta-reset : restauration des seules lignes modifiées.
+    Avec --dataset : recopie du jeu de données en cache.
+    Sinon : drop/create puis seed des données de référence.
+
+    Base serveur (--db-backend=server) : refusé sans --allow-server-reset,
+    la base étant partagée ; db_session isole le test par rollback.
+    """
+    if test_db.is_server and not request.config.getoption("--allow-server-reset"):
+        pytest.fail(
+            f"fresh_db viderait la base serveur partagée ({test_db.location}) : utiliser "
+            "db_session (rollback en fin de test) ou --allow-server-reset",
+            pytrace=False,
+        )
+    dataset = request.config.getoption("--dataset")
+    if request.config.getoption("--seed-db"):
+        test_db.restore_template()
+    elif dataset and not _delta_reset_enabled(request.config):
+        load_dataset(test_db, dataset)
+    else:
+        TestDataManager(test_db.env, db=test_db).reset()
+    return test_db
+
+
+@pytest.fixture(scope="function")
+def db_session(test_db):
+    """
+    Session ORM isolée : tout ce que le test écrit est annulé au teardown
+
+    Transaction externe + SAVEPOINT (DatabaseManager.transactional_scope) :
+    les commit() du test et du code appelé via DatabaseManager.session()
+    ne libèrent qu'un savepoint.
+    """
+    with test_db.transactional_scope() as factory:
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+
+@pytest.fixture(scope="function")
+def data_repository(db_session):
+    """Recherches typées (DataRepository) sur la session isolée du test"""
+    return DataRepository(db_session)
+
+
+@pytest.fixture(autouse=True)
+def sql_instrumentation(request):
+    """
+    Bilan des requêtes SQL du test (option --sql-instrumentation)
+
+    Empreintes les plus coûteuses, SELECT répétés (N+1) et requêtes lentes,
+    attachés à Allure selon sql_instrumentation.attach de test_config.yaml.
+    """
+    recorder = request.config.stash.get(SQL_RECORDER_KEY, None)
+    if recorder is None:
+        yield None
+        return
+
+    recorder.start(request.node.nodeid)
+    try:
+        yield recorder
+    finally:
+        summary = recorder.stop()
+
+    issues = summary["n_plus_one"] or summary["slow_queries"]
+    if issues:
+        request.config.stash[SQL_FLAGGED_KEY].append(summary)
+    attach = request.config.stash[SQL_ATTACH_KEY]
+    if summary["statements"] and (attach == "always" or (attach == "issues" and issues)):
+        allure.attach(
+            format_summary(summary),
+            name="Bilan SQL",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        allure.attach(
+            json.dumps(summary, indent=2, ensure_ascii=False),
+            name="Bilan SQL (JSON)",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+
 @pytest.fixture
 def standard_user(test_data):
     """Fixture pour l'utilisateur standard"""
@@ -191,6 +503,24 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    recorder = item.config.stash.get(PERF_RECORDER_KEY, None)
+    if recorder is not None and rep.when == "call" and rep.passed:
+        recorder.add_test_duration(item.nodeid, _item_browser(item), rep.duration * 1000)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Rattache les steps Allure suivants au test courant (base de référence perf)"""
+    recorder = item.config.stash.get(PERF_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.start_test(item.nodeid, _item_browser(item))
+
+
+def _item_browser(item):
+    """Navigateur paramétré par pytest-playwright pour un test (None si non web)"""
+    callspec = getattr(item, "callspec", None)
+    return callspec.params.get("browser_name") if callspec else None
+
 
 def pytest_configure(config):
     """Configuration initiale de pytest"""
@@ -199,11 +529,27 @@ def pytest_configure(config):
     os.makedirs("reports/screenshots", exist_ok=True)
     os.makedirs("logs", exist_ok=True)
 
+    # Fichiers de métriques et d'assets : un jeu par run (nettoyé par le contrôleur xdist)
+    if not hasattr(config, "workerinput"):
+        for pattern in (
+            os.path.join(METRICS_DIR, "browser-metrics-*.jsonl"),
+            os.path.join(ASSETS_DIR, "asset-report-*.jsonl"),
+        ):
+            for path in glob.glob(pattern):
+                os.remove(path)
+
+    _configure_db_snapshots(config)
+    _configure_dataset(config)
+    _configure_delta_reset(config)
+    _configure_perf_baseline(config)
+    _configure_sql_instrumentation(config)
+
     # Traçabilité de la configuration au démarrage
     env_vars = [
         "ENV",
         "BROWSER",
         "VIEWPORT",
+        "PERF_PROFILE",
         "PARALLEL_PROCESSES",
         "RERUN_NB",
         "RERUN_DELAY",
@@ -228,13 +574,246 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "wcag: Tests conformité WCAG")
 
 
+def _configure_db_snapshots(config):
+    """
+    Seed unique de la base modèle et copies par worker (option --seed-db).
+    Avec --dataset, la base modèle est le jeu de données en cache.
+
+    Le contrôleur seede la base modèle puis active les copies via
+    TEST_DB_SNAPSHOTS (héritée au lancement des workers xdist). Chaque
+    processus clone le modèle au premier accès à sa base.
+    """
+    if not config.getoption("--seed-db") or hasattr(config, "workerinput"):
+        return
+    env = config.getoption("--env")
+    os.environ.pop(SNAPSHOTS_ENV, None)
+    DatabaseManager.remove_all_snapshots(env)
+    dataset = config.getoption("--dataset")
+    if dataset:
+        load_dataset(get_db(env), dataset)
+    else:
+        reset_database(env)
+    # Les instances ouvertes sur le modèle sont fermées : les suivantes utilisent les copies
+    DatabaseManager.close_all()
+    os.environ[SNAPSHOTS_ENV] = "1"
+
+
+def _finish_db_snapshots(session):
+    """Supprime la copie du worker, puis toutes les copies restantes (contrôleur)"""
+    config = session.config
+    if not config.getoption("--seed-db"):
+        return
+    env = config.getoption("--env")
+    if hasattr(config, "workerinput"):
+        get_db(env).remove_snapshot()
+    else:
+        DatabaseManager.remove_all_snapshots(env)
+
+
+def _configure_dataset(config):
+    """
+    Jeu de données reproductible (option --dataset), contrôleur uniquement.
+
+    Le jeu est généré s'il n'est pas en cache (les workers xdist n'ont plus
+    qu'à le copier), puis chargé dans la base fichier de l'environnement.
+    Avec --seed-db il devient la base modèle (_configure_db_snapshots) ; en
+    mémoire il est chargé par la fixture test_db de chaque processus.
+    """
+    dataset = config.getoption("--dataset")
+    if not dataset or hasattr(config, "workerinput"):
+        return
+    backend = config.getoption("--db-backend")
+    if backend == "server":
+        raise pytest.UsageError("--dataset s'applique aux bases SQLite (--db-backend=file ou memory)")
+    try:
+        build_dataset(dataset)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    if backend == "file" and not config.getoption("--seed-db"):
+        load_dataset(get_db(config.getoption("--env")), dataset)
+
+
+def _delta_reset_enabled(config):
+    """--delta-reset s'applique à la base fichier partagée (sans --seed-db)"""
+    return (
+        config.getoption("--delta-reset")
+        and not config.getoption("--seed-db")
+        and config.getoption("--db-backend") == "file"
+    )
+
+
+def _configure_delta_reset(config):
+    """
+    Active le suivi des modifications de la base (option --delta-reset).
+
+    Premier run : reset complet (ou jeu --dataset déjà chargé) puis état de
+    référence. Runs suivants : les lignes laissées par un run interrompu sont
+    restaurées (en général aucune, la restauration ayant eu lieu en fin de
+    session précédente).
+    """
+    if not _delta_reset_enabled(config) or hasattr(config, "workerinput"):
+        return
+    env = config.getoption("--env")
+    tracker = ChangeTracker(get_db(env))
+    if tracker.is_enabled:
+        tracker.restore()
+    else:
+        if not config.getoption("--dataset"):
+            reset_database(env)
+        tracker.enable()
+
+
+def _start_delta_reset(session):
+    """
+    Lance la restauration des lignes modifiées par la session (contrôleur)
+
+    Restauration différée : elle s'exécute pendant les autres tâches de fin
+    de session, pytest_sessionfinish attend sa fin avant de fermer les
+    connexions.
+
+    Returns:
+        Thread de restauration, ou None
+    """
+    config = session.config
+    if not _delta_reset_enabled(config) or hasattr(config, "workerinput"):
+        return None
+    return ChangeTracker(get_db(config.getoption("--env"))).restore_in_background()
+
+
+def _persist_memory_db(session):
+    """Copie la base en mémoire du processus sur disque (--db-persist)"""
+    config = session.config
+    directory = config.getoption("--db-persist")
+    if not directory or config.getoption("--db-backend") != "memory":
+        return
+    env = config.getoption("--env")
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    os.makedirs(directory, exist_ok=True)
+    get_db(env, backend="memory").persist(os.path.join(directory, f"test_data_{env}_{worker}.db"))
+
+
+def _configure_sql_instrumentation(config):
+    """Écoute les requêtes de tous les engines (--sql-instrumentation ou enabled: true)"""
+    settings = load_config("test_config.yaml").get("sql_instrumentation", {})
+    if not (config.getoption("--sql-instrumentation") or settings.get("enabled", False)):
+        return
+    recorder = SQLRecorder(
+        slow_query_ms=settings.get("slow_query_ms", 100),
+        n_plus_one_threshold=settings.get("n_plus_one_threshold", 5),
+        top=settings.get("top", 5),
+    )
+    recorder.install()
+    config.stash[SQL_RECORDER_KEY] = recorder
+    config.stash[SQL_FLAGGED_KEY] = []
+    config.stash[SQL_ATTACH_KEY] = settings.get("attach", "always")
+
+
+def _finish_sql_instrumentation(session):
+    """Retire les écouteurs SQL"""
+    recorder = session.config.stash.get(SQL_RECORDER_KEY, None)
+    if recorder is not None:
+        recorder.uninstall()
+
+
+def _configure_perf_baseline(config):
+    """
+    Active l'enregistrement des durées (tests + steps) dans la base de référence
+    (--perf-baseline, PERF_BASELINE ou enabled: true).
+
+    Le contrôleur xdist crée le run et partage son identifiant aux workers via
+    la variable d'environnement PERF_RUN_ID (héritée au lancement des workers).
+    """
+    settings = load_config("test_config.yaml").get("performance_baseline", {})
+    if not (config.getoption("--perf-baseline") or settings.get("enabled", False)):
+        return
+
+    if not hasattr(config, "workerinput"):
+        os.environ[RUN_ID_ENV] = new_run_id()
+        store = PerfBaselineStore(settings["database"])
+        store.start_run(os.environ[RUN_ID_ENV], current_branch(), current_commit())
+
+    recorder = PerfRecorder(
+        config.getoption("--viewport"), config.getoption("--perf-profile")
+    )
+    allure_commons.plugin_manager.register(recorder)
+    config.stash[PERF_RECORDER_KEY] = recorder
+
+
+def _finish_perf_baseline(session):
+    """Enregistre les durées du process puis compare le run (contrôleur uniquement)"""
+    config = session.config
+    recorder = config.stash.get(PERF_RECORDER_KEY, None)
+    if recorder is None:
+        return
+    allure_commons.plugin_manager.unregister(recorder)
+
+    run_id = os.environ.get(RUN_ID_ENV)
+    if not run_id:
+        return
+
+    settings = load_config("test_config.yaml").get("performance_baseline", {})
+    store = PerfBaselineStore(settings["database"])
+    store.add_samples(run_id, recorder.samples)
+
+    if hasattr(config, "workerinput"):
+        return
+
+    result = compare_run(store, run_id, current_branch(), settings)
+    write_result(result, settings["output"])
+    config.stash[PERF_RESULT_KEY] = result
+    if result["regressions"] and settings.get("fail_on_regression", False):
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Sections de synthèse : requêtes SQL signalées, régressions de performance"""
+    flagged = config.stash.get(SQL_FLAGGED_KEY, None)
+    if flagged:
+        terminalreporter.section("SQL - motifs N+1 et requêtes lentes")
+        for summary in flagged:
+            terminalreporter.write_line(
+                f"{summary['label']}: {len(summary['n_plus_one'])} motif(s) N+1, "
+                f"{len(summary['slow_queries'])} requête(s) lente(s)",
+                yellow=True,
+            )
+            for entry in summary["n_plus_one"]:
+                terminalreporter.write_line(f"    x{entry['count']} {entry['fingerprint']}")
+
+    result = config.stash.get(PERF_RESULT_KEY, None)
+    if result is None:
+        return
+
+    terminalreporter.section("Performance - comparaison avec la base de référence")
+    if result["status"] == "insufficient_baseline":
+        terminalreporter.write_line(
+            f"Base de référence insuffisante ({len(result['baseline_runs'])} run(s) "
+            f"sur la branche '{result['branch']}'), comparaison ignorée"
+        )
+        return
+    if not result["regressions"]:
+        terminalreporter.write_line(
+            f"Aucune régression significative ({len(result['baseline_runs'])} runs de référence)"
+        )
+        return
+    for reg in result["regressions"]:
+        label = reg["test"] if reg["kind"] == "test" else f"{reg['test']} > {reg['name']}"
+        terminalreporter.write_line(
+            f"[{reg['browser']}/{reg['viewport']}/{reg['profile']}] {label}: "
+            f"{reg['baseline_median_ms']} ms -> {reg['current_median_ms']} ms "
+            f"(+{reg['increase_pct']}%, {reg['method']})",
+            red=True,
+        )
+
+
 def pytest_collection_modifyitems(config, items):
     """Modifier la collection des tests"""
     env = config.getoption("--env")
+    perf_profile = config.getoption("--perf-profile")
 
     # Ajouter des informations sur l'environnement aux tests
     for item in items:
         item.user_properties.append(("environment", env))
+        item.user_properties.append(("perf_profile", perf_profile))
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -317,6 +896,16 @@ def pytest_bdd_after_scenario(request, feature, scenario):
 def pytest_sessionfinish(session, exitstatus):
     """
     Hook exécuté à la fin de la session de tests
-    Ferme toutes les connexions à la base de données
+    Restaure la base (--delta-reset, en parallèle des tâches suivantes),
+    enregistre les durées de performance, retire l'instrumentation SQL, ferme
+    les connexions à la base de données (après la restauration) et supprime
+    les copies de base par worker (--seed-db)
     """
+    restore = _start_delta_reset(session)
+    _finish_perf_baseline(session)
+    _persist_memory_db(session)
+    _finish_sql_instrumentation(session)
+    if restore is not None:
+        restore.join()
     DatabaseManager.close_all()
+    _finish_db_snapshots(session)
@@ -18,6 +18,16 @@ Exemples d'utilisation:
     user = UserFactory.build()
     account = AccountFactory.compte_courant()
 
+    # Génération en flux (mémoire constante)
+    from tests.data import TransactionFactory, chunks
+    for lot in chunks(TransactionFactory.iter_transactions(1_000_000, rows=True), 10_000):
+        ...
+
+    # Enregistrements légers (sans instrumentation ORM)
+    from tests.data import TransactionFactory, as_orm
+    transactions = TransactionFactory.batch(100_000, records=True)
+    session.add_all(as_orm(transactions[:10]))
+
     # Accès à la base de données
     from tests.data import get_db
     db = get_db('dev')
@@ -25,6 +35,27 @@ Exemples d'utilisation:
     with db.session() as session:
         session.add(user)
 
+    # Recherches typées
+    from tests.data import DataRepository
+    with db.session() as session:
+        user = DataRepository(session).pick_user(has_2fa=True)
+
+    # Export sans ORM (mémoire constante)
+    from tests.data import export_table, Transaction
+    export_table(db.engine, Transaction, 'exports/transactions.ndjson')
+
+    # Jeu reproductible (généré une fois, puis copié depuis le cache)
+    from tests.data import load_dataset
+    load_dataset(db, 'medium')
+
+    # Bilan SQL d'un bloc (requêtes lentes, N+1)
+    from tests.data import SQLRecorder, format_summary
+    recorder = SQLRecorder(slow_query_ms=50)
+    recorder.install()
+    recorder.start('seed')
+    ...
+    print(format_summary(recorder.stop()))
+
     # Gestionnaire centralisé
     from tests.data import TestDataManager
     manager = TestDataManager('dev')
@@ -46,8 +77,35 @@ from tests.data.factories import (
     BillFactory,
     generate_valid_password,
     generate_french_iban,
+    unique_account_iban,
+    chunks,
 )
 
+# Enregistrements légers (records=True des factories)
+from tests.data.records import (
+    UserRecord,
+    AccountRecord,
+    TransactionRecord,
+    BeneficiaryRecord,
+    BillRecord,
+    as_orm,
+)
+
+# IBAN valides (clé mod 97)
+from tests.data.iban import is_valid_iban, validate_ibans
+
+# Recherches typées (index + selectinload)
+from tests.data.repository import DataRepository
+
+# Export en masse sans ORM (dictionnaires, NDJSON, CSV)
+from tests.data.export import iter_dicts, export_table, export_dataset
+
+# Jeux de données reproductibles (profils, cache disque)
+from tests.data.datasets import build_dataset, load_dataset
+
+# Instrumentation SQL (empreintes, requêtes lentes, N+1)
+from tests.data.instrumentation import SQLRecorder, fingerprint, format_summary
+
 # Modèles ORM
 from tests.data.models import (
     Base,
@@ -75,6 +133,7 @@ __all__ = [
     # Database
     'get_db',
     'DatabaseManager',
+    'DataRepository',
     # Factories
     'UserFactory',
     'AccountFactory',
@@ -83,6 +142,29 @@ __all__ = [
     'BillFactory',
     'generate_valid_password',
     'generate_french_iban',
+    'unique_account_iban',
+    'chunks',
+    # Records
+    'UserRecord',
+    'AccountRecord',
+    'TransactionRecord',
+    'BeneficiaryRecord',
+    'BillRecord',
+    'as_orm',
+    # IBAN
+    'is_valid_iban',
+    'validate_ibans',
+    # Export
+    'iter_dicts',
+    'export_table',
+    'export_dataset',
+    # Datasets
+    'build_dataset',
+    'load_dataset',
+    # Instrumentation
+    'SQLRecorder',
+    'fingerprint',
+    'format_summary',
     # Models
     'Base',
     'User',
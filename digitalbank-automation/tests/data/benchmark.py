@@ -0,0 +1,260 @@
+"""
+Mesure du débit de génération et d'insertion des données de test
+
+Pour chaque méthode (orm, bulk, columnar), chaque taille et chaque entité :
+lignes/s, pic mémoire Python (tracemalloc) et taille du fichier SQLite.
+
+- orm : factories + Session.add_all (chemin de seed_random_data)
+- bulk : factories en dictionnaires + insert() Core (seed_random_data_bulk)
+- columnar : colonnes NumPy + insert() Core (seed_random_data_bulk --columnar)
+
+Chaque mesure est faite deux fois sur une base neuve : une passe chronométrée
+sans tracemalloc (qui ralentit fortement le code Python), puis une passe
+mémoire. Le résultat JSON sert au suivi de tendance (un fichier par run).
+
+Exemple:
+    python -m tests.data.seed_data bench --sizes=1000,10000 -v
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import insert
+
+from tests.data import columnar
+from tests.data.database import DatabaseManager, get_db
+from tests.data.factories import (
+    UserFactory, AccountFactory, TransactionFactory,
+    BeneficiaryFactory, BillFactory, chunks
+)
+from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+
+
+METHODS = ('orm', 'bulk', 'columnar')
+ENTITIES = ('users', 'accounts', 'transactions', 'beneficiaries', 'bills')
+DEFAULT_SIZES = (1_000, 10_000)
+BENCH_BATCH_SIZE = 10_000
+BENCH_DIR = os.path.join('reports', 'benchmarks')
+
+# Profil SQLite de chaque méthode (celui de la commande correspondante)
+_PROFILES = {'orm': None, 'bulk': 'seeding', 'columnar': 'seeding'}
+
+
+def _fk(size: int):
+    """Clé étrangère i -> identifiant 1..size (parents insérés avant)"""
+    return lambda i: 1 + i % size
+
+
+# ═══════════════════════════════════════════════════════════════
+# INSERTION PAR MÉTHODE
+# ═══════════════════════════════════════════════════════════════
+
+def _orm_builders(size: int) -> Dict[str, Callable[[int], object]]:
+    fk = _fk(size)
+    return {
+        'users': lambda i: UserFactory.build(),
+        'accounts': lambda i: AccountFactory.build(user_id=fk(i)),
+        'transactions': lambda i: TransactionFactory.build(account_id=fk(i)),
+        'beneficiaries': lambda i: BeneficiaryFactory.build(user_id=fk(i)),
+        'bills': lambda i: BillFactory.build(),
+    }
+
+
+def _row_builders(size: int) -> Dict[str, Callable[[int], dict]]:
+    fk = _fk(size)
+    return {
+        'users': lambda i: UserFactory.build_row(),
+        'accounts': lambda i: AccountFactory.build_row(user_id=fk(i)),
+        'transactions': lambda i: TransactionFactory.build_row(account_id=fk(i)),
+        'beneficiaries': lambda i: BeneficiaryFactory.build_row(user_id=fk(i)),
+        'bills': lambda i: BillFactory.build_row(),
+    }
+
+
+def _column_builders(size: int, rng) -> Dict[str, Callable[[object], dict]]:
+    def parents(ids):
+        return 1 + (ids - 1) % size
+    return {
+        'users': lambda ids: columnar.user_columns(ids, rng),
+        'accounts': lambda ids: columnar.account_columns(ids, parents(ids), rng),
+        'transactions': lambda ids: columnar.transaction_columns(ids, parents(ids), rng),
+        'beneficiaries': lambda ids: columnar.beneficiary_columns(ids, parents(ids), rng),
+        'bills': lambda ids: columnar.bill_columns(ids, rng),
+    }
+
+
+_MODELS = {
+    'users': User, 'accounts': Account, 'transactions': Transaction,
+    'beneficiaries': Beneficiary, 'bills': Bill,
+}
+
+
+def _insert_orm(db: DatabaseManager, entity: str, size: int, batch_size: int) -> None:
+    build = _orm_builders(size)[entity]
+    for batch in chunks(range(size), batch_size):
+        with db.session() as session:
+            session.add_all([build(i) for i in batch])
+
+
+def _insert_bulk(db: DatabaseManager, entity: str, size: int, batch_size: int) -> None:
+    build = _row_builders(size)[entity]
+    statement = insert(_MODELS[entity].__table__)
+    for batch in chunks(range(size), batch_size):
+        with db.engine.begin() as conn:
+            conn.execute(statement, [{'id': i + 1, **build(i)} for i in batch])
+
+
+def _insert_columnar(db: DatabaseManager, entity: str, size: int, batch_size: int) -> None:
+    build = _column_builders(size, columnar.default_rng())[entity]
+    statement = insert(_MODELS[entity].__table__)
+    for offset in range(0, size, batch_size):
+        ids = columnar.id_range(offset + 1, min(batch_size, size - offset))
+        for rows in columnar.iter_column_rows(build(ids), batch_size):
+            with db.engine.begin() as conn:
+                conn.execute(statement, rows)
+
+
+_INSERTERS = {'orm': _insert_orm, 'bulk': _insert_bulk, 'columnar': _insert_columnar}
+
+
+# ═══════════════════════════════════════════════════════════════
+# MESURES
+# ═══════════════════════════════════════════════════════════════
+
+def _git(*args) -> Optional[str]:
+    """Sortie d'une commande git, None hors dépôt (tests.utils dépend de Playwright)"""
+    try:
+        result = subprocess.run(['git', *args], capture_output=True, text=True, timeout=5, check=True)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _database_size(path: str) -> int:
+    """Taille du fichier SQLite, journal WAL compris"""
+    return sum(os.path.getsize(path + suffix) for suffix in ('', '-wal') if os.path.exists(path + suffix))
+
+
+def _remove_database(path: str) -> None:
+    for suffix in ('', '-journal', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _fresh_database(method: str) -> DatabaseManager:
+    """Base vide dédiée à la méthode (test_data_bench_{méthode}.db)"""
+    db = get_db(f'bench_{method}', profile=_PROFILES[method])
+    _remove_database(db.db_path)
+    db.create_tables()
+    return db
+
+
+def _run(method: str, size: int, batch_size: int, entities: Sequence[str], memory: bool) -> List[dict]:
+    """Une passe (chronométrée ou mémoire) sur une base neuve"""
+    db = _fresh_database(method)
+    insert_entity = _INSERTERS[method]
+    measures = []
+    try:
+        for entity in entities:
+            if memory:
+                tracemalloc.start()
+                baseline = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            insert_entity(db, entity, size, batch_size)
+            elapsed = time.perf_counter() - started
+            measure = {'entity': entity, 'seconds': elapsed}
+            if memory:
+                measure['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1] - baseline
+                tracemalloc.stop()
+            else:
+                measure['db_size_bytes'] = _database_size(db.db_path)
+            measures.append(measure)
+    finally:
+        DatabaseManager.close_all()
+        _remove_database(db.db_path)
+    return measures
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    methods: Sequence[str] = METHODS,
+    entities: Sequence[str] = ENTITIES,
+    batch_size: int = BENCH_BATCH_SIZE,
+    verbose: bool = False
+) -> dict:
+    """
+    Mesure chaque méthode pour chaque taille et chaque entité
+
+    Args:
+        sizes: Nombres de lignes par entité
+        methods: Méthodes mesurées (orm, bulk, columnar)
+        entities: Entités mesurées, dans l'ordre d'insertion
+        batch_size: Nombre de lignes par lot / transaction
+        verbose: Afficher chaque mesure
+
+    Returns:
+        Résultat sérialisable (contexte du run et mesures)
+    """
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        raise ValueError(f"Méthode inconnue: {', '.join(sorted(unknown))} ({', '.join(METHODS)})")
+
+    # Pools Faker de la méthode columnar générés une fois par processus : hors mesure
+    if 'columnar' in methods:
+        columnar.faker_pools()
+
+    results = []
+    for size in sizes:
+        for method in methods:
+            timed = _run(method, size, batch_size, entities, memory=False)
+            traced = _run(method, size, batch_size, entities, memory=True)
+            for timing, memory in zip(timed, traced):
+                result = {
+                    'method': method,
+                    'entity': timing['entity'],
+                    'rows': size,
+                    'seconds': round(timing['seconds'], 4),
+                    'rows_per_sec': round(size / timing['seconds']) if timing['seconds'] else None,
+                    'peak_memory_bytes': memory['peak_memory_bytes'],
+                    'db_size_bytes': timing['db_size_bytes'],
+                }
+                results.append(result)
+                if verbose:
+                    print(f"  {method:<9} {result['entity']:<14} {size:>9} lignes "
+                          f"{result['rows_per_sec'] or 0:>10} lignes/s "
+                          f"{result['peak_memory_bytes'] / 1e6:>8.1f} Mo "
+                          f"{result['db_size_bytes'] / 1e6:>8.1f} Mo (base)")
+
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'branch': os.getenv('GITHUB_HEAD_REF') or os.getenv('GITHUB_REF_NAME') or _git('rev-parse', '--abbrev-ref', 'HEAD'),
+        'commit': os.getenv('GITHUB_SHA') or _git('rev-parse', 'HEAD'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'batch_size': batch_size,
+        'sizes': list(sizes),
+        'results': results,
+    }
+
+
+def write_benchmark(result: dict, path: Optional[str] = None) -> str:
+    """
+    Écrit le résultat JSON (défaut: reports/benchmarks/seed-bench-{horodatage}.json)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    path = path or os.path.join(BENCH_DIR, f"seed-bench-{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+    return path
@@ -0,0 +1,85 @@
+"""
+Chargement en masse adapté au backend
+
+- PostgreSQL (psycopg2) : COPY ... FROM STDIN au format CSV, un aller-retour
+  par lot au lieu d'un INSERT par ligne (seeding des environnements partagés
+  à travers le réseau)
+- autres bases (SQLite, autres drivers) : insert() Core en executemany
+
+Les identifiants étant fournis explicitement, reset_sequences() recale les
+séquences PostgreSQL après chargement (les insertions ORM suivantes ne
+réutilisent pas un identifiant existant).
+
+Exemple:
+    with engine.begin() as conn:
+        load_rows(conn, User.__table__, rows)
+    reset_sequences(engine, [User.__table__])
+"""
+
+import csv
+import io
+from typing import List, Sequence
+
+from sqlalchemy import Table, insert, text
+
+# Marqueur NULL du COPY (distingue NULL de la chaîne vide)
+_COPY_NULL = r'\N'
+
+
+def supports_copy(conn) -> bool:
+    """True si la connexion peut charger par COPY (PostgreSQL via psycopg2)"""
+    return conn.dialect.name == 'postgresql' and conn.dialect.driver == 'psycopg2'
+
+
+def load_rows(conn, table: Table, rows: List[dict]) -> int:
+    """
+    Insère un lot de lignes dans la transaction de conn
+
+    Args:
+        conn: Connexion SQLAlchemy (transaction ouverte)
+        table: Table cible (Model.__table__)
+        rows: Dictionnaires {colonne: valeur}, mêmes clés pour toutes les lignes
+
+    Returns:
+        Nombre de lignes insérées
+    """
+    if not rows:
+        return 0
+    if supports_copy(conn):
+        _copy_rows(conn, table, rows)
+    else:
+        conn.execute(insert(table), rows)
+    return len(rows)
+
+
+def _copy_rows(conn, table: Table, rows: List[dict]) -> None:
+    columns = list(rows[0])
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for row in rows:
+        writer.writerow([_COPY_NULL if row[column] is None else row[column] for column in columns])
+    buffer.seek(0)
+    quoted = ', '.join(conn.dialect.identifier_preparer.quote(column) for column in columns)
+    statement = (
+        f"COPY {conn.dialect.identifier_preparer.format_table(table)} ({quoted}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+    )
+    # Curseur psycopg2 de la connexion : même transaction que conn
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def reset_sequences(engine, tables: Sequence[Table]) -> None:
+    """Recale les séquences des clés 'id' sur max(id) (PostgreSQL uniquement)"""
+    if engine.dialect.name != 'postgresql':
+        return
+    with engine.begin() as conn:
+        for table in tables:
+            name = table.name
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+                f"COALESCE(MAX(id), 0) + 1, false) FROM {name}"
+            ))
@@ -0,0 +1,191 @@
+"""
+Suivi des modifications par triggers SQLite (reset différentiel)
+
+Au lieu de drop_all/create_all + seed, seules les lignes touchées depuis
+l'état de référence sont restaurées :
+
+- enable() copie l'état courant des tables suivies dans des tables
+  _baseline_{table} et pose des triggers AFTER INSERT/UPDATE/DELETE qui
+  enregistrent (table, id) dans _changes
+- restore() supprime les lignes modifiées puis réinsère leur version de
+  référence, et vide _changes ; en arrière-plan avec restore_in_background()
+
+Les triggers et les tables de suivi sont stockés dans la base : le suivi
+survit aux processus (les lignes touchées par un run sont restaurées au
+suivant) et aux copies de la base (snapshots par worker). Bases SQLite
+uniquement : sur une base serveur le suivi est toujours inactif.
+
+Exemple:
+    tracker = ChangeTracker(get_db('dev'))
+    tracker.enable()
+    ...  # tests
+    tracker.restore()
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+
+from tests.data.database import DatabaseManager
+from tests.data.models import Base
+
+
+# Tables suivies (données de test, hors seed_state)
+TRACKED_TABLES = ('users', 'accounts', 'transactions', 'beneficiaries', 'bills')
+
+CHANGES_TABLE = '_changes'
+_BASELINE_PREFIX = '_baseline_'
+_TRIGGER_PREFIX = '_track_'
+_OPERATIONS = ('insert', 'update', 'delete')
+
+
+class ChangeTracker:
+    """Suivi des lignes modifiées et restauration différentielle d'une base SQLite"""
+
+    def __init__(self, db: DatabaseManager, tables: Sequence[str] = TRACKED_TABLES):
+        """
+        Args:
+            db: Base à suivre
+            tables: Tables suivies (clé primaire 'id')
+        """
+        self.db = db
+        self.tables = tuple(tables)
+
+    @property
+    def is_supported(self) -> bool:
+        """True si la base est SQLite (triggers et sqlite_master)"""
+        return self.db.engine.dialect.name == 'sqlite'
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        True si le suivi est actif dans la base
+
+        Journal, copies de référence et triggers doivent tous être présents :
+        un drop_all supprime les triggers avec les tables mais laisse les
+        tables de suivi, le suivi est alors considéré comme inactif.
+        """
+        if not self.is_supported:
+            return False
+        expected = self._objects()
+        names = ', '.join(f"'{name}'" for name in expected)
+        with self.db.engine.connect() as conn:
+            found = conn.execute(text(
+                f"SELECT COUNT(*) FROM sqlite_master WHERE type IN ('table', 'trigger') AND name IN ({names})"
+            )).scalar()
+        return found == len(expected)
+
+    def enable(self) -> None:
+        """
+        Active le suivi : l'état courant devient l'état de référence
+
+        Idempotent ; sur une base déjà suivie, équivaut à rebaseline().
+
+        Raises:
+            ValueError: Base non SQLite
+        """
+        if not self.is_supported:
+            raise ValueError(f"Suivi des modifications réservé aux bases SQLite ({self.db.location})")
+        with self.db.engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} "
+                "(tbl TEXT NOT NULL, row_id INTEGER NOT NULL, PRIMARY KEY (tbl, row_id)) WITHOUT ROWID"
+            ))
+            for table in self.tables:
+                self._create_triggers(conn, table)
+            self._snapshot(conn)
+
+    def rebaseline(self) -> None:
+        """L'état courant devient l'état de référence (après un seed volontaire)"""
+        with self.db.engine.begin() as conn:
+            self._snapshot(conn)
+
+    def disable(self) -> None:
+        """Supprime triggers, copies de référence et journal des modifications"""
+        if not self.is_supported:
+            return
+        with self.db.engine.begin() as conn:
+            for table in self.tables:
+                for operation in _OPERATIONS:
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {_TRIGGER_PREFIX}{table}_{operation}"))
+                conn.execute(text(f"DROP TABLE IF EXISTS {_BASELINE_PREFIX}{table}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {CHANGES_TABLE}"))
+
+    def changes(self) -> Dict[str, int]:
+        """Nombre de lignes modifiées par table depuis l'état de référence"""
+        with self.db.engine.connect() as conn:
+            rows = conn.execute(text(f"SELECT tbl, COUNT(*) FROM {CHANGES_TABLE} GROUP BY tbl"))
+            return {table: count for table, count in rows}
+
+    def restore(self) -> int:
+        """
+        Restaure les lignes modifiées dans leur état de référence
+
+        Lignes insérées supprimées, lignes modifiées ou supprimées réinsérées
+        depuis _baseline_{table}, le tout dans une seule transaction.
+
+        Returns:
+            Nombre de lignes restaurées
+        """
+        with self.db.engine.begin() as conn:
+            restored = conn.execute(text(f"SELECT COUNT(*) FROM {CHANGES_TABLE}")).scalar()
+            if not restored:
+                return 0
+            for table in self.tables:
+                touched = f"SELECT row_id FROM {CHANGES_TABLE} WHERE tbl = '{table}'"
+                # Colonnes nommées : indépendant de l'ordre des colonnes des deux tables
+                columns = ', '.join(column.name for column in Base.metadata.tables[table].columns)
+                conn.execute(text(f"DELETE FROM {table} WHERE id IN ({touched})"))
+                conn.execute(text(
+                    f"INSERT INTO {table} ({columns}) SELECT {columns} "
+                    f"FROM {_BASELINE_PREFIX}{table} WHERE id IN ({touched})"
+                ))
+            # Les triggers ont journalisé la restauration elle-même
+            conn.execute(text(f"DELETE FROM {CHANGES_TABLE}"))
+            return restored
+
+    def restore_in_background(self, name: Optional[str] = None) -> threading.Thread:
+        """
+        Lance restore() dans un thread (non daemon : terminé avant la fin du processus)
+
+        Returns:
+            Thread démarré (join() pour attendre la fin de la restauration)
+        """
+        thread = threading.Thread(target=self.restore, name=name or f'delta-reset-{self.db.env}')
+        thread.start()
+        return thread
+
+    def _objects(self) -> List[str]:
+        """Noms des objets de suivi : journal, copies de référence, triggers"""
+        names = [CHANGES_TABLE]
+        for table in self.tables:
+            names.append(f"{_BASELINE_PREFIX}{table}")
+            names.extend(f"{_TRIGGER_PREFIX}{table}_{operation}" for operation in _OPERATIONS)
+        return names
+
+    def _create_triggers(self, conn, table: str) -> None:
+        # NOT EXISTS plutôt que INSERT OR IGNORE : la clause ON CONFLICT d'un
+        # upsert englobant remplacerait le OR IGNORE du trigger
+        log = (
+            f"INSERT INTO {CHANGES_TABLE} SELECT '{table}', {{0}}.id WHERE NOT EXISTS "
+            f"(SELECT 1 FROM {CHANGES_TABLE} WHERE tbl = '{table}' AND row_id = {{0}}.id);"
+        )
+        bodies = {
+            'insert': log.format('NEW'),
+            'update': log.format('OLD') + ' ' + log.format('NEW'),
+            'delete': log.format('OLD'),
+        }
+        for operation, body in bodies.items():
+            conn.execute(text(
+                f"CREATE TRIGGER IF NOT EXISTS {_TRIGGER_PREFIX}{table}_{operation} "
+                f"AFTER {operation.upper()} ON {table} BEGIN {body} END"
+            ))
+
+    def _snapshot(self, conn) -> None:
+        for table in self.tables:
+            baseline = f"{_BASELINE_PREFIX}{table}"
+            conn.execute(text(f"DROP TABLE IF EXISTS {baseline}"))
+            conn.execute(text(f"CREATE TABLE {baseline} AS SELECT * FROM {table}"))
+            conn.execute(text(f"CREATE UNIQUE INDEX {baseline}_id ON {baseline} (id)"))
+        conn.execute(text(f"DELETE FROM {CHANGES_TABLE}"))
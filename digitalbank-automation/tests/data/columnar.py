@@ -0,0 +1,288 @@
+"""
+Génération columnaire vectorisée (NumPy) des données de test DigitalBank
+
+Alternative aux factories objet pour les gros volumes : chaque fonction
+produit un lot complet sous forme de colonnes (tableaux NumPy) en quelques
+appels vectorisés, au lieu d'un appel Faker / random par ligne.
+
+Les valeurs textuelles coûteuses (noms, emails, mots de passe) sont tirées
+dans des pools pré-générés avec Faker, une seule fois par processus.
+
+Les colonnes sont converties en lignes (dictionnaires) par lot via
+iter_column_rows() pour l'insertion en masse (SQLAlchemy Core).
+
+Exemple:
+    rng = np.random.default_rng(42)
+    columns = transaction_columns(np.arange(1, 1001), rng)
+    for lot in iter_column_rows(columns, 10_000):
+        conn.execute(insert(Transaction.__table__), lot)
+"""
+
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from tests.data.factories import (
+    fake,
+    generate_valid_password,
+    AccountFactory,
+    TransactionFactory,
+    BillFactory,
+)
+from tests.data.iban import french_ibans, generate_french_ibans
+from tests.data.unique import unique
+
+
+# Taille par défaut des pools de valeurs Faker
+POOL_SIZE = 5_000
+
+Columns = Dict[str, np.ndarray]
+
+
+@lru_cache(maxsize=None)
+def faker_pools(size: int = POOL_SIZE) -> Dict[str, np.ndarray]:
+    """
+    Pools de valeurs Faker pré-générées (mis en cache par taille)
+
+    Args:
+        size: Nombre de valeurs par pool
+
+    Returns:
+        Dictionnaire {pool: tableau} (names, email_locals, email_domains, passwords)
+    """
+    return {
+        'names': np.array([fake.name() for _ in range(size)]),
+        'email_locals': np.array([fake.user_name() for _ in range(size)]),
+        'email_domains': np.array([fake.free_email_domain() for _ in range(size)]),
+        'passwords': np.array([generate_valid_password() for _ in range(size)]),
+    }
+
+
+def _sample(rng: np.random.Generator, values, count: int) -> np.ndarray:
+    """Tire count valeurs (avec remise) dans un tableau"""
+    values = np.asarray(values)
+    return values[rng.integers(0, len(values), size=count)]
+
+
+def _concat(*parts) -> np.ndarray:
+    """Concaténation élément par élément de tableaux / chaînes"""
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.char.add(result, part)
+    return result
+
+
+# Chiffres hexadécimaux (codes ASCII) pour les références
+_HEX_DIGITS = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+def _template(template: str, count: int) -> np.ndarray:
+    """Matrice (count, len(template)) des codes ASCII d'un gabarit répété"""
+    return np.tile(np.frombuffer(template.encode('ascii'), dtype=np.uint8), (count, 1))
+
+
+def _ascii_strings(matrix: np.ndarray) -> np.ndarray:
+    """Convertit une matrice (n, largeur) de codes ASCII en tableau de chaînes"""
+    width = matrix.shape[1]
+    return np.ascontiguousarray(matrix, dtype=np.uint8).view(f'S{width}').ravel().astype(f'U{width}')
+
+
+def _unique_suffixes(key: str, count: int) -> np.ndarray:
+    """Suffixes uniques d'un lot, réservés d'un bloc auprès de tests.data.unique"""
+    start = unique.reserve(key, count)
+    return _concat(f"{unique.namespace}-", np.arange(start, start + count).astype(str))
+
+
+def _random_datetimes(rng: np.random.Generator, count: int, start: datetime, end: datetime) -> np.ndarray:
+    """Dates uniformément réparties entre start et end (datetime64[us])"""
+    start_us = np.datetime64(start, 'us')
+    span_us = int((end - start).total_seconds() * 1_000_000)
+    return start_us + rng.integers(0, max(span_us, 1), size=count).astype('timedelta64[us]')
+
+
+def french_iban_column(rng: np.random.Generator, count: int) -> np.ndarray:
+    """IBAN français valides (clé RIB et clé mod 97), voir tests.data.iban"""
+    return generate_french_ibans(count, rng)
+
+
+def account_iban_column(count: int) -> np.ndarray:
+    """IBAN uniques des comptes, même schéma que factories.unique_account_iban (bloc réservé)"""
+    code = unique.numeric_code(10)
+    start = unique.reserve('account_number', count)
+    return french_ibans(code[:5], code[5:], np.arange(start, start + count, dtype=np.int64))
+
+
+def reference_column(rng: np.random.Generator, prefix: str, count: int, width: int = 8) -> np.ndarray:
+    """Références aléatoires prefix + `width` chiffres hexadécimaux majuscules"""
+    matrix = _template(prefix + '0' * width, count)
+    matrix[:, len(prefix):] = _HEX_DIGITS[rng.integers(0, 16, size=(count, width))]
+    return _ascii_strings(matrix)
+
+
+# ═══════════════════════════════════════════════════════════════
+# COLONNES PAR ENTITÉ
+# ═══════════════════════════════════════════════════════════════
+
+def user_columns(ids: np.ndarray, rng: np.random.Generator, pool_size: int = POOL_SIZE) -> Columns:
+    """
+    Colonnes d'un lot d'utilisateurs (sans 2FA)
+
+    Args:
+        ids: Identifiants pré-calculés des utilisateurs
+        rng: Générateur NumPy
+        pool_size: Taille des pools Faker
+
+    Returns:
+        Dictionnaire {colonne: tableau}
+    """
+    pools = faker_pools(pool_size)
+    count = len(ids)
+    emails = _concat(
+        _sample(rng, pools['email_locals'], count), '.', _unique_suffixes('email', count),
+        '@', _sample(rng, pools['email_domains'], count),
+    )
+    return {
+        'id': ids,
+        'email': emails,
+        'password': _sample(rng, pools['passwords'], count),
+        'name': _sample(rng, pools['names'], count),
+        'has_2fa': np.zeros(count, dtype=bool),
+        'totp_code': np.full(count, None, dtype=object),
+    }
+
+
+def account_columns(ids: np.ndarray, user_ids: np.ndarray, rng: np.random.Generator) -> Columns:
+    """
+    Colonnes d'un lot de comptes
+
+    Args:
+        ids: Identifiants pré-calculés des comptes
+        user_ids: Utilisateur propriétaire de chaque compte (même longueur que ids)
+        rng: Générateur NumPy
+    """
+    count = len(ids)
+    return {
+        'id': ids,
+        'user_id': user_ids,
+        'type': _sample(rng, AccountFactory.ACCOUNT_TYPES, count),
+        'number': account_iban_column(count),
+        'balance': np.round(rng.uniform(100, 10000, size=count), 2),
+    }
+
+
+def transaction_columns(ids: np.ndarray, account_ids: np.ndarray, rng: np.random.Generator) -> Columns:
+    """
+    Colonnes d'un lot de transactions (30 derniers jours)
+
+    Args:
+        ids: Identifiants pré-calculés des transactions
+        account_ids: Compte de chaque transaction (même longueur que ids)
+        rng: Générateur NumPy
+    """
+    count = len(ids)
+    is_credit = rng.random(count) < 0.5
+    credit = np.array(TransactionFactory.DESCRIPTIONS_CREDIT)
+    debit = np.array(TransactionFactory.DESCRIPTIONS_DEBIT)
+    now = datetime.now()
+    return {
+        'id': ids,
+        'account_id': account_ids,
+        'type': np.where(is_credit, 'credit', 'debit'),
+        'amount': np.round(rng.uniform(10, 500, size=count), 2),
+        'description': np.where(
+            is_credit,
+            credit[rng.integers(0, len(credit), size=count)],
+            debit[rng.integers(0, len(debit), size=count)],
+        ),
+        'date': _random_datetimes(rng, count, now - timedelta(days=30), now),
+        'reference': reference_column(rng, 'TRX-', count),
+    }
+
+
+def beneficiary_columns(ids: np.ndarray, user_ids: np.ndarray, rng: np.random.Generator,
+                        pool_size: int = POOL_SIZE) -> Columns:
+    """
+    Colonnes d'un lot de bénéficiaires
+
+    Args:
+        ids: Identifiants pré-calculés des bénéficiaires
+        user_ids: Utilisateur propriétaire de chaque bénéficiaire
+        rng: Générateur NumPy
+        pool_size: Taille des pools Faker
+    """
+    count = len(ids)
+    return {
+        'id': ids,
+        'user_id': user_ids,
+        'name': _sample(rng, faker_pools(pool_size)['names'], count),
+        'iban': french_iban_column(rng, count),
+    }
+
+
+def bill_columns(ids: np.ndarray, rng: np.random.Generator) -> Columns:
+    """
+    Colonnes d'un lot de factures
+
+    Args:
+        ids: Identifiants pré-calculés des factures
+        rng: Générateur NumPy
+    """
+    count = len(ids)
+    providers = np.array([name for name, _ in BillFactory.PROVIDERS])
+    prefixes = np.array([prefix for _, prefix in BillFactory.PROVIDERS])
+    choice = rng.integers(0, len(providers), size=count)
+    now = np.datetime64(datetime.now(), 'us')
+    return {
+        'id': ids,
+        'provider': providers[choice],
+        'reference': _concat(
+            prefixes[choice], f"{datetime.now().year}-", np.char.upper(_unique_suffixes('bill_reference', count))
+        ),
+        'amount': np.round(rng.uniform(20, 200, size=count), 2),
+        'due_date': now + rng.integers(7, 31, size=count).astype('timedelta64[D]'),
+        'paid': np.zeros(count, dtype=bool),
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# CONVERSION
+# ═══════════════════════════════════════════════════════════════
+
+def iter_column_rows(columns: Columns, batch_size: int) -> Iterator[List[dict]]:
+    """
+    Convertit des colonnes en lots de lignes (dictionnaires)
+
+    La conversion en types Python (tolist) est faite par tranche pour limiter
+    la mémoire. Les dates datetime64 deviennent des datetime.
+
+    Args:
+        columns: Dictionnaire {colonne: tableau}
+        batch_size: Nombre de lignes par lot
+
+    Returns:
+        Itérateur de listes de dictionnaires prêtes pour insert() executemany
+    """
+    keys = list(columns)
+    total = len(columns[keys[0]]) if keys else 0
+    for start in range(0, total, batch_size):
+        stop = start + batch_size
+        values = [_to_python(columns[key][start:stop]) for key in keys]
+        yield [dict(zip(keys, row)) for row in zip(*values)]
+
+
+def _to_python(array: np.ndarray) -> list:
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype('datetime64[us]').tolist()
+    return array.tolist()
+
+
+def id_range(start: int, count: int) -> np.ndarray:
+    """Identifiants consécutifs [start, start + count)"""
+    return np.arange(start, start + count, dtype=np.int64)
+
+
+def default_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """Générateur NumPy (reproductible si seed est fourni)"""
+    return np.random.default_rng(seed)
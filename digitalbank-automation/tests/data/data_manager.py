@@ -5,18 +5,38 @@ Unifie l'accès aux données statiques (JSON) et dynamiques (factories/DB)
 
 import os
 import json
-from typing import Optional, Any
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional, Any
 
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+
+from tests.data.change_tracking import ChangeTracker
 from tests.data.database import DatabaseManager, get_db
 from tests.data.factories import (
     UserFactory, AccountFactory, TransactionFactory,
     BeneficiaryFactory, BillFactory
 )
+from tests.data.models import SCHEMA_VERSION, SeedState, User, Account, Beneficiary, Bill
 
 
 # Cache pour les données JSON
 _json_data_cache: Optional[dict] = None
 
+_DATA_PATH = os.path.join(os.path.dirname(__file__), 'test_users.json')
+
+# Ligne de seed_state des données de référence
+REFERENCE_STATE = 'reference'
+
+# Tables de référence (ordre d'insertion) et clé naturelle des upserts
+_REFERENCE_TABLES = {
+    'users': (User, ('email',)),
+    'accounts': (Account, ('number',)),
+    'beneficiaries': (Beneficiary, ('user_id', 'iban')),
+    'bills': (Bill, ('reference',)),
+}
+
 
 def load_test_data() -> dict:
     """
@@ -38,8 +58,7 @@ def load_test_data() -> dict:
     if _json_data_cache is not None:
         return _json_data_cache
 
-    data_path = os.path.join(os.path.dirname(__file__), 'test_users.json')
-    with open(data_path, 'r', encoding='utf-8') as f:
+    with open(_DATA_PATH, 'r', encoding='utf-8') as f:
         _json_data_cache = json.load(f)
 
     return _json_data_cache
@@ -51,6 +70,101 @@ def clear_cache() -> None:
     _json_data_cache = None
 
 
+def reference_data_hash() -> str:
+    """Empreinte SHA-256 de test_users.json (contenu brut)"""
+    with open(_DATA_PATH, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _reference_rows(data: dict) -> Dict[str, Dict[str, dict]]:
+    """
+    Lignes de référence par table, indexées par clé naturelle
+
+    Comptes et bénéficiaires appartiennent à l'utilisateur standard, désigné
+    par son email ('owner') : l'id est résolu au moment de l'écriture.
+    """
+    owner = data['users']['standard']['email']
+    return {
+        'users': {
+            user['email']: {
+                'email': user['email'],
+                'password': user['password'],
+                'name': user['name'],
+                'has_2fa': user.get('has_2fa', False),
+                'totp_code': user.get('totp_code'),
+            }
+            for user in data['users'].values()
+        },
+        'accounts': {
+            account['number']: {
+                'owner': owner,
+                'type': account['type'],
+                'number': account['number'],
+                'balance': 0.0,
+            }
+            for account in data['accounts'].values()
+        },
+        'beneficiaries': {
+            f"{owner}|{beneficiary['iban']}": {
+                'owner': owner,
+                'name': beneficiary['name'],
+                'iban': beneficiary['iban'],
+            }
+            for beneficiary in data['beneficiaries'].values()
+        },
+        'bills': {
+            bill['reference']: {
+                'provider': bill['provider'],
+                'reference': bill['reference'],
+                'amount': bill['amount'],
+            }
+            for bill in data['bills'].values()
+        },
+    }
+
+
+def _upsert(session, model, rows, keys) -> None:
+    """INSERT ... ON CONFLICT (clé naturelle) DO UPDATE (SQLite et PostgreSQL)"""
+    dialect = postgresql if session.get_bind().dialect.name == 'postgresql' else sqlite
+    statement = dialect.insert(model.__table__)
+    columns = [column for column in rows[0] if column not in keys]
+    statement = statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: statement.excluded[column] for column in columns},
+    )
+    session.execute(statement, rows)
+
+
+def _apply_reference_diff(session, previous: dict, current: dict) -> None:
+    """Applique les lignes ajoutées / modifiées et supprime les lignes retirées"""
+    emails = {row['owner'] for table in current.values() for row in table.values() if 'owner' in row}
+    emails |= {row['owner'] for table in previous.values() for row in table.values() if 'owner' in row}
+    owners = {}
+
+    def resolve(row: dict) -> dict:
+        if 'owner' not in row:
+            return row
+        values = {key: value for key, value in row.items() if key != 'owner'}
+        values['user_id'] = owners.get(row['owner'])
+        return values
+
+    for table, (model, keys) in _REFERENCE_TABLES.items():
+        old, new = previous.get(table, {}), current[table]
+        changed = [resolve(row) for key, row in new.items() if old.get(key) != row]
+        if changed:
+            _upsert(session, model, changed, keys)
+        if table == 'users':
+            owners = dict(session.execute(select(User.email, User.id).where(User.email.in_(emails))).all())
+
+    # Suppressions en ordre inverse (dépendances)
+    for table, (model, keys) in reversed(list(_REFERENCE_TABLES.items())):
+        removed = [resolve(row) for key, row in previous.get(table, {}).items() if key not in current[table]]
+        if removed:
+            columns = [model.__table__.c[key] for key in keys]
+            values = [tuple(row[key] for key in keys) for row in removed]
+            session.execute(delete(model.__table__).where(tuple_(*columns).in_(values)))
+
+
 class TestDataManager:
     """
     Gestionnaire centralisé des données de test
@@ -64,15 +178,16 @@ class TestDataManager:
         env: Environnement de test ('dev', 'int', 'uat', 'preprod')
     """
 
-    def __init__(self, env: str = 'dev'):
+    def __init__(self, env: str = 'dev', db: Optional[DatabaseManager] = None):
         """
         Initialise le gestionnaire de données
 
         Args:
             env: Environnement de test
+            db: Base à utiliser (défaut: get_db(env))
         """
         self.env = env
-        self._db: Optional[DatabaseManager] = None
+        self._db: Optional[DatabaseManager] = db
 
     @property
     def db(self) -> DatabaseManager:
@@ -191,71 +306,87 @@ class TestDataManager:
     # SEEDING (DONNÉES DE RÉFÉRENCE)
     # ═══════════════════════════════════════════════════════════════
 
-    def seed_standard_data(self) -> None:
+    def seed_standard_data(self, force: bool = False) -> bool:
         """
-        Initialise la base avec les données de référence du JSON
+        Initialise la base avec les données de référence du JSON (incrémental)
 
         Crée en base de données les utilisateurs, comptes, bénéficiaires
-        et factures définis dans test_users.json
-        """
-        from tests.data.models import User, Account, Beneficiary, Bill
+        et factures définis dans test_users.json.
+
+        L'empreinte du JSON et SCHEMA_VERSION sont enregistrées dans
+        seed_state : si rien n'a changé, aucune écriture. Sinon seules les
+        lignes ajoutées ou modifiées sont appliquées (INSERT ... ON CONFLICT
+        DO UPDATE sur la clé naturelle) et les lignes retirées du JSON sont
+        supprimées.
+
+        Args:
+            force: Réappliquer toutes les lignes même si l'empreinte est inchangée
 
+        Returns:
+            True si des données ont été écrites
+        """
         self.db.create_tables()
-        data = load_test_data()
+        content_hash = reference_data_hash()
 
         with self.db.session() as session:
-            # Utilisateurs
-            for key, user_data in data['users'].items():
-                user = User(
-                    email=user_data['email'],
-                    password=user_data['password'],
-                    name=user_data['name'],
-                    has_2fa=user_data.get('has_2fa', False),
-                    totp_code=user_data.get('totp_code')
-                )
-                session.add(user)
-
-            session.flush()
-
-            # Récupérer l'utilisateur standard pour les associations
-            standard_user = session.query(User).filter_by(
-                email=data['users']['standard']['email']
-            ).first()
-
-            if standard_user:
-                # Comptes
-                for key, account_data in data['accounts'].items():
-                    account = Account(
-                        user_id=standard_user.id,
-                        type=account_data['type'],
-                        number=account_data['number'],
-                        balance=0.0
-                    )
-                    session.add(account)
-
-                # Bénéficiaires
-                for key, ben_data in data['beneficiaries'].items():
-                    beneficiary = Beneficiary(
-                        user_id=standard_user.id,
-                        name=ben_data['name'],
-                        iban=ben_data['iban']
-                    )
-                    session.add(beneficiary)
-
-            # Factures (sans user_id)
-            for key, bill_data in data['bills'].items():
-                bill = Bill(
-                    provider=bill_data['provider'],
-                    reference=bill_data['reference'],
-                    amount=bill_data['amount']
-                )
-                session.add(bill)
+            state = session.get(SeedState, REFERENCE_STATE)
+            if (not force and state is not None and state.content_hash == content_hash
+                    and state.schema_version == SCHEMA_VERSION):
+                return False
+
+            previous = {} if force or state is None else json.loads(state.payload)
+            current = _reference_rows(load_test_data())
+            _apply_reference_diff(session, previous, current)
+
+            if state is None:
+                state = SeedState(name=REFERENCE_STATE)
+                session.add(state)
+            state.content_hash = content_hash
+            state.schema_version = SCHEMA_VERSION
+            state.payload = json.dumps(current, sort_keys=True)
+            state.seeded_at = datetime.utcnow()
+
+        # Seed volontaire : nouvel état de référence du reset différentiel
+        tracker = ChangeTracker(self.db)
+        if tracker.is_enabled:
+            tracker.rebaseline()
+        return True
 
     def cleanup(self) -> None:
-        """Supprime toutes les données de la base"""
+        """Supprime toutes les données de la base (et le suivi des modifications)"""
+        ChangeTracker(self.db).disable()
         self.db.drop_tables()
 
-    def reset(self) -> None:
-        """Réinitialise la base avec les données de référence"""
+    def track_changes(self) -> ChangeTracker:
+        """
+        Active le reset différentiel : l'état courant devient l'état de référence
+
+        Returns:
+            ChangeTracker de la base
+        """
+        tracker = ChangeTracker(self.db)
+        tracker.enable()
+        return tracker
+
+    def reset(self, background: bool = False) -> None:
+        """
+        Réinitialise la base avec les données de référence
+
+        Si le suivi des modifications est actif (track_changes), seules les
+        lignes touchées depuis l'état de référence sont restaurées ; sinon
+        drop/create puis seed.
+
+        Args:
+            background: Reset différentiel dans un thread (sans attendre la fin)
+        """
+        tracker = ChangeTracker(self.db)
+        if tracker.is_enabled:
+            if background:
+                tracker.restore_in_background()
+            else:
+                tracker.restore()
+            return
+        # Restes d'un suivi incomplet (tables supprimées hors cleanup)
+        tracker.disable()
         self.db.reset_database()
         self.seed_standard_data()
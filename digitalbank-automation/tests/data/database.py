@@ -1,75 +1,468 @@
 """
-Gestionnaire de base de données SQLite pour les tests DigitalBank
-Pattern Singleton avec support multi-environnement
+Gestionnaire de base de données pour les tests DigitalBank
+Pattern Singleton avec support multi-environnement (SQLite local par défaut)
+
+Snapshots par worker xdist : lorsque TEST_DB_SNAPSHOTS est défini (option
+--seed-db), la base test_data_{env}.db sert de modèle, seedé une fois par le
+contrôleur. Chaque worker (ou 'main' hors xdist) travaille sur sa copie
+test_data_{env}_{worker}.db, clonée au premier accès (API backup SQLite) :
+plus de contention de verrous entre workers, et réinitialiser les données
+revient à recopier le modèle.
+
+Isolation transactionnelle : transactional_scope() ouvre une transaction
+externe sur une connexion dédiée ; les sessions créées pendant le scope
+(y compris via session()) y sont rattachées en SAVEPOINT, leurs commit()
+ne font que libérer le savepoint et tout est annulé en sortie.
+
+Profils SQLite (config/environments.yaml, section sqlite_profiles) : PRAGMA
+appliqués à chaque connexion, ouverture en lecture seule (mode=ro,
+immutable=1) et dimensionnement du pool. Le profil d'un environnement est
+donné par sa clé sqlite_profile, surchargeable par SQLITE_PROFILE ou
+get_db(env, profile=...).
+
+Base en mémoire : get_db(env, backend='memory') ouvre une base SQLite
+nommée en mémoire partagée (cache=shared), même API session()/create_tables().
+Une connexion épinglée la maintient en vie jusqu'à close_all() ; persist()
+la copie sur disque (API backup), restore_template() la charge depuis le
+modèle sur disque.
+
+Base serveur : get_db(env, backend='server') utilise le bloc database de
+l'environnement (config/environments.yaml : host, port, name, user,
+password, variables ${...} résolues), avec un QueuePool réglé par la section
+server_database (taille, recyclage, pre-ping). Sans bloc database ou avec des
+identifiants non résolus, repli sur la base SQLite fichier (avertissement).
+Le chargement en masse passe par COPY (voir tests.data.bulk_load).
+
+Concurrence (threads) :
+- get_db() / DatabaseManager() et la création paresseuse de l'engine et de
+  la factory de sessions sont protégées par un verrou réentrant de classe :
+  des threads qui accèdent simultanément à un environnement obtiennent la
+  même instance et le même engine
+- une Session n'est jamais partagée entre threads : session() et
+  get_session() en créent une par appel, thread_session() retourne celle
+  du thread courant (scoped_session), libérée par remove_thread_session()
+- l'engine (pool de connexions) est partagé ; avec SQLite fichier, les
+  écritures concurrentes restent sérialisées par le verrou de la base
+  (profil avec busy_timeout / WAL recommandé pour l'écriture en parallèle)
+- transactional_scope() et restore_template() modifient l'état de
+  l'instance : à appeler hors des phases multi-threads, tout comme
+  close_all() qui invalide toutes les instances
 """
 
+import glob
+import logging
 import os
-from typing import Optional, Generator
-from contextlib import contextmanager
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+import re
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Optional, Generator, Tuple
+from contextlib import closing, contextmanager
+
+import yaml
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from tests.data.models import Base
 
+logger = logging.getLogger(__name__)
+
+# Variable d'environnement activant les copies par worker (héritée par les workers xdist)
+SNAPSHOTS_ENV = "TEST_DB_SNAPSHOTS"
+
+# Profil SQLite imposé à tous les environnements (prioritaire sur environments.yaml)
+PROFILE_ENV = "SQLITE_PROFILE"
+DEFAULT_PROFILE = "default"
+
+FILE_BACKEND = "file"
+MEMORY_BACKEND = "memory"
+SERVER_BACKEND = "server"
+BACKENDS = (FILE_BACKEND, MEMORY_BACKEND, SERVER_BACKEND)
+
+_ENV_VAR = re.compile(r"\$\{(\w+)\}")
+
+_ENVIRONMENTS_FILE = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'config', 'environments.yaml'
+)
+
+
+@lru_cache(maxsize=1)
+def _load_environments() -> dict:
+    """Contenu de config/environments.yaml (vide si absent)"""
+    try:
+        with open(_ENVIRONMENTS_FILE, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+
+
+def resolve_sqlite_profile(env: str, profile: Optional[str] = None) -> Tuple[str, dict]:
+    """
+    Résout le profil SQLite d'un environnement
+
+    Ordre : argument profile, SQLITE_PROFILE, clé sqlite_profile de
+    l'environnement, puis 'default' (paramètres SQLite par défaut).
+
+    Returns:
+        (nom du profil, paramètres)
+
+    Raises:
+        ValueError: Profil inconnu
+    """
+    config = _load_environments()
+    env_config = config.get('environments', {}).get(env) or {}
+    name = profile or os.getenv(PROFILE_ENV) or env_config.get('sqlite_profile') or DEFAULT_PROFILE
+    profiles = config.get('sqlite_profiles') or {}
+    if name not in profiles and name != DEFAULT_PROFILE:
+        raise ValueError(f"Profil SQLite inconnu: {name} (profils: {', '.join(profiles)})")
+    return name, profiles.get(name) or {}
+
+
+def resolve_server_config(env: str) -> Optional[dict]:
+    """
+    Paramètres de la base serveur d'un environnement
+
+    Bloc database de l'environnement fusionné avec la section server_database
+    (driver, pool, connect_args) ; les variables ${VAR} sont résolues depuis
+    l'environnement.
+
+    Returns:
+        Paramètres, ou None si aucun serveur n'est configuré (pas de bloc
+        database, ou host / name / user / variable non résolus)
+    """
+    config = _load_environments()
+    database = (config.get('environments', {}).get(env) or {}).get('database')
+    if not database:
+        return None
+    defaults = config.get('server_database') or {}
+    settings = {**defaults, **database}
+    settings['pool'] = {**(defaults.get('pool') or {}), **(database.get('pool') or {})}
+    settings['connect_args'] = {**(defaults.get('connect_args') or {}), **(database.get('connect_args') or {})}
+    for key in ('host', 'name', 'user', 'password'):
+        value = settings.get(key)
+        if isinstance(value, str):
+            value = _ENV_VAR.sub(lambda match: os.getenv(match.group(1), ''), value)
+            settings[key] = value
+    if not all(settings.get(key) for key in ('host', 'name', 'user')):
+        return None
+    return settings
+
+
+# Environnements dont le repli serveur -> SQLite a déjà été signalé
+_server_fallbacks: set = set()
+
+
+def resolve_backend(env: str, backend: Optional[str] = None) -> str:
+    """
+    Backend effectif d'un environnement
+
+    'server' sans serveur configuré (resolve_server_config) retombe sur 'file'.
+
+    Raises:
+        ValueError: Backend inconnu
+    """
+    backend = backend or FILE_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend inconnu: {backend} ({', '.join(BACKENDS)})")
+    if backend == SERVER_BACKEND and resolve_server_config(env) is None:
+        # Un avertissement par environnement (get_db() est appelé à chaque accès)
+        if env not in _server_fallbacks:
+            _server_fallbacks.add(env)
+            logger.warning("Aucune base serveur configurée pour '%s' : repli sur SQLite", env)
+        return FILE_BACKEND
+    return backend
+
 
 class DatabaseManager:
     """
     Gestionnaire de base de données SQLite par environnement
-    Implémente le pattern Singleton par environnement
+    Implémente le pattern Singleton par environnement et profil SQLite
+    (thread-safe, voir le contrat de concurrence du module)
     """
     _instances: dict = {}
     _engines: dict = {}
+    # Réentrant : engine peut être résolu pendant restore_template() et inversement
+    _lock = threading.RLock()
 
-    def __new__(cls, env: str = 'dev'):
-        """Singleton par environnement"""
-        if env not in cls._instances:
-            instance = super().__new__(cls)
-            instance._initialized = False
-            cls._instances[env] = instance
-        return cls._instances[env]
+    def __new__(cls, env: str = 'dev', profile: Optional[str] = None, backend: str = FILE_BACKEND):
+        """Singleton par environnement, profil et backend"""
+        backend = resolve_backend(env, backend)
+        key = (env, resolve_sqlite_profile(env, profile)[0], backend)
+        with cls._lock:
+            if key not in cls._instances:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                instance.backend = backend
+                cls._instances[key] = instance
+            return cls._instances[key]
 
-    def __init__(self, env: str = 'dev'):
-        if self._initialized:
-            return
+    def __init__(self, env: str = 'dev', profile: Optional[str] = None, backend: str = FILE_BACKEND):
+        with DatabaseManager._lock:
+            if not self._initialized:
+                self._initialize(env, profile)
 
+    def _initialize(self, env: str, profile: Optional[str]) -> None:
+        """Initialisation unique (backend déjà résolu par __new__)"""
         self.env = env
+        self.profile, self.profile_settings = resolve_sqlite_profile(env, profile)
         self._db_dir = os.path.join(os.path.dirname(__file__), 'db')
         os.makedirs(self._db_dir, exist_ok=True)
 
-        self.db_path = os.path.join(self._db_dir, f'test_data_{env}.db')
+        self.template_path = os.path.join(self._db_dir, f'test_data_{env}.db')
+        self.server = resolve_server_config(env) if self.is_server else None
+        # Copies par worker : bases SQLite uniquement (la base serveur est partagée)
+        self.worker = (os.getenv('PYTEST_XDIST_WORKER') or 'main') \
+            if os.getenv(SNAPSHOTS_ENV) and not self.server else None
+        if self.worker:
+            self.db_path = os.path.join(self._db_dir, f'test_data_{env}_{self.worker}.db')
+        else:
+            self.db_path = self.template_path
+        # Base mémoire nommée : partagée par toutes les connexions du processus
+        self.memory_uri = f'file:digitalbank_{env}_{self.profile}?mode=memory&cache=shared'
+        self._keepalive = None
         self._engine = None
         self._session_factory = None
+        self._scoped_sessions = None
         self._initialized = True
 
     @property
     def engine(self):
-        """Retourne l'engine SQLAlchemy (lazy loading)"""
+        """Retourne l'engine SQLAlchemy (lazy loading, créé une seule fois)"""
         if self._engine is None:
-            db_url = f'sqlite:///{self.db_path}'
-            self._engine = create_engine(db_url, echo=False)
-            DatabaseManager._engines[self.env] = self._engine
+            with DatabaseManager._lock:
+                if self._engine is None:
+                    self._create_engine()
         return self._engine
 
+    def _create_engine(self) -> None:
+        """Crée l'engine (appelé sous le verrou de classe)"""
+        if self.is_memory:
+            self._keepalive = sqlite3.connect(self.memory_uri, uri=True, check_same_thread=False)
+            if os.getenv(SNAPSHOTS_ENV) and os.path.exists(self.template_path):
+                self.restore_template()
+        elif self.is_snapshot and not os.path.exists(self.db_path):
+            self.restore_template()
+        if self.is_server:
+            engine = _create_server_engine(self.server)
+        else:
+            engine = _create_sqlite_engine(
+                self.db_path, self.profile_settings, self.memory_uri if self.is_memory else None
+            )
+            _enable_sqlite_savepoints(engine)
+        # Publié en dernier : un autre thread ne voit jamais un engine sans ses écouteurs
+        self._engine = engine
+        DatabaseManager._engines[(self.env, self.profile, self.backend)] = engine
+
     @property
     def session_factory(self):
         """Retourne la factory de sessions (lazy loading)"""
         if self._session_factory is None:
-            self._session_factory = sessionmaker(bind=self.engine)
+            with DatabaseManager._lock:
+                if self._session_factory is None:
+                    self._session_factory = sessionmaker(bind=self.engine)
         return self._session_factory
 
+    @property
+    def scoped_sessions(self) -> scoped_session:
+        """
+        Registre des sessions par thread (scoped_session)
+
+        Les sessions sont créées par session_factory au premier appel de
+        chaque thread : pendant transactional_scope(), celles des threads
+        qui n'en avaient pas encore rejoignent la transaction du scope.
+        """
+        if self._scoped_sessions is None:
+            with DatabaseManager._lock:
+                if self._scoped_sessions is None:
+                    self._scoped_sessions = scoped_session(self._new_session)
+        return self._scoped_sessions
+
+    def _new_session(self) -> Session:
+        return self.session_factory()
+
     def create_tables(self) -> None:
-        """Crée toutes les tables dans la base de données"""
+        """Crée toutes les tables dans la base de données (et les index manquants)"""
         Base.metadata.create_all(self.engine)
+        self.ensure_indexes()
+
+    def ensure_indexes(self) -> None:
+        """
+        Crée les index déclarés dans les modèles s'ils sont absents
+
+        create_all() ne crée les index qu'avec leur table : les bases créées
+        avant l'ajout d'un index sont mises à niveau ici.
+        """
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
 
     def drop_tables(self) -> None:
         """Supprime toutes les tables de la base de données"""
         Base.metadata.drop_all(self.engine)
 
     def reset_database(self) -> None:
-        """Réinitialise la base de données (drop + create)"""
+        """
+        Réinitialise la base de données
+
+        Suivi des modifications actif (tests.data.change_tracking) : seules
+        les lignes touchées sont ramenées à l'état de référence. Sinon
+        drop + create (tables vides).
+        """
+        # Import local : change_tracking dépend de ce module
+        from tests.data.change_tracking import ChangeTracker
+
+        tracker = ChangeTracker(self)
+        if tracker.is_enabled:
+            tracker.restore()
+            return
         self.drop_tables()
         self.create_tables()
 
+    @property
+    def is_memory(self) -> bool:
+        """True si la base est en mémoire (backend 'memory')"""
+        return self.backend == MEMORY_BACKEND
+
+    @property
+    def is_server(self) -> bool:
+        """True si la base est un serveur (backend 'server', bloc database)"""
+        return self.backend == SERVER_BACKEND
+
+    @property
+    def location(self) -> str:
+        """Emplacement lisible de la base (fichier, URI mémoire ou URL sans mot de passe)"""
+        if self.is_server:
+            return _server_url(self.server).render_as_string(hide_password=True)
+        return self.memory_uri if self.is_memory else self.db_path
+
+    @property
+    def is_snapshot(self) -> bool:
+        """True si l'instance travaille sur une copie du modèle (worker xdist)"""
+        return self.db_path != self.template_path
+
+    def restore_template(self) -> None:
+        """
+        Recopie la base modèle dans la base du worker ou en mémoire (API backup SQLite)
+
+        Remplace le drop/create + insertions : utilisé au démarrage du worker
+        et pour réinitialiser ses données en cours de session.
+        """
+        if not self.is_snapshot and not self.is_memory:
+            return
+        if not os.path.exists(self.template_path):
+            raise FileNotFoundError(f"Base modèle absente: {self.template_path}")
+        self.restore_from(self.template_path)
+
+    def restore_from(self, path: str) -> None:
+        """
+        Remplace le contenu de la base par celui d'un fichier SQLite (API backup)
+
+        Args:
+            path: Base source (modèle, jeu de données en cache...)
+
+        Raises:
+            FileNotFoundError: Base source absente
+            ValueError: Base serveur
+        """
+        if self.is_server:
+            raise ValueError(f"Copie de base SQLite impossible vers une base serveur ({self.location})")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Base source absente: {path}")
+        if self._engine is not None:
+            self._engine.dispose()
+        with closing(sqlite3.connect(path)) as source:
+            if self.is_memory:
+                if self._keepalive is None:
+                    self.engine  # ouvre la connexion épinglée
+                source.backup(self._keepalive)
+            else:
+                with closing(sqlite3.connect(self.db_path)) as target:
+                    source.backup(target)
+
+    def persist(self, path: Optional[str] = None) -> str:
+        """
+        Copie la base sur disque (API backup SQLite)
+
+        Args:
+            path: Fichier cible (défaut: fichier de l'environnement / du worker)
+
+        Returns:
+            Chemin du fichier écrit
+
+        Raises:
+            ValueError: Base serveur (pas de copie fichier)
+        """
+        if self.is_server:
+            raise ValueError(f"Copie sur disque impossible pour une base serveur ({self.location})")
+        path = path or self.db_path
+        if self.is_memory:
+            if self._keepalive is None:
+                self.engine  # ouvre la connexion épinglée
+            with closing(sqlite3.connect(path)) as target:
+                self._keepalive.backup(target)
+        else:
+            with closing(sqlite3.connect(self.db_path)) as source, \
+                    closing(sqlite3.connect(path)) as target:
+                source.backup(target)
+        return path
+
+    def remove_snapshot(self) -> None:
+        """Ferme les connexions et supprime la copie du worker"""
+        if not self.is_snapshot:
+            return
+        if self._engine is not None:
+            self._engine.dispose()
+        for path in (self.db_path, f'{self.db_path}-journal', f'{self.db_path}-wal', f'{self.db_path}-shm'):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @classmethod
+    def remove_all_snapshots(cls, env: str) -> None:
+        """Supprime les copies de tous les workers (fin de session du contrôleur)"""
+        db_dir = os.path.join(os.path.dirname(__file__), 'db')
+        for worker in ('gw*', 'main'):
+            for path in glob.glob(os.path.join(db_dir, f'test_data_{env}_{worker}.db*')):
+                os.remove(path)
+
+    @contextmanager
+    def transactional_scope(self) -> Generator[sessionmaker, None, None]:
+        """
+        Annule en sortie tout ce qui a été écrit via l'ORM pendant le scope
+
+        Les sessions de session_factory (donc de session() et get_session())
+        rejoignent la transaction externe en SAVEPOINT
+        (join_transaction_mode="create_savepoint") : session.commit() libère
+        le savepoint sans valider la transaction externe, session.rollback()
+        revient au savepoint.
+
+        Les écritures Core directes sur self.engine (insertions en masse)
+        utilisent leur propre connexion et ne sont pas annulées.
+
+        Usage:
+            with db.transactional_scope() as factory:
+                session = factory()
+                ...
+
+        Returns:
+            Factory de sessions liée à la connexion du scope
+        """
+        connection = self.engine.connect()
+        transaction = connection.begin()
+        previous = self._session_factory
+        self._session_factory = sessionmaker(
+            bind=connection, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield self._session_factory
+        finally:
+            self._session_factory = previous
+            if transaction.is_active:
+                transaction.rollback()
+            connection.close()
+
     @contextmanager
     def session(self) -> Generator[Session, None, None]:
         """
@@ -96,23 +489,191 @@ class DatabaseManager:
         """
         return self.session_factory()
 
+    def thread_session(self) -> Session:
+        """
+        Session du thread courant (la même à chaque appel depuis ce thread)
+
+        Usage (seeding en parallèle):
+            def worker():
+                session = db.thread_session()
+                try:
+                    session.add_all(...)
+                    session.commit()
+                finally:
+                    db.remove_thread_session()
+        """
+        return self.scoped_sessions()
+
+    def remove_thread_session(self) -> None:
+        """Ferme et oublie la session du thread courant"""
+        if self._scoped_sessions is not None:
+            self._scoped_sessions.remove()
+
+    def close(self) -> None:
+        """
+        Ferme l'engine et les connexions de l'instance et la retire du registre
+
+        Pour les bases temporaires (génération d'un jeu de données, shards) :
+        un get_db() ultérieur sur le même environnement crée une nouvelle instance.
+        """
+        key = (self.env, self.profile, self.backend)
+        with DatabaseManager._lock:
+            if self._scoped_sessions is not None:
+                self._scoped_sessions.remove()
+            engine = DatabaseManager._engines.pop(key, None)
+            if engine is not None:
+                engine.dispose()
+            if self._keepalive is not None:
+                self._keepalive.close()
+                self._keepalive = None
+            if DatabaseManager._instances.get(key) is self:
+                del DatabaseManager._instances[key]
+
     @classmethod
     def close_all(cls) -> None:
-        """Ferme tous les engines et connexions"""
-        for env, engine in cls._engines.items():
-            engine.dispose()
-        cls._engines.clear()
-        cls._instances.clear()
+        """
+        Ferme tous les engines et connexions (les bases en mémoire sont libérées)
+
+        Les sessions de thread_session() des autres threads ne sont plus
+        utilisables : à appeler une fois les threads terminés.
+        """
+        with cls._lock:
+            for instance in cls._instances.values():
+                if instance._scoped_sessions is not None:
+                    instance._scoped_sessions.remove()
+            for engine in cls._engines.values():
+                engine.dispose()
+            for instance in cls._instances.values():
+                if instance._keepalive is not None:
+                    instance._keepalive.close()
+                    instance._keepalive = None
+            cls._engines.clear()
+            cls._instances.clear()
+
+
+def _has_pending_wal(path: str) -> bool:
+    """True si le fichier -wal de la base contient des pages non reportées"""
+    wal = path + '-wal'
+    return os.path.exists(wal) and os.path.getsize(wal) > 0
+
+
+def _create_sqlite_engine(path: str, settings: dict, memory_uri: Optional[str] = None):
+    """
+    Crée l'engine SQLite d'un profil
+
+    Args:
+        path: Fichier SQLite
+        settings: Paramètres du profil (read_only, immutable, pragmas, pool, multithread)
+        memory_uri: URI d'une base nommée en mémoire partagée (remplace path)
+    """
+    options = {}
+    if memory_uri:
+        # Pool de connexions distinctes (par défaut : une connexion par thread)
+        db_url = f'sqlite:///{memory_uri}&uri=true'
+        options['poolclass'] = QueuePool
+        options['connect_args'] = {'check_same_thread': False}
+    elif settings.get('read_only'):
+        # immutable=1 : aucun verrou ni lecture du journal (fichier non modifié pendant le run)
+        immutable = settings.get('immutable')
+        if immutable and _has_pending_wal(path):
+            # Lignes encore dans le WAL (non reportées) : immutable les ignorerait
+            logger.warning("WAL non vide pour %s : ouverture en lecture seule sans immutable", path)
+            immutable = False
+        params = 'mode=ro&immutable=1' if immutable else 'mode=ro'
+        db_url = f'sqlite:///file:{path}?{params}&uri=true'
+    else:
+        db_url = f'sqlite:///{path}'
+
+    if settings.get('multithread'):
+        options['connect_args'] = {'check_same_thread': False}
+    pool = settings.get('pool') or {}
+    if 'size' in pool:
+        options['pool_size'] = pool['size']
+    if 'max_overflow' in pool:
+        options['max_overflow'] = pool['max_overflow']
+    engine = create_engine(db_url, echo=False, **options)
+
+    pragmas = settings.get('pragmas') or {}
+    if memory_uri:
+        # Cache partagé : verrous par table entre connexions du pool. Sans
+        # read_uncommitted, lire une table écrite par une transaction ouverte
+        # (transactional_scope, db_session) lève "database table is locked".
+        # Les écritures concurrentes restent sérialisées.
+        pragmas = {'read_uncommitted': 1, **pragmas}
+    if pragmas:
+        @event.listens_for(engine, "connect")
+        def _apply_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return engine
+
+
+def _server_url(settings: dict) -> URL:
+    """URL SQLAlchemy d'une base serveur (mot de passe échappé)"""
+    return URL.create(
+        settings.get('driver') or 'postgresql+psycopg2',
+        username=settings.get('user'),
+        password=settings.get('password') or None,
+        host=settings.get('host'),
+        port=settings.get('port'),
+        database=settings.get('name'),
+    )
+
+
+def _create_server_engine(settings: dict):
+    """
+    Crée l'engine d'une base serveur (QueuePool)
+
+    Args:
+        settings: Paramètres résolus (resolve_server_config) : driver, pool
+            (size, max_overflow, timeout, recycle, pre_ping), connect_args
+    """
+    pool = settings.get('pool') or {}
+    return create_engine(
+        _server_url(settings),
+        echo=False,
+        poolclass=QueuePool,
+        pool_size=pool.get('size', 5),
+        max_overflow=pool.get('max_overflow', 10),
+        pool_timeout=pool.get('timeout', 30),
+        # Connexions recyclées avant les coupures d'inactivité (pare-feu, WAN)
+        pool_recycle=pool.get('recycle', -1),
+        pool_pre_ping=pool.get('pre_ping', True),
+        connect_args=settings.get('connect_args') or {},
+    )
+
+
+def _enable_sqlite_savepoints(engine) -> None:
+    """
+    Active les SAVEPOINT fiables avec pysqlite
+
+    Le driver sqlite3 gère lui-même BEGIN/COMMIT et casse l'imbrication des
+    savepoints : la gestion des transactions est rendue à SQLAlchemy
+    (recette "Serializable isolation / Savepoints" de la documentation).
+    """
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection):
+        connection.exec_driver_sql("BEGIN")
 
 
-def get_db(env: str = 'dev') -> DatabaseManager:
+def get_db(env: str = 'dev', profile: Optional[str] = None, backend: str = FILE_BACKEND) -> DatabaseManager:
     """
     Factory function pour obtenir une instance DatabaseManager
 
     Args:
         env: Environnement de test ('dev', 'int', 'uat', 'preprod')
+        profile: Profil SQLite (défaut: celui de l'environnement)
+        backend: 'file' (défaut), 'memory' (base en mémoire partagée) ou
+            'server' (bloc database de l'environnement, repli sur 'file')
 
     Returns:
         Instance DatabaseManager pour l'environnement spécifié
     """
-    return DatabaseManager(env)
+    return DatabaseManager(env, profile, backend)
@@ -0,0 +1,212 @@
+"""
+Jeux de données reproductibles par profil (small, medium, large, xl)
+
+Un profil (config/environments.yaml, section dataset_profiles) fixe la
+volumétrie et la graine. Le jeu est généré une fois (données de référence
+puis génération columnaire de seed_random_data_bulk) avec toutes les sources
+d'aléa initialisées par la graine : random, Faker, générateur NumPy et
+espace de noms des valeurs uniques.
+
+Le résultat est mis en cache dans tests/data/db/cache/, sous un nom qui
+combine profil, graine et empreinte des paramètres résolus du profil
+(volumétrie, taille de lot) et du code de génération (factories, génération
+columnaire, modèles, données de référence, versions de Faker et NumPy) :
+toute modification du profil ou du code invalide le cache. Les runs suivants
+chargent le jeu par simple copie (API backup SQLite) sans le régénérer ; le
+fichier peut aussi être ouvert directement ou via ATTACH (lecture seule).
+
+Les dates restent relatives au moment de la génération (30 derniers jours,
+échéances à venir) : elles sont figées dans le cache, pas d'une génération
+à l'autre.
+
+Exemple:
+    python -m tests.data.seed_data dataset --profile=medium --env=dev -v
+    pytest tests/ --dataset=small -v
+"""
+
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import time
+from contextlib import closing, contextmanager
+from importlib.metadata import version
+from typing import Iterator
+
+from tests.data.database import DatabaseManager, _load_environments, get_db
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'db', 'cache')
+
+# Sources dont dépend le contenu généré (empreinte du cache)
+_GENERATION_SOURCES = (
+    'factories.py', 'columnar.py', 'unique.py', 'iban.py', 'models.py',
+    'seed_data.py', 'data_manager.py', 'datasets.py', 'test_users.json',
+)
+
+
+def resolve_dataset_profile(name: str) -> dict:
+    """
+    Paramètres d'un profil de jeu de données
+
+    Returns:
+        Dictionnaire : count (utilisateurs), seed, batch_size (optionnel)
+
+    Raises:
+        ValueError: Profil inconnu
+    """
+    profiles = _load_environments().get('dataset_profiles') or {}
+    if name not in profiles:
+        raise ValueError(f"Profil de jeu de données inconnu: {name} (profils: {', '.join(profiles)})")
+    return profiles[name]
+
+
+def generation_hash() -> str:
+    """Empreinte du code de génération et des versions de Faker / NumPy"""
+    digest = hashlib.sha256()
+    directory = os.path.dirname(__file__)
+    for filename in _GENERATION_SOURCES:
+        with open(os.path.join(directory, filename), 'rb') as f:
+            digest.update(filename.encode('utf-8') + b'\0' + f.read())
+    for package in ('Faker', 'numpy'):
+        digest.update(f"{package}={version(package)}".encode('utf-8'))
+    return digest.hexdigest()[:12]
+
+
+def _resolved_settings(name: str) -> dict:
+    """Paramètres du profil, taille de lot par défaut comprise"""
+    from tests.data.seed_data import BULK_BATCH_SIZE
+
+    settings = dict(resolve_dataset_profile(name))
+    settings.setdefault('batch_size', BULK_BATCH_SIZE)
+    return settings
+
+
+def dataset_path(name: str) -> str:
+    """
+    Fichier du jeu en cache : dataset_{profil}_s{graine}_{empreinte}.db
+
+    L'empreinte couvre le code de génération et les paramètres résolus du
+    profil (count, batch_size...) : changer la volumétrie produit un autre jeu.
+    """
+    settings = _resolved_settings(name)
+    digest = hashlib.sha256(generation_hash().encode('utf-8'))
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    return os.path.join(CACHE_DIR, f"dataset_{name}_s{settings['seed']}_{digest.hexdigest()[:12]}.db")
+
+
+@contextmanager
+def seeded(seed: int) -> Iterator[None]:
+    """
+    Initialise random, Faker et l'espace de noms des valeurs uniques
+
+    L'état de random et des valeurs uniques est rétabli en sortie ; Faker
+    est réinitialisé aléatoirement. Le générateur NumPy est passé
+    explicitement (seed_random_data_bulk(seed=...)).
+    """
+    from tests.data.columnar import faker_pools
+    from tests.data.factories import fake
+    from tests.data.unique import unique
+
+    state = random.getstate()
+    random.seed(seed)
+    fake.seed_instance(seed)
+    # Pools Faker mis en cache par processus : régénérés depuis la graine
+    faker_pools.cache_clear()
+    try:
+        with unique.isolated(f"ds{seed}"):
+            yield
+    finally:
+        random.setstate(state)
+        fake.seed_instance()
+        faker_pools.cache_clear()
+
+
+def _remove_database(path: str) -> None:
+    for suffix in ('', '-journal', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def build_dataset(name: str, force: bool = False, verbose: bool = False) -> str:
+    """
+    Génère le jeu d'un profil s'il n'est pas en cache
+
+    Génération dans une base de travail propre au processus
+    (test_data_dataset_{profil}_{pid}.db), puis copie atomique dans le cache :
+    plusieurs processus peuvent construire le même jeu sans s'écraser.
+
+    Args:
+        name: Profil (small, medium, large, xl...)
+        force: Régénérer même si le jeu est en cache
+        verbose: Afficher les détails
+
+    Returns:
+        Chemin du jeu en cache
+    """
+    from tests.data.data_manager import TestDataManager
+    from tests.data.seed_data import BULK_PROFILE, seed_random_data_bulk
+
+    settings = _resolved_settings(name)
+    path = dataset_path(name)
+    if os.path.exists(path) and not force:
+        return path
+
+    started = time.perf_counter()
+    env = f"dataset_{name}_{os.getpid()}"
+    db = get_db(env, profile=BULK_PROFILE)
+    _remove_database(db.db_path)
+    db.create_tables()
+    with seeded(settings['seed']):
+        TestDataManager(env, db=db).seed_standard_data(force=True)
+        seed_random_data_bulk(
+            env, settings['count'], settings['batch_size'], verbose,
+            columnar=True, seed=settings['seed']
+        )
+    # Base de travail temporaire : instance retirée du registre de DatabaseManager
+    db.close()
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    partial = f"{path}.{os.getpid()}.tmp"
+    # backup : copie cohérente, journal WAL du profil de seeding inclus
+    with closing(sqlite3.connect(db.db_path)) as source, closing(sqlite3.connect(partial)) as target:
+        source.backup(target)
+        # Fichier autonome (sans -wal), ouvrable en lecture seule ou via ATTACH
+        target.execute("PRAGMA journal_mode=DELETE")
+    os.replace(partial, path)
+    _remove_database(db.db_path)
+    _remove_stale(name, os.path.basename(path))
+
+    if verbose:
+        print(f"[DATASET] Jeu '{name}' généré en {time.perf_counter() - started:.1f}s: {path}")
+    return path
+
+
+def load_dataset(db: DatabaseManager, name: str, verbose: bool = False) -> str:
+    """
+    Charge le jeu d'un profil dans une base (généré au premier appel)
+
+    Le contenu de la base est remplacé (suivi des modifications compris).
+
+    Args:
+        db: Base cible (fichier ou mémoire)
+        name: Profil
+        verbose: Afficher les détails
+
+    Returns:
+        Chemin du jeu en cache
+    """
+    path = build_dataset(name, verbose=verbose)
+    started = time.perf_counter()
+    db.restore_from(path)
+    if verbose:
+        print(f"[DATASET] Jeu '{name}' chargé en {time.perf_counter() - started:.2f}s: {db.location}")
+    return path
+
+
+def _remove_stale(name: str, current: str) -> None:
+    """Supprime les jeux du profil générés par un code antérieur"""
+    prefix = f"dataset_{name}_"
+    for filename in os.listdir(CACHE_DIR):
+        if filename.startswith(prefix) and filename.endswith('.db') and filename != current:
+            os.remove(os.path.join(CACHE_DIR, filename))
@@ -0,0 +1,198 @@
+"""
+Export en masse des données de test, sans objets ORM
+
+Les lignes sont lues avec SQLAlchemy Core par lots (yield_per) et écrites au
+fil de l'eau : ni identity map ni hydratation d'objets, mémoire constante.
+Les clés et formats reproduisent to_dict() des modèles (dates ISO 8601).
+
+Formats :
+- dictionnaires (iter_dicts) pour les tests
+- NDJSON : sous SQLite, chaque ligne est produite directement par
+  json_object() ; ailleurs, json.dumps() sur les dictionnaires
+- CSV : en-tête = clés de to_dict()
+
+Exemple:
+    from tests.data.export import export_table
+    export_table(get_db('dev').engine, Transaction, 'reports/transactions.ndjson')
+"""
+
+import csv
+import json
+import os
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Type
+
+from sqlalchemy import Boolean, DateTime, case, func, literal, select
+from sqlalchemy.engine import Engine
+
+from tests.data.models import Base, User, Account, Transaction, Beneficiary, Bill
+
+
+# Colonnes exportées par modèle (mêmes clés que to_dict())
+EXPORT_COLUMNS: Dict[Type[Base], List[str]] = {
+    User: ['id', 'email', 'password', 'name', 'has_2fa', 'totp_code'],
+    Account: ['id', 'user_id', 'type', 'number', 'balance'],
+    Transaction: ['id', 'account_id', 'type', 'amount', 'description', 'date', 'reference'],
+    Beneficiary: ['id', 'user_id', 'name', 'iban'],
+    Bill: ['id', 'provider', 'reference', 'amount', 'due_date', 'paid'],
+}
+
+FORMATS = ('ndjson', 'csv')
+
+# Taille des lots lus depuis la base
+EXPORT_BATCH_SIZE = 10_000
+
+
+def _columns(model: Type[Base]):
+    table = model.__table__
+    return [table.c[name] for name in EXPORT_COLUMNS[model]]
+
+
+def _to_json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_dicts(
+    engine: Engine,
+    model: Type[Base],
+    where=None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[dict]:
+    """
+    Lignes d'une table sous forme de dictionnaires (équivalent de to_dict())
+
+    Args:
+        engine: Engine SQLAlchemy
+        model: Modèle à exporter (User, Transaction...)
+        where: Condition optionnelle (ex. Transaction.account_id == 3)
+        batch_size: Nombre de lignes lues par lot
+
+    Returns:
+        Itérateur de dictionnaires, dates en ISO 8601
+    """
+    columns = _columns(model)
+    query = select(*columns).order_by(model.__table__.c.id)
+    if where is not None:
+        query = query.where(where)
+    temporal = [i for i, column in enumerate(columns) if isinstance(column.type, DateTime)]
+    keys = EXPORT_COLUMNS[model]
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=batch_size).execute(query)
+        for row in result:
+            values = list(row)
+            for i in temporal:
+                values[i] = _to_json_value(values[i])
+            yield dict(zip(keys, values))
+
+
+def _json_object_query(model: Type[Base]):
+    """SELECT json_object(...) : une ligne NDJSON par enregistrement, calculée par SQLite"""
+    arguments = []
+    for column in _columns(model):
+        if isinstance(column.type, Boolean):
+            value = case(
+                (column.is_(None), func.json('null')),
+                (column == 1, func.json('true')),
+                else_=func.json('false'),
+            )
+        elif isinstance(column.type, DateTime):
+            # Stockage SQLite 'YYYY-MM-DD HH:MM:SS.ffffff' -> ISO 8601
+            value = func.replace(column, ' ', 'T')
+        else:
+            value = column
+        arguments.extend([literal(column.name), value])
+    return select(func.json_object(*arguments)).order_by(model.__table__.c.id)
+
+
+def iter_ndjson(
+    engine: Engine,
+    model: Type[Base],
+    where=None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[str]:
+    """
+    Lignes NDJSON d'une table (sans saut de ligne final)
+
+    Sous SQLite, le JSON est construit par json_object() : aucune conversion
+    Python par valeur.
+    """
+    if engine.dialect.name != 'sqlite':
+        for record in iter_dicts(engine, model, where, batch_size):
+            yield json.dumps(record, ensure_ascii=False)
+        return
+    query = _json_object_query(model)
+    if where is not None:
+        query = query.where(where)
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=batch_size).execute(query)
+        for (line,) in result:
+            yield line
+
+
+def export_table(
+    engine: Engine,
+    model: Type[Base],
+    path: str,
+    fmt: Optional[str] = None,
+    where=None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> int:
+    """
+    Exporte une table dans un fichier NDJSON ou CSV
+
+    Args:
+        engine: Engine SQLAlchemy
+        model: Modèle à exporter
+        path: Fichier cible (répertoires créés si besoin)
+        fmt: 'ndjson' ou 'csv' (défaut: extension du fichier)
+        where: Condition optionnelle
+        batch_size: Nombre de lignes lues par lot
+
+    Returns:
+        Nombre de lignes exportées
+    """
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Format d'export inconnu: {fmt} ({', '.join(FORMATS)})")
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        if fmt == 'ndjson':
+            for line in iter_ndjson(engine, model, where, batch_size):
+                f.write(line)
+                f.write('\n')
+                count += 1
+        else:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_COLUMNS[model])
+            for record in iter_dicts(engine, model, where, batch_size):
+                writer.writerow(record.values())
+                count += 1
+    return count
+
+
+def export_dataset(
+    engine: Engine,
+    directory: str,
+    fmt: str = 'ndjson',
+    models: Optional[Sequence[Type[Base]]] = None,
+    batch_size: int = EXPORT_BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    Exporte toutes les tables (un fichier {table}.{fmt} par table)
+
+    Returns:
+        Dictionnaire {table: nombre de lignes}
+    """
+    counts = {}
+    for model in models or EXPORT_COLUMNS:
+        table = model.__tablename__
+        counts[table] = export_table(
+            engine, model, os.path.join(directory, f'{table}.{fmt}'), fmt, batch_size=batch_size
+        )
+    return counts
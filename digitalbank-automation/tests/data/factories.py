@@ -6,15 +6,71 @@ Génération de données françaises réalistes
 import random
 import string
 from datetime import datetime, timedelta
-from typing import Optional, List
+from itertools import count as _counter, islice
+from typing import Optional, List, Iterable, Iterator, TypeVar, Union
 from faker import Faker
 
+from tests.data.iban import french_iban, generate_french_iban
 from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+from tests.data.records import UserRecord, AccountRecord, TransactionRecord, BeneficiaryRecord, BillRecord
+from tests.data.unique import unique
 
 
 # Instance Faker configurée pour la France
 fake = Faker('fr_FR')
 
+T = TypeVar('T')
+
+
+def unique_account_iban() -> str:
+    """
+    IBAN français unique pour un compte
+
+    Code banque + guichet dérivés de l'espace de noms (processus, worker,
+    shard), numéro de compte de 11 chiffres issu du compteur 'account_number' :
+    unicité garantie sans filtre ni limite de volume (10^11 comptes par espace).
+    """
+    code = unique.numeric_code(10)
+    return french_iban(code[:5], code[5:], f"{unique.reserve('account_number'):011d}")
+
+
+def chunks(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Découpe un itérable en listes de taille fixe (la dernière peut être plus courte)
+
+    Permet de consommer les générateurs iter_* par lots en mémoire constante:
+        for lot in chunks(TransactionFactory.iter_transactions(10_000_000, rows=True), 10_000):
+            conn.execute(insert(Transaction.__table__), lot)
+
+    Args:
+        iterable: Source (générateur, liste...)
+        size: Taille des lots
+
+    Returns:
+        Itérateur de listes
+    """
+    if size <= 0:
+        raise ValueError("La taille des lots doit être positive")
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _repeat(count: Optional[int]) -> Iterable[int]:
+    """range(count), ou compteur infini si count est None"""
+    return _counter() if count is None else range(count)
+
+
+def _builder(build_row, model, record, rows: bool = False, records: bool = False):
+    """Construction des générateurs iter_* : dictionnaire, enregistrement léger ou objet ORM"""
+    if rows:
+        return build_row
+    target = record if records else model
+    return lambda **kwargs: target(**build_row(**kwargs))
+
 
 def generate_valid_password() -> str:
     """Génère un mot de passe valide selon les critères DigitalBank"""
@@ -26,26 +82,43 @@ def generate_valid_password() -> str:
     return ''.join(random.sample(password, len(password)))
 
 
-def generate_french_iban() -> str:
-    """Génère un IBAN français formaté"""
-    bank_code = ''.join(random.choices(string.digits, k=5))
-    branch_code = ''.join(random.choices(string.digits, k=5))
-    account_number = ''.join(random.choices(string.digits, k=11))
-    check_digits = ''.join(random.choices(string.digits, k=2))
-    return f"FR76 {bank_code} {branch_code} {account_number} {check_digits}"
-
-
 class UserFactory:
     """Factory pour générer des utilisateurs de test"""
 
     @staticmethod
-    def build(
+    def build_row(
         email: Optional[str] = None,
         password: Optional[str] = None,
         name: Optional[str] = None,
         has_2fa: bool = False,
         totp_code: Optional[str] = None
-    ) -> User:
+    ) -> dict:
+        """
+        Construit les valeurs de colonnes d'un utilisateur (sans objet ORM)
+
+        Utilisé tel quel par les insertions en masse (SQLAlchemy Core).
+        Mêmes arguments que build().
+
+        Returns:
+            Dictionnaire {colonne: valeur}
+        """
+        return {
+            'email': email or unique.email(fake.user_name(), fake.free_email_domain()),
+            'password': password or generate_valid_password(),
+            'name': name or fake.name(),
+            'has_2fa': has_2fa,
+            'totp_code': totp_code or ('123456' if has_2fa else None),
+        }
+
+    @staticmethod
+    def build(
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        name: Optional[str] = None,
+        has_2fa: bool = False,
+        totp_code: Optional[str] = None,
+        records: bool = False
+    ) -> Union[User, UserRecord]:
         """
         Construit un objet User sans le persister
 
@@ -55,17 +128,13 @@ class UserFactory:
             name: Nom complet (auto-généré si None)
             has_2fa: Activation 2FA
             totp_code: Code TOTP si 2FA activée
+            records: Produire un UserRecord léger plutôt qu'un objet ORM
 
         Returns:
-            Instance User non persistée
+            Instance User non persistée (UserRecord si records=True)
         """
-        return User(
-            email=email or fake.email(),
-            password=password or generate_valid_password(),
-            name=name or fake.name(),
-            has_2fa=has_2fa,
-            totp_code=totp_code or ('123456' if has_2fa else None)
-        )
+        row = UserFactory.build_row(email, password, name, has_2fa, totp_code)
+        return UserRecord(**row) if records else User(**row)
 
     @staticmethod
     def standard_user() -> User:
@@ -94,9 +163,32 @@ class UserFactory:
         return UserFactory.build(has_2fa=has_2fa)
 
     @staticmethod
-    def batch(count: int, has_2fa: bool = False) -> List[User]:
-        """Génère plusieurs utilisateurs aléatoires"""
-        return [UserFactory.random_user(has_2fa) for _ in range(count)]
+    def iter_users(
+        count: Optional[int] = None,
+        has_2fa: bool = False,
+        rows: bool = False,
+        records: bool = False
+    ) -> Iterator[Union[User, UserRecord, dict]]:
+        """
+        Génère des utilisateurs aléatoires à la demande (générateur)
+
+        Args:
+            count: Nombre d'utilisateurs (infini si None)
+            has_2fa: Activation 2FA
+            rows: Produire des dictionnaires de colonnes plutôt que des objets ORM
+            records: Produire des UserRecord légers plutôt que des objets ORM
+
+        Returns:
+            Itérateur d'instances User (ou de dictionnaires si rows=True)
+        """
+        build = _builder(UserFactory.build_row, User, UserRecord, rows, records)
+        for _ in _repeat(count):
+            yield build(has_2fa=has_2fa)
+
+    @staticmethod
+    def batch(count: int, has_2fa: bool = False, records: bool = False) -> List[Union[User, UserRecord]]:
+        """Génère plusieurs utilisateurs aléatoires (UserRecord si records=True)"""
+        return list(UserFactory.iter_users(count, has_2fa, records=records))
 
 
 class AccountFactory:
@@ -105,12 +197,33 @@ class AccountFactory:
     ACCOUNT_TYPES = ["Compte Courant", "Livret A", "PEL", "Compte Joint"]
 
     @staticmethod
-    def build(
+    def build_row(
         user_id: Optional[int] = None,
         account_type: Optional[str] = None,
         number: Optional[str] = None,
         balance: Optional[float] = None
-    ) -> Account:
+    ) -> dict:
+        """
+        Construit les valeurs de colonnes d'un compte (sans objet ORM)
+
+        Returns:
+            Dictionnaire {colonne: valeur}
+        """
+        return {
+            'user_id': user_id,
+            'type': account_type or random.choice(AccountFactory.ACCOUNT_TYPES),
+            'number': number or unique_account_iban(),
+            'balance': balance if balance is not None else round(random.uniform(100, 10000), 2),
+        }
+
+    @staticmethod
+    def build(
+        user_id: Optional[int] = None,
+        account_type: Optional[str] = None,
+        number: Optional[str] = None,
+        balance: Optional[float] = None,
+        records: bool = False
+    ) -> Union[Account, AccountRecord]:
         """
         Construit un objet Account sans le persister
 
@@ -119,16 +232,13 @@ class AccountFactory:
             account_type: Type de compte
             number: Numéro IBAN
             balance: Solde du compte
+            records: Produire un AccountRecord léger plutôt qu'un objet ORM
 
         Returns:
-            Instance Account non persistée
+            Instance Account non persistée (AccountRecord si records=True)
         """
-        return Account(
-            user_id=user_id,
-            type=account_type or random.choice(AccountFactory.ACCOUNT_TYPES),
-            number=number or generate_french_iban(),
-            balance=balance if balance is not None else round(random.uniform(100, 10000), 2)
-        )
+        row = AccountFactory.build_row(user_id, account_type, number, balance)
+        return AccountRecord(**row) if records else Account(**row)
 
     @staticmethod
     def compte_courant(user_id: Optional[int] = None) -> Account:
@@ -154,9 +264,32 @@ class AccountFactory:
         return AccountFactory.build(user_id=user_id)
 
     @staticmethod
-    def batch(count: int, user_id: Optional[int] = None) -> List[Account]:
-        """Génère plusieurs comptes aléatoires"""
-        return [AccountFactory.random_account(user_id) for _ in range(count)]
+    def iter_accounts(
+        count: Optional[int] = None,
+        user_id: Optional[int] = None,
+        rows: bool = False,
+        records: bool = False
+    ) -> Iterator[Union[Account, AccountRecord, dict]]:
+        """
+        Génère des comptes aléatoires à la demande (générateur)
+
+        Args:
+            count: Nombre de comptes (infini si None)
+            user_id: ID de l'utilisateur propriétaire
+            rows: Produire des dictionnaires de colonnes plutôt que des objets ORM
+            records: Produire des AccountRecord légers plutôt que des objets ORM
+
+        Returns:
+            Itérateur d'instances Account (ou de dictionnaires si rows=True)
+        """
+        build = _builder(AccountFactory.build_row, Account, AccountRecord, rows, records)
+        for _ in _repeat(count):
+            yield build(user_id=user_id)
+
+    @staticmethod
+    def batch(count: int, user_id: Optional[int] = None, records: bool = False) -> List[Union[Account, AccountRecord]]:
+        """Génère plusieurs comptes aléatoires (AccountRecord si records=True)"""
+        return list(AccountFactory.iter_accounts(count, user_id, records=records))
 
 
 class TransactionFactory:
@@ -170,14 +303,45 @@ class TransactionFactory:
     ]
 
     @staticmethod
-    def build(
+    def build_row(
         account_id: Optional[int] = None,
         transaction_type: Optional[str] = None,
         amount: Optional[float] = None,
         description: Optional[str] = None,
         date: Optional[datetime] = None,
         reference: Optional[str] = None
-    ) -> Transaction:
+    ) -> dict:
+        """
+        Construit les valeurs de colonnes d'une transaction (sans objet ORM)
+
+        Returns:
+            Dictionnaire {colonne: valeur}
+        """
+        t_type = transaction_type or random.choice(['credit', 'debit'])
+        descriptions = (
+            TransactionFactory.DESCRIPTIONS_CREDIT if t_type == 'credit'
+            else TransactionFactory.DESCRIPTIONS_DEBIT
+        )
+
+        return {
+            'account_id': account_id,
+            'type': t_type,
+            'amount': amount if amount is not None else round(random.uniform(10, 500), 2),
+            'description': description or random.choice(descriptions),
+            'date': date or fake.date_time_between(start_date='-30d', end_date='now'),
+            'reference': reference or f"TRX-{fake.uuid4()[:8].upper()}",
+        }
+
+    @staticmethod
+    def build(
+        account_id: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+        amount: Optional[float] = None,
+        description: Optional[str] = None,
+        date: Optional[datetime] = None,
+        reference: Optional[str] = None,
+        records: bool = False
+    ) -> Union[Transaction, TransactionRecord]:
         """
         Construit un objet Transaction sans le persister
 
@@ -188,24 +352,15 @@ class TransactionFactory:
             description: Description
             date: Date de la transaction
             reference: Référence unique
+            records: Produire un TransactionRecord léger plutôt qu'un objet ORM
 
         Returns:
-            Instance Transaction non persistée
+            Instance Transaction non persistée (TransactionRecord si records=True)
         """
-        t_type = transaction_type or random.choice(['credit', 'debit'])
-        descriptions = (
-            TransactionFactory.DESCRIPTIONS_CREDIT if t_type == 'credit'
-            else TransactionFactory.DESCRIPTIONS_DEBIT
-        )
-
-        return Transaction(
-            account_id=account_id,
-            type=t_type,
-            amount=amount if amount is not None else round(random.uniform(10, 500), 2),
-            description=description or random.choice(descriptions),
-            date=date or fake.date_time_between(start_date='-30d', end_date='now'),
-            reference=reference or f"TRX-{fake.uuid4()[:8].upper()}"
+        row = TransactionFactory.build_row(
+            account_id, transaction_type, amount, description, date, reference
         )
+        return TransactionRecord(**row) if records else Transaction(**row)
 
     @staticmethod
     def credit(account_id: Optional[int] = None, amount: Optional[float] = None) -> Transaction:
@@ -226,20 +381,62 @@ class TransactionFactory:
         )
 
     @staticmethod
-    def batch(count: int, account_id: Optional[int] = None) -> List[Transaction]:
-        """Génère plusieurs transactions aléatoires"""
-        return [TransactionFactory.build(account_id=account_id) for _ in range(count)]
+    def iter_transactions(
+        count: Optional[int] = None,
+        account_id: Optional[int] = None,
+        rows: bool = False,
+        records: bool = False
+    ) -> Iterator[Union[Transaction, TransactionRecord, dict]]:
+        """
+        Génère des transactions aléatoires à la demande (générateur)
+
+        Args:
+            count: Nombre de transactions (infini si None)
+            account_id: ID du compte associé
+            rows: Produire des dictionnaires de colonnes plutôt que des objets ORM
+            records: Produire des TransactionRecord légers plutôt que des objets ORM
+
+        Returns:
+            Itérateur d'instances Transaction (ou de dictionnaires si rows=True)
+        """
+        build = _builder(TransactionFactory.build_row, Transaction, TransactionRecord, rows, records)
+        for _ in _repeat(count):
+            yield build(account_id=account_id)
+
+    @staticmethod
+    def batch(count: int, account_id: Optional[int] = None, records: bool = False) -> List[Union[Transaction, TransactionRecord]]:
+        """Génère plusieurs transactions aléatoires (TransactionRecord si records=True)"""
+        return list(TransactionFactory.iter_transactions(count, account_id, records=records))
 
 
 class BeneficiaryFactory:
     """Factory pour générer des bénéficiaires de virement"""
 
     @staticmethod
-    def build(
+    def build_row(
         user_id: Optional[int] = None,
         name: Optional[str] = None,
         iban: Optional[str] = None
-    ) -> Beneficiary:
+    ) -> dict:
+        """
+        Construit les valeurs de colonnes d'un bénéficiaire (sans objet ORM)
+
+        Returns:
+            Dictionnaire {colonne: valeur}
+        """
+        return {
+            'user_id': user_id,
+            'name': name or fake.name(),
+            'iban': iban or generate_french_iban(),
+        }
+
+    @staticmethod
+    def build(
+        user_id: Optional[int] = None,
+        name: Optional[str] = None,
+        iban: Optional[str] = None,
+        records: bool = False
+    ) -> Union[Beneficiary, BeneficiaryRecord]:
         """
         Construit un objet Beneficiary sans le persister
 
@@ -247,15 +444,13 @@ class BeneficiaryFactory:
             user_id: ID de l'utilisateur propriétaire
             name: Nom du bénéficiaire
             iban: IBAN du bénéficiaire
+            records: Produire un BeneficiaryRecord léger plutôt qu'un objet ORM
 
         Returns:
-            Instance Beneficiary non persistée
+            Instance Beneficiary non persistée (BeneficiaryRecord si records=True)
         """
-        return Beneficiary(
-            user_id=user_id,
-            name=name or fake.name(),
-            iban=iban or generate_french_iban()
-        )
+        row = BeneficiaryFactory.build_row(user_id, name, iban)
+        return BeneficiaryRecord(**row) if records else Beneficiary(**row)
 
     @staticmethod
     def marc_bernard(user_id: Optional[int] = None) -> Beneficiary:
@@ -281,9 +476,32 @@ class BeneficiaryFactory:
         return BeneficiaryFactory.build(user_id=user_id)
 
     @staticmethod
-    def batch(count: int, user_id: Optional[int] = None) -> List[Beneficiary]:
-        """Génère plusieurs bénéficiaires aléatoires"""
-        return [BeneficiaryFactory.random_beneficiary(user_id) for _ in range(count)]
+    def iter_beneficiaries(
+        count: Optional[int] = None,
+        user_id: Optional[int] = None,
+        rows: bool = False,
+        records: bool = False
+    ) -> Iterator[Union[Beneficiary, BeneficiaryRecord, dict]]:
+        """
+        Génère des bénéficiaires aléatoires à la demande (générateur)
+
+        Args:
+            count: Nombre de bénéficiaires (infini si None)
+            user_id: ID de l'utilisateur propriétaire
+            rows: Produire des dictionnaires de colonnes plutôt que des objets ORM
+            records: Produire des BeneficiaryRecord légers plutôt que des objets ORM
+
+        Returns:
+            Itérateur d'instances Beneficiary (ou de dictionnaires si rows=True)
+        """
+        build = _builder(BeneficiaryFactory.build_row, Beneficiary, BeneficiaryRecord, rows, records)
+        for _ in _repeat(count):
+            yield build(user_id=user_id)
+
+    @staticmethod
+    def batch(count: int, user_id: Optional[int] = None, records: bool = False) -> List[Union[Beneficiary, BeneficiaryRecord]]:
+        """Génère plusieurs bénéficiaires aléatoires (BeneficiaryRecord si records=True)"""
+        return list(BeneficiaryFactory.iter_beneficiaries(count, user_id, records=records))
 
 
 class BillFactory:
@@ -299,13 +517,39 @@ class BillFactory:
     ]
 
     @staticmethod
-    def build(
+    def build_row(
         provider: Optional[str] = None,
         reference: Optional[str] = None,
         amount: Optional[float] = None,
         due_date: Optional[datetime] = None,
         paid: bool = False
-    ) -> Bill:
+    ) -> dict:
+        """
+        Construit les valeurs de colonnes d'une facture (sans objet ORM)
+
+        Returns:
+            Dictionnaire {colonne: valeur}
+        """
+        prov_name, prov_prefix = random.choice(BillFactory.PROVIDERS)
+        year = datetime.now().year
+
+        return {
+            'provider': provider or prov_name,
+            'reference': reference or unique.reference(f"{prov_prefix}{year}-", 'bill_reference'),
+            'amount': amount if amount is not None else round(random.uniform(20, 200), 2),
+            'due_date': due_date or (datetime.now() + timedelta(days=random.randint(7, 30))),
+            'paid': paid,
+        }
+
+    @staticmethod
+    def build(
+        provider: Optional[str] = None,
+        reference: Optional[str] = None,
+        amount: Optional[float] = None,
+        due_date: Optional[datetime] = None,
+        paid: bool = False,
+        records: bool = False
+    ) -> Union[Bill, BillRecord]:
         """
         Construit un objet Bill sans le persister
 
@@ -315,20 +559,13 @@ class BillFactory:
             amount: Montant
             due_date: Date d'échéance
             paid: Facture payée ou non
+            records: Produire un BillRecord léger plutôt qu'un objet ORM
 
         Returns:
-            Instance Bill non persistée
+            Instance Bill non persistée (BillRecord si records=True)
         """
-        prov_name, prov_prefix = random.choice(BillFactory.PROVIDERS)
-        year = datetime.now().year
-
-        return Bill(
-            provider=provider or prov_name,
-            reference=reference or f"{prov_prefix}{year}-{random.randint(100000, 999999)}",
-            amount=amount if amount is not None else round(random.uniform(20, 200), 2),
-            due_date=due_date or (datetime.now() + timedelta(days=random.randint(7, 30))),
-            paid=paid
-        )
+        row = BillFactory.build_row(provider, reference, amount, due_date, paid)
+        return BillRecord(**row) if records else Bill(**row)
 
     @staticmethod
     def edf() -> Bill:
@@ -354,6 +591,27 @@ class BillFactory:
         return BillFactory.build()
 
     @staticmethod
-    def batch(count: int) -> List[Bill]:
-        """Génère plusieurs factures aléatoires"""
-        return [BillFactory.random_bill() for _ in range(count)]
+    def iter_bills(
+        count: Optional[int] = None,
+        rows: bool = False,
+        records: bool = False
+    ) -> Iterator[Union[Bill, BillRecord, dict]]:
+        """
+        Génère des factures aléatoires à la demande (générateur)
+
+        Args:
+            count: Nombre de factures (infini si None)
+            rows: Produire des dictionnaires de colonnes plutôt que des objets ORM
+            records: Produire des BillRecord légers plutôt que des objets ORM
+
+        Returns:
+            Itérateur d'instances Bill (ou de dictionnaires si rows=True)
+        """
+        build = _builder(BillFactory.build_row, Bill, BillRecord, rows, records)
+        for _ in _repeat(count):
+            yield build()
+
+    @staticmethod
+    def batch(count: int, records: bool = False) -> List[Union[Bill, BillRecord]]:
+        """Génère plusieurs factures aléatoires (BillRecord si records=True)"""
+        return list(BillFactory.iter_bills(count, records=records))
@@ -0,0 +1,279 @@
+"""
+IBAN valides (ISO 13616, clé mod 97) : génération et validation
+
+Format français : FRkk + BBAN de 23 caractères
+    code banque (5) + code guichet (5) + numéro de compte (11) + clé RIB (2)
+
+Affichage par groupes de 4 caractères (format attendu par la modale
+bénéficiaire de l'application) :
+    FR76 3000 6000 0112 3456 7890 189
+
+Fonctions unitaires (random) et vectorisées (NumPy) :
+- generate_french_iban() / generate_french_ibans(count, rng)
+- french_iban(banque, guichet, compte) / french_ibans(banque, guichet, comptes)
+  (numéros de compte fournis, ex. compteur de tests.data.unique)
+- is_valid_iban(iban) / validate_ibans(ibans)
+"""
+
+import random
+import string
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+# Longueur des IBAN par pays (contrôle optionnel de validate_ibans)
+IBAN_LENGTHS = {
+    'FR': 27, 'MC': 27, 'DE': 22, 'BE': 16, 'ES': 24, 'IT': 27,
+    'LU': 20, 'NL': 18, 'CH': 21, 'GB': 22, 'PT': 25,
+}
+
+# Conversion des lettres du numéro de compte pour la clé RIB
+_RIB_LETTERS = str.maketrans(
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    '12345678912345678923456789',
+)
+
+# Conversion des lettres en nombres pour le calcul mod 97 (A=10 ... Z=35)
+_LETTER_DIGITS = {ord(char): str(int(char, 36)) for char in string.ascii_uppercase}
+
+_MIN_LENGTH = 15
+_MAX_LENGTH = 34
+
+
+# ═══════════════════════════════════════════════════════════════
+# FONCTIONS UNITAIRES
+# ═══════════════════════════════════════════════════════════════
+
+def _mod97(value: str) -> int:
+    """Reste modulo 97 d'une chaîne alphanumérique (lettres A=10 ... Z=35)"""
+    return int(value.translate(_LETTER_DIGITS)) % 97
+
+
+def rib_key(bank_code: str, branch_code: str, account_number: str) -> str:
+    """
+    Clé RIB française (2 chiffres)
+
+    Args:
+        bank_code: Code banque (5 chiffres)
+        branch_code: Code guichet (5 chiffres)
+        account_number: Numéro de compte (11 caractères, lettres autorisées)
+    """
+    account = int(account_number.upper().translate(_RIB_LETTERS))
+    return f"{97 - (89 * int(bank_code) + 15 * int(branch_code) + 3 * account) % 97:02d}"
+
+
+def iban_check_digits(country: str, bban: str) -> str:
+    """Chiffres de contrôle ISO 13616 d'un BBAN (2 chiffres)"""
+    return f"{98 - _mod97(bban.upper() + country.upper() + '00'):02d}"
+
+
+def format_iban(iban: str) -> str:
+    """Format d'affichage : groupes de 4 caractères séparés par des espaces"""
+    compact = compact_iban(iban)
+    return ' '.join(compact[i:i + 4] for i in range(0, len(compact), 4))
+
+
+def compact_iban(iban: str) -> str:
+    """IBAN sans espaces, en majuscules"""
+    return ''.join(iban.split()).upper()
+
+
+def is_valid_iban(iban: str, country: Optional[str] = None) -> bool:
+    """
+    Vérifie la structure et la clé mod 97 d'un IBAN
+
+    Args:
+        iban: IBAN (avec ou sans espaces)
+        country: Code pays attendu (longueur contrôlée via IBAN_LENGTHS)
+    """
+    compact = compact_iban(iban)
+    if not (_MIN_LENGTH <= len(compact) <= _MAX_LENGTH) or not compact.isascii() or not compact.isalnum():
+        return False
+    if not (compact[:2].isalpha() and compact[2:4].isdigit()):
+        return False
+    if country is not None:
+        if compact[:2] != country.upper() or len(compact) != IBAN_LENGTHS.get(country.upper(), len(compact)):
+            return False
+    return _mod97(compact[4:] + compact[:4]) == 1
+
+
+def generate_french_iban(rng: Optional[random.Random] = None) -> str:
+    """
+    Génère un IBAN français valide (clé RIB et clé IBAN calculées)
+
+    Args:
+        rng: Générateur random (module random par défaut)
+
+    Returns:
+        IBAN formaté par groupes de 4 caractères
+    """
+    rng = rng or random
+    digits = ''.join(rng.choices(string.digits, k=21))
+    return french_iban(digits[:5], digits[5:10], digits[10:])
+
+
+def french_iban(bank_code: str, branch_code: str, account_number: str) -> str:
+    """
+    IBAN français d'un compte donné (clé RIB et clé IBAN calculées)
+
+    Args:
+        bank_code: Code banque (5 chiffres)
+        branch_code: Code guichet (5 chiffres)
+        account_number: Numéro de compte (11 caractères)
+
+    Returns:
+        IBAN formaté par groupes de 4 caractères
+    """
+    bban = bank_code + branch_code + account_number.upper() + rib_key(bank_code, branch_code, account_number)
+    return format_iban('FR' + iban_check_digits('FR', bban) + bban)
+
+
+# ═══════════════════════════════════════════════════════════════
+# FONCTIONS VECTORISÉES
+# ═══════════════════════════════════════════════════════════════
+
+# Gabarit d'affichage d'un IBAN français (# = caractère du BBAN)
+_FR_TEMPLATE = np.frombuffer(b'FR00 #### #### #### #### #### ###', dtype=np.uint8)
+_FR_SLOTS = np.flatnonzero(_FR_TEMPLATE == ord('#'))
+
+
+# Puissances de 10 modulo 97 (poids positionnels du calcul de clé)
+_POW10_MOD97 = np.array([pow(10, k, 97) for k in range(2 * _MAX_LENGTH + 1)], dtype=np.int16)
+
+# 'FR' (15, 27) + '00' placés après le BBAN pour le calcul de la clé
+_FR_SUFFIX = 152700
+
+
+def _to_int(digits: np.ndarray) -> np.ndarray:
+    """Valeur entière de chaque ligne d'une matrice de chiffres (<= 18 chiffres)"""
+    powers = 10 ** np.arange(digits.shape[1] - 1, -1, -1, dtype=np.int64)
+    return digits.astype(np.int64) @ powers
+
+
+def generate_french_ibans(count: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Génère count IBAN français valides en quelques opérations vectorisées
+
+    Args:
+        count: Nombre d'IBAN
+        rng: Générateur NumPy (np.random.default_rng() par défaut)
+
+    Returns:
+        Tableau de chaînes formatées par groupes de 4 caractères
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    return _format_french_ibans(rng.integers(0, 10, size=(count, 23), dtype=np.uint8))
+
+
+def french_ibans(bank_code: str, branch_code: str, accounts: np.ndarray) -> np.ndarray:
+    """
+    IBAN français d'un lot de numéros de compte numériques
+
+    Args:
+        bank_code: Code banque (5 chiffres)
+        branch_code: Code guichet (5 chiffres)
+        accounts: Numéros de compte entiers (0 <= n < 10^11, complétés à 11 chiffres)
+
+    Returns:
+        Tableau de chaînes formatées par groupes de 4 caractères
+    """
+    accounts = np.asarray(accounts, dtype=np.int64)
+    if accounts.size and (accounts.min() < 0 or accounts.max() >= 10 ** 11):
+        raise ValueError("Numéros de compte hors de [0, 10^11[")
+    digits = np.zeros((len(accounts), 23), dtype=np.uint8)
+    digits[:, :10] = np.frombuffer((bank_code + branch_code).encode('ascii'), dtype=np.uint8) - ord('0')
+    digits[:, 10:21] = accounts[:, None] // 10 ** np.arange(10, -1, -1, dtype=np.int64) % 10
+    return _format_french_ibans(digits)
+
+
+def _format_french_ibans(digits: np.ndarray) -> np.ndarray:
+    """Calcule clés RIB et IBAN d'une matrice (n, 23) de chiffres du BBAN, puis formate"""
+    count = len(digits)
+    bank, branch, account = _to_int(digits[:, :5]), _to_int(digits[:, 5:10]), _to_int(digits[:, 10:21])
+    key = 97 - (89 * bank + 15 * branch + 3 * account) % 97
+    digits[:, 21], digits[:, 22] = key // 10, key % 10
+
+    # Reste de BBAN + 'FR00' : somme des chiffres pondérés par 10^k mod 97
+    weights = _POW10_MOD97[np.arange(22, -1, -1) + 6].astype(np.int64)
+    check = 98 - (digits.astype(np.int64) @ weights + _FR_SUFFIX) % 97
+
+    matrix = np.tile(_FR_TEMPLATE, (count, 1))
+    matrix[:, 2] = ord('0') + check // 10
+    matrix[:, 3] = ord('0') + check % 10
+    matrix[:, _FR_SLOTS] = ord('0') + digits
+    width = matrix.shape[1]
+    return matrix.view(f'S{width}').ravel().astype(f'U{width}')
+
+
+def _char_tables():
+    """Tables indexées par code ASCII : classe (0 ignoré, 1 chiffre, 2 lettre, 3 invalide) et valeur"""
+    classes = np.full(256, 3, dtype=np.uint8)
+    values = np.zeros(256, dtype=np.int16)
+    classes[[ord(' '), 0]] = 0
+    for char in string.digits:
+        classes[ord(char)], values[ord(char)] = 1, int(char)
+    for char in string.ascii_letters:
+        classes[ord(char)], values[ord(char)] = 2, int(char, 36)
+    return classes, values
+
+
+_CHAR_CLASSES, _CHAR_VALUES = _char_tables()
+
+
+def validate_ibans(ibans: Iterable[str], country: Optional[str] = None) -> np.ndarray:
+    """
+    Valide un lot d'IBAN (structure + clé mod 97) sans boucle Python par élément
+
+    Les chaînes sont lues comme une matrice de caractères (n, largeur) sans
+    copie. Le reste modulo 97 de l'IBAN réarrangé (BBAN puis pays + clé) est
+    la somme des caractères (lettres A=10 ... Z=35) pondérés par 10^k mod 97,
+    k étant le nombre de chiffres qui les suivent : ni compactage des espaces
+    ni rotation explicite.
+
+    Args:
+        ibans: IBAN (avec ou sans espaces)
+        country: Code pays attendu (longueur contrôlée via IBAN_LENGTHS)
+
+    Returns:
+        Tableau de booléens (True = IBAN valide)
+    """
+    values = np.asarray(ibans if isinstance(ibans, np.ndarray) else list(ibans), dtype=str)
+    count = len(values)
+    width = values.dtype.itemsize // 4
+    if count == 0 or width == 0:
+        return np.zeros(count, dtype=bool)
+    codes = values.view(np.uint32).reshape(count, width)
+    valid = np.all(codes < 128, axis=1)
+    chars = codes.astype(np.uint8)
+    classes = _CHAR_CLASSES[chars]
+    numbers = _CHAR_VALUES[chars]
+
+    keep = classes != 0
+    is_letter = classes == 2
+    rank = np.cumsum(keep, axis=1, dtype=np.int16) - 1
+    lengths = rank[:, -1] + 1
+    head = keep & (rank < 4)
+
+    # Structure : longueur, caractères alphanumériques, 2 lettres puis 2 chiffres
+    valid &= (lengths >= _MIN_LENGTH) & (lengths <= _MAX_LENGTH)
+    valid &= ~np.any(classes == 3, axis=1)
+    valid &= ~np.any(head & (classes != np.where(rank < 2, 2, 1)), axis=1)
+    if country is not None:
+        for position, char in enumerate(country.upper()[:2]):
+            valid &= np.any((rank == position) & (numbers == int(char, 36)) & is_letter, axis=1)
+        if country.upper() in IBAN_LENGTHS:
+            valid &= lengths == IBAN_LENGTHS[country.upper()]
+
+    # Nombre de chiffres suivant chaque caractère dans l'IBAN réarrangé
+    sizes = keep.astype(np.int16)
+    sizes += is_letter
+    after = np.cumsum(sizes[:, ::-1], axis=1, dtype=np.int16)[:, ::-1] - sizes
+    head_digits = (sizes * head).sum(axis=1, dtype=np.int16)[:, None]
+    tail_digits = after[:, :1] + sizes[:, :1] - head_digits
+    following = np.where(head, after - tail_digits, after + head_digits)
+    # Chaînes trop longues (déjà invalides) : indices bornés à la table
+    np.clip(following, 0, len(_POW10_MOD97) - 1, out=following)
+
+    remainder = (numbers * _POW10_MOD97[following]).sum(axis=1, dtype=np.int64) % 97
+    return valid & (remainder == 1)
@@ -0,0 +1,214 @@
+"""
+Instrumentation SQL de la couche de données
+
+Les événements before_cursor_execute / after_cursor_execute de SQLAlchemy
+sont écoutés au niveau de la classe Engine : tous les engines (y compris
+ceux créés plus tard par DatabaseManager) sont couverts. Chaque requête est
+enregistrée par empreinte (texte normalisé : littéraux, paramètres et
+listes IN / VALUES remplacés), avec sa durée et son nombre de lignes.
+
+Le bilan d'un scope (un test, une commande de seed) donne :
+- les empreintes les plus coûteuses (durée cumulée, max, exécutions)
+- les motifs N+1 : un même SELECT exécuté au moins n fois dans le scope
+- les requêtes lentes (au-delà du seuil), aussi journalisées au fil de l'eau
+
+Exemple:
+    recorder = SQLRecorder(slow_query_ms=50)
+    recorder.install()
+    recorder.start('seed')
+    seed_standard_data()
+    summary = recorder.stop()
+    recorder.uninstall()
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_N_PLUS_ONE_THRESHOLD = 5
+DEFAULT_TOP = 5
+
+# Clé de la pile des instants de début dans Connection.info (curseurs imbriqués)
+_START_KEY = 'sql_recorder_start'
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NAMED_PARAMETER = re.compile(r"(?<!:):\w+|%\(\w+\)s|%s|\$\d+")
+_TUPLE = r"\(\s*\?(?:\s*,\s*\?)*\s*\)"
+_IN_LIST = re.compile(rf"\bIN\s*{_TUPLE}", re.IGNORECASE)
+_VALUES_LIST = re.compile(rf"\bVALUES\s*{_TUPLE}(?:\s*,\s*{_TUPLE})*", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Empreinte d'une requête : même texte pour des paramètres différents
+
+    Littéraux et paramètres deviennent '?', les listes IN (?, ?, ...) et les
+    VALUES multi-lignes deviennent '(?...)', les espaces sont normalisés.
+    """
+    normalized = _STRING_LITERAL.sub('?', statement)
+    normalized = _NAMED_PARAMETER.sub('?', normalized)
+    normalized = _NUMBER_LITERAL.sub('?', normalized)
+    normalized = _IN_LIST.sub('IN (?...)', normalized)
+    normalized = _VALUES_LIST.sub('VALUES (?...)', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+class SQLRecorder:
+    """Enregistre les requêtes SQL de tous les engines pendant un scope"""
+
+    def __init__(
+        self,
+        slow_query_ms: float = DEFAULT_SLOW_QUERY_MS,
+        n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD,
+        top: int = DEFAULT_TOP
+    ):
+        """
+        Args:
+            slow_query_ms: Seuil de requête lente en millisecondes (0 = désactivé)
+            n_plus_one_threshold: Exécutions d'un même SELECT signalées comme N+1
+            top: Nombre d'empreintes les plus coûteuses dans le bilan
+        """
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.top = top
+        self.label: Optional[str] = None
+        self._installed = False
+        # Requêtes exécutées depuis d'autres threads (restauration en arrière-plan)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._stats: Dict[str, dict] = defaultdict(
+            lambda: {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0}
+        )
+        self._slow: List[dict] = []
+
+    @property
+    def is_recording(self) -> bool:
+        """True entre start() et stop()"""
+        return self.label is not None
+
+    def install(self) -> None:
+        """Écoute les événements d'exécution de tous les engines"""
+        if self._installed:
+            return
+        event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._installed = True
+
+    def uninstall(self) -> None:
+        """Retire les écouteurs (aucun coût résiduel sur les requêtes)"""
+        if not self._installed:
+            return
+        event.remove(Engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.remove(Engine, 'after_cursor_execute', self._after_cursor_execute)
+        self._installed = False
+
+    def start(self, label: str) -> None:
+        """Démarre l'enregistrement d'un scope (un test, une commande)"""
+        with self._lock:
+            self._reset()
+            self.label = label
+
+    def stop(self) -> dict:
+        """
+        Termine le scope courant
+
+        Returns:
+            Bilan du scope (voir summary())
+        """
+        with self._lock:
+            summary = self._summary()
+            self.label = None
+            self._reset()
+        return summary
+
+    def summary(self) -> dict:
+        """
+        Bilan du scope courant
+
+        Returns:
+            Dictionnaire : label, statements, total_ms, slowest (top empreintes
+            par durée cumulée), n_plus_one (SELECT répétés), slow_queries
+        """
+        with self._lock:
+            return self._summary()
+
+    def _summary(self) -> dict:
+        entries = [
+            {
+                'fingerprint': statement,
+                'count': stats['count'],
+                'total_ms': round(stats['total_ms'], 3),
+                'max_ms': round(stats['max_ms'], 3),
+                'rows': stats['rows'],
+            }
+            for statement, stats in self._stats.items()
+        ]
+        entries.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        n_plus_one = [
+            entry for entry in entries
+            if entry['fingerprint'].upper().startswith('SELECT')
+            and self.n_plus_one_threshold
+            and entry['count'] >= self.n_plus_one_threshold
+        ]
+        return {
+            'label': self.label,
+            'statements': sum(entry['count'] for entry in entries),
+            'total_ms': round(sum(entry['total_ms'] for entry in entries), 3),
+            'slowest': entries[:self.top],
+            'n_plus_one': sorted(n_plus_one, key=lambda entry: entry['count'], reverse=True),
+            'slow_queries': list(self._slow),
+        }
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_START_KEY)
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        if not self.is_recording:
+            return
+        # rowcount vaut -1 pour un SELECT (lignes non encore lues)
+        rows = max(cursor.rowcount, 0)
+        key = fingerprint(statement)
+        with self._lock:
+            stats = self._stats[key]
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            stats['rows'] += rows
+            if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+                self._slow.append({'fingerprint': key, 'ms': round(elapsed_ms, 3), 'rows': rows})
+        if self.slow_query_ms and elapsed_ms >= self.slow_query_ms:
+            logger.warning("Requête lente (%.1f ms, %s) [%s]: %s", elapsed_ms, conn.engine.url, self.label, key)
+
+
+def format_summary(summary: dict) -> str:
+    """Bilan lisible (pièce jointe texte, sortie console)"""
+    lines = [f"{summary['statements']} requêtes, {summary['total_ms']:.1f} ms ({summary['label']})"]
+    if summary['slowest']:
+        lines.append("Empreintes les plus coûteuses :")
+        for entry in summary['slowest']:
+            lines.append(f"  {entry['total_ms']:>9.1f} ms  x{entry['count']:<6} max {entry['max_ms']:.1f} ms  "
+                         f"{entry['fingerprint']}")
+    if summary['n_plus_one']:
+        lines.append("Motifs N+1 probables :")
+        for entry in summary['n_plus_one']:
+            lines.append(f"  x{entry['count']:<6} {entry['fingerprint']}")
+    if summary['slow_queries']:
+        lines.append(f"Requêtes lentes : {len(summary['slow_queries'])}")
+    return '\n'.join(lines)
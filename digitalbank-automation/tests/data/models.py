@@ -1,12 +1,22 @@
 """
 Modèles SQLAlchemy pour les données de test DigitalBank
+
+Les index couvrent les recherches de tests.data.repository (comptes d'un
+utilisateur par solde, transactions d'un compte par période...).
+
+SCHEMA_VERSION est à incrémenter à chaque modification des modèles : le
+seeding incrémental (seed_state) réapplique alors les données de référence.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
+# Version du schéma (enregistrée dans seed_state par le seeding incrémental)
+SCHEMA_VERSION = 1
+
+
 class Base(DeclarativeBase):
     """Classe de base pour tous les modèles"""
     pass
@@ -15,6 +25,9 @@ class Base(DeclarativeBase):
 class User(Base):
     """Modèle utilisateur"""
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_has_2fa', 'has_2fa'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     email = Column(String(255), unique=True, nullable=False)
@@ -43,6 +56,9 @@ class User(Base):
 class Account(Base):
     """Modèle compte bancaire"""
     __tablename__ = 'accounts'
+    __table_args__ = (
+        Index('ix_accounts_user_balance', 'user_id', 'balance'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -69,6 +85,9 @@ class Account(Base):
 class Transaction(Base):
     """Modèle transaction bancaire"""
     __tablename__ = 'transactions'
+    __table_args__ = (
+        Index('ix_transactions_account_date', 'account_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     account_id = Column(Integer, ForeignKey('accounts.id'), nullable=False)
@@ -97,6 +116,10 @@ class Transaction(Base):
 class Beneficiary(Base):
     """Modèle bénéficiaire de virement"""
     __tablename__ = 'beneficiaries'
+    __table_args__ = (
+        Index('ix_beneficiaries_user_id', 'user_id'),
+        Index('uq_beneficiaries_user_iban', 'user_id', 'iban', unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -120,6 +143,9 @@ class Beneficiary(Base):
 class Bill(Base):
     """Modèle facture à payer"""
     __tablename__ = 'bills'
+    __table_args__ = (
+        Index('ix_bills_paid_due_date', 'paid', 'due_date'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     provider = Column(String(100), nullable=False)  # "EDF", "Orange", etc.
@@ -139,3 +165,14 @@ class Bill(Base):
             'due_date': self.due_date.isoformat() if self.due_date else None,
             'paid': self.paid,
         }
+
+
+class SeedState(Base):
+    """État du seeding des données de référence (seeding incrémental)"""
+    __tablename__ = 'seed_state'
+
+    name = Column(String(50), primary_key=True)
+    content_hash = Column(String(64), nullable=False)  # SHA-256 de test_users.json
+    schema_version = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)  # Lignes de référence appliquées (JSON)
+    seeded_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,189 @@
+"""
+Recherches typées dans la base de données de test DigitalBank
+
+Remplace les session.query ad hoc des tests pilotés par les données. Chaque
+recherche s'appuie sur un index des modèles (tests.data.models) et charge
+les relations utiles par selectinload (une requête par relation, pas de N+1).
+
+Exemple:
+    with get_db('dev').session() as session:
+        repo = DataRepository(session)
+        user = repo.pick_user(has_2fa=True)
+        comptes = repo.accounts_of_user(user.id, min_balance=1000)
+"""
+
+import random
+from datetime import datetime
+from typing import List, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+
+
+class DataRepository:
+    """Recherches de données de test sur une session SQLAlchemy"""
+
+    def __init__(self, session: Session):
+        """
+        Args:
+            session: Session ouverte (db.session(), fixture db_session...)
+        """
+        self.session = session
+
+    # ═══════════════════════════════════════════════════════════════
+    # UTILISATEURS
+    # ═══════════════════════════════════════════════════════════════
+
+    def user_by_email(self, email: str) -> Optional[User]:
+        """Utilisateur par email (index unique)"""
+        return self.session.scalars(select(User).where(User.email == email)).first()
+
+    def users_with_2fa(self, limit: Optional[int] = None, with_accounts: bool = False) -> List[User]:
+        """
+        Utilisateurs avec 2FA activée (index ix_users_has_2fa)
+
+        Args:
+            limit: Nombre maximal d'utilisateurs
+            with_accounts: Charger aussi leurs comptes (selectinload)
+        """
+        query = select(User).where(User.has_2fa.is_(True)).order_by(User.id).limit(limit)
+        if with_accounts:
+            query = query.options(selectinload(User.accounts))
+        return list(self.session.scalars(query))
+
+    def users_with_accounts(self, user_ids: Sequence[int]) -> List[User]:
+        """Utilisateurs avec comptes et bénéficiaires chargés (2 requêtes IN)"""
+        query = (
+            select(User)
+            .where(User.id.in_(user_ids))
+            .options(selectinload(User.accounts), selectinload(User.beneficiaries))
+            .order_by(User.id)
+        )
+        return list(self.session.scalars(query))
+
+    def pick_user(self, has_2fa: Optional[bool] = None, rng: Optional[random.Random] = None) -> Optional[User]:
+        """
+        Utilisateur tiré au hasard, sans ORDER BY RANDOM() (parcours complet)
+
+        Un identifiant est tiré entre min(id) et max(id), puis le premier
+        utilisateur d'identifiant supérieur ou égal est lu via la clé primaire.
+
+        Args:
+            has_2fa: Filtrer sur la 2FA (None = indifférent)
+            rng: Générateur random (module random par défaut)
+        """
+        rng = rng or random
+        conditions = [] if has_2fa is None else [User.has_2fa.is_(has_2fa)]
+        # Deux requêtes : SQLite n'optimise min/max par index qu'un agrégat à la fois
+        low = self.session.scalar(select(func.min(User.id)).where(*conditions))
+        high = self.session.scalar(select(func.max(User.id)).where(*conditions))
+        if low is None:
+            return None
+        target = rng.randint(low, high)
+        query = select(User).where(User.id >= target, *conditions).order_by(User.id).limit(1)
+        return self.session.scalars(query).first()
+
+    # ═══════════════════════════════════════════════════════════════
+    # COMPTES
+    # ═══════════════════════════════════════════════════════════════
+
+    def accounts_of_user(
+        self,
+        user_id: int,
+        min_balance: Optional[float] = None,
+        account_type: Optional[str] = None
+    ) -> List[Account]:
+        """
+        Comptes d'un utilisateur (index ix_accounts_user_balance)
+
+        Args:
+            user_id: ID de l'utilisateur
+            min_balance: Solde strictement supérieur à cette valeur
+            account_type: Type de compte ("Livret A"...)
+        """
+        query = select(Account).where(Account.user_id == user_id)
+        if min_balance is not None:
+            query = query.where(Account.balance > min_balance)
+        if account_type is not None:
+            query = query.where(Account.type == account_type)
+        return list(self.session.scalars(query.order_by(Account.id)))
+
+    def account_by_number(self, number: str) -> Optional[Account]:
+        """Compte par IBAN (index unique), avec son propriétaire"""
+        query = select(Account).where(Account.number == number).options(selectinload(Account.user))
+        return self.session.scalars(query).first()
+
+    # ═══════════════════════════════════════════════════════════════
+    # TRANSACTIONS
+    # ═══════════════════════════════════════════════════════════════
+
+    def transactions_of_account(
+        self,
+        account_id: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        transaction_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Transaction]:
+        """
+        Transactions d'un compte sur une période, plus récentes d'abord
+        (index ix_transactions_account_date)
+
+        Args:
+            account_id: ID du compte
+            start: Date minimale (incluse)
+            end: Date maximale (exclue)
+            transaction_type: "credit" ou "debit"
+            limit: Nombre maximal de transactions
+        """
+        query = select(Transaction).where(Transaction.account_id == account_id)
+        if start is not None:
+            query = query.where(Transaction.date >= start)
+        if end is not None:
+            query = query.where(Transaction.date < end)
+        if transaction_type is not None:
+            query = query.where(Transaction.type == transaction_type)
+        query = query.order_by(Transaction.date.desc()).limit(limit)
+        return list(self.session.scalars(query))
+
+    def accounts_with_transactions(
+        self,
+        user_id: int,
+        since: Optional[datetime] = None
+    ) -> List[Account]:
+        """
+        Comptes d'un utilisateur avec leurs transactions chargées (selectinload)
+
+        Args:
+            user_id: ID de l'utilisateur
+            since: Ne charger que les transactions à partir de cette date
+        """
+        loader = selectinload(Account.transactions)
+        if since is not None:
+            loader = selectinload(Account.transactions.and_(Transaction.date >= since))
+        query = select(Account).where(Account.user_id == user_id).options(loader).order_by(Account.id)
+        return list(self.session.scalars(query))
+
+    # ═══════════════════════════════════════════════════════════════
+    # BÉNÉFICIAIRES ET FACTURES
+    # ═══════════════════════════════════════════════════════════════
+
+    def beneficiaries_of_user(self, user_id: int) -> List[Beneficiary]:
+        """Bénéficiaires d'un utilisateur (index ix_beneficiaries_user_id)"""
+        query = select(Beneficiary).where(Beneficiary.user_id == user_id).order_by(Beneficiary.id)
+        return list(self.session.scalars(query))
+
+    def unpaid_bills(self, due_before: Optional[datetime] = None, limit: Optional[int] = None) -> List[Bill]:
+        """
+        Factures impayées, échéance la plus proche d'abord (index ix_bills_paid_due_date)
+
+        Args:
+            due_before: Échéance strictement antérieure à cette date
+            limit: Nombre maximal de factures
+        """
+        query = select(Bill).where(Bill.paid.is_(False))
+        if due_before is not None:
+            query = query.where(Bill.due_date < due_before)
+        return list(self.session.scalars(query.order_by(Bill.due_date).limit(limit)))
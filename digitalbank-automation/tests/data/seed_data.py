@@ -4,72 +4,127 @@ Peut être utilisé en ligne de commande ou via les hooks pytest
 """
 
 import argparse
+import os
 import sys
+import time
+from typing import Optional
 
-from tests.data.database import get_db, DatabaseManager
+import numpy as np
+from sqlalchemy import func, select
+
+from tests.data.change_tracking import ChangeTracker
+from tests.data.bulk_load import load_rows, reset_sequences
+from tests.data.database import BACKENDS, FILE_BACKEND, get_db, DatabaseManager
 from tests.data.data_manager import TestDataManager
+from tests.data.export import EXPORT_BATCH_SIZE, FORMATS, export_dataset
+from tests.data.instrumentation import SQLRecorder, format_summary
 from tests.data.factories import (
     UserFactory, AccountFactory, TransactionFactory,
-    BeneficiaryFactory, BillFactory
+    BeneficiaryFactory, BillFactory, chunks
 )
+from tests.data.sharding import seed_sharded, shard_range
 
 
-def seed_database(env: str = 'dev', verbose: bool = False) -> None:
+def seed_database(env: str = 'dev', verbose: bool = False, force: bool = False,
+                  backend: str = FILE_BACKEND) -> None:
     """
     Initialise la base de données avec les données de référence
 
+    Incrémental : rien n'est écrit si test_users.json et le schéma n'ont pas
+    changé depuis le dernier seeding (voir TestDataManager.seed_standard_data).
+
     Args:
         env: Environnement cible ('dev', 'int', 'uat', 'preprod')
         verbose: Afficher les détails
+        force: Réappliquer toutes les données de référence
+        backend: 'file' (défaut) ou 'server' (bloc database de l'environnement)
     """
     if verbose:
         print(f"[SEED] Initialisation de la base de données pour l'environnement '{env}'...")
 
-    manager = TestDataManager(env)
-    manager.seed_standard_data()
+    manager = TestDataManager(env, db=get_db(env, backend=backend))
+    changed = manager.seed_standard_data(force=force)
 
     if verbose:
-        print(f"[SEED] Base de données créée: {manager.db.db_path}")
-        print("[SEED] Données de référence insérées avec succès")
+        print(f"[SEED] Base de données: {manager.db.location}")
+        if changed:
+            print("[SEED] Données de référence insérées / mises à jour avec succès")
+        else:
+            print("[SEED] Données de référence déjà à jour (rien à faire)")
 
 
-def cleanup_database(env: str = 'dev', verbose: bool = False) -> None:
+def cleanup_database(env: str = 'dev', verbose: bool = False, backend: str = FILE_BACKEND) -> None:
     """
     Supprime toutes les données de la base
 
     Args:
         env: Environnement cible
         verbose: Afficher les détails
+        backend: 'file' (défaut) ou 'server'
     """
     if verbose:
         print(f"[CLEANUP] Suppression des données pour l'environnement '{env}'...")
 
-    manager = TestDataManager(env)
+    manager = TestDataManager(env, db=get_db(env, backend=backend))
     manager.cleanup()
 
     if verbose:
         print("[CLEANUP] Données supprimées avec succès")
 
 
-def reset_database(env: str = 'dev', verbose: bool = False) -> None:
+def reset_database(env: str = 'dev', verbose: bool = False, backend: str = FILE_BACKEND) -> None:
     """
-    Réinitialise complètement la base (drop + seed)
+    Réinitialise la base (drop + seed, ou restauration des seules lignes
+    modifiées si le suivi est actif : commande 'track')
 
     Args:
         env: Environnement cible
         verbose: Afficher les détails
+        backend: 'file' (défaut) ou 'server'
     """
     if verbose:
         print(f"[RESET] Réinitialisation de la base pour l'environnement '{env}'...")
 
-    manager = TestDataManager(env)
+    manager = TestDataManager(env, db=get_db(env, backend=backend))
     manager.reset()
 
     if verbose:
-        print(f"[RESET] Base de données réinitialisée: {manager.db.db_path}")
+        print(f"[RESET] Base de données réinitialisée: {manager.db.location}")
+
+
+def track_changes(env: str = 'dev', verbose: bool = False) -> None:
+    """
+    Active le reset différentiel (voir tests.data.change_tracking)
+
+    L'état courant de la base devient l'état de référence : les resets
+    suivants ne restaurent que les lignes modifiées.
+
+    Args:
+        env: Environnement cible
+        verbose: Afficher les détails
+    """
+    TestDataManager(env).track_changes()
+
+    if verbose:
+        print(f"[TRACK] Suivi des modifications activé pour l'environnement '{env}'")
 
 
-def seed_random_data(env: str = 'dev', count: int = 10, verbose: bool = False) -> None:
+def untrack_changes(env: str = 'dev', verbose: bool = False) -> None:
+    """
+    Désactive le reset différentiel (retour au drop/create + seed)
+
+    Args:
+        env: Environnement cible
+        verbose: Afficher les détails
+    """
+    ChangeTracker(get_db(env)).disable()
+
+    if verbose:
+        print(f"[TRACK] Suivi des modifications désactivé pour l'environnement '{env}'")
+
+
+def seed_random_data(env: str = 'dev', count: int = 10, verbose: bool = False,
+                     backend: str = FILE_BACKEND) -> None:
     """
     Ajoute des données aléatoires à la base
 
@@ -77,13 +132,14 @@ def seed_random_data(env: str = 'dev', count: int = 10, verbose: bool = False) -
         env: Environnement cible
         count: Nombre d'enregistrements par entité
         verbose: Afficher les détails
+        backend: 'file' (défaut) ou 'server'
     """
     from tests.data.models import User, Account, Transaction, Beneficiary, Bill
 
     if verbose:
         print(f"[SEED-RANDOM] Génération de {count} enregistrements par entité...")
 
-    db = get_db(env)
+    db = get_db(env, backend=backend)
     db.create_tables()
 
     with db.session() as session:
@@ -137,6 +193,312 @@ def seed_random_data(env: str = 'dev', count: int = 10, verbose: bool = False) -
         print("[SEED-RANDOM] Données aléatoires insérées avec succès")
 
 
+# Taille par défaut des lots pour les insertions en masse
+BULK_BATCH_SIZE = 10_000
+
+# Profil SQLite des insertions en masse (config/environments.yaml)
+BULK_PROFILE = 'seeding'
+
+
+def _bulk_insert(engine, table, rows, batch_size: int) -> int:
+    """
+    Insère des lignes par lots (COPY sur PostgreSQL, sinon Core executemany)
+
+    Chaque lot est inséré dans sa propre transaction.
+
+    Args:
+        engine: Engine SQLAlchemy
+        table: Table cible (Model.__table__)
+        rows: Itérable de dictionnaires {colonne: valeur}
+        batch_size: Nombre de lignes par lot
+
+    Returns:
+        Nombre de lignes insérées
+    """
+    total = 0
+    for batch in chunks(rows, batch_size):
+        with engine.begin() as conn:
+            total += load_rows(conn, table, batch)
+    return total
+
+
+def _next_id(conn, model) -> int:
+    """Premier identifiant libre d'une table (clés pré-calculées pour le bulk)"""
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def seed_random_data_bulk(
+    env: str = 'dev',
+    count: int = 10,
+    batch_size: int = BULK_BATCH_SIZE,
+    verbose: bool = False,
+    columnar: bool = False,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    backend: str = FILE_BACKEND
+) -> None:
+    """
+    Ajoute des données aléatoires en masse (SQLAlchemy Core, sans ORM)
+
+    Même volumétrie que seed_random_data() mais sans objets ORM : les
+    identifiants sont pré-calculés à partir du max(id) de chaque table, ce qui
+    permet de générer les clés étrangères sans flush ni relecture.
+
+    Args:
+        env: Environnement cible
+        count: Nombre d'utilisateurs (et de factures)
+        batch_size: Nombre de lignes par lot / transaction
+        verbose: Afficher les détails
+        columnar: Générer les lots en colonnes NumPy (tests.data.columnar)
+        workers: Nombre de processus (> 1 : génération columnaire par shards
+            puis fusion, voir tests.data.sharding)
+        seed: Graine de la génération columnaire (reproductible si fournie)
+        backend: 'file' (défaut) ou 'server' (chargement par COPY, sans shards)
+    """
+    from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+
+    if verbose:
+        mode = "columnaire" if columnar or workers > 1 else "ligne à ligne"
+        if workers > 1:
+            mode += f", {workers} processus"
+        print(f"[SEED-BULK] Génération de {count} enregistrements par entité "
+              f"(lots de {batch_size}, {mode})...")
+
+    db = get_db(env, profile=BULK_PROFILE, backend=backend)
+    db.create_tables()
+    engine = db.engine
+    tables = [model.__table__ for model in (User, Account, Transaction, Beneficiary, Bill)]
+
+    with engine.connect() as conn:
+        starts = {
+            model.__tablename__: _next_id(conn, model)
+            for model in (User, Account, Transaction, Beneficiary, Bill)
+        }
+
+    started = time.perf_counter()
+
+    if columnar or workers > 1:
+        if workers > 1:
+            counts = seed_sharded(db, count, batch_size, workers, starts, seed=seed, verbose=verbose)
+            if verbose:
+                for table, total in counts.items():
+                    print(f"  - {table}: {total} lignes")
+        else:
+            _seed_columnar(engine, count, batch_size, verbose, starts,
+                           rng=None if seed is None else np.random.default_rng(seed))
+        reset_sequences(engine, tables)
+        if verbose:
+            elapsed = time.perf_counter() - started
+            print(f"[SEED-BULK] Données insérées en {elapsed:.1f}s")
+        return
+
+    # Utilisateurs
+    users = (
+        {'id': starts['users'] + i, **UserFactory.build_row()}
+        for i in range(count)
+    )
+    total = _bulk_insert(engine, User.__table__, users, batch_size)
+    if verbose:
+        print(f"  - {total} utilisateurs créés")
+
+    # 2 comptes par utilisateur
+    accounts = (
+        {'id': starts['accounts'] + 2 * i + k, **AccountFactory.build_row(user_id=starts['users'] + i)}
+        for i in range(count)
+        for k in range(2)
+    )
+    total = _bulk_insert(engine, Account.__table__, accounts, batch_size)
+    if verbose:
+        print(f"  - {total} comptes créés")
+
+    # 5 transactions pour chacun des `count` premiers comptes créés
+    transactions = (
+        {'id': starts['transactions'] + 5 * i + k, **TransactionFactory.build_row(account_id=starts['accounts'] + i)}
+        for i in range(count)
+        for k in range(5)
+    )
+    total = _bulk_insert(engine, Transaction.__table__, transactions, batch_size)
+    if verbose:
+        print(f"  - {total} transactions créées")
+
+    # 3 bénéficiaires pour la moitié des utilisateurs
+    beneficiaries = (
+        {'id': starts['beneficiaries'] + 3 * i + k, **BeneficiaryFactory.build_row(user_id=starts['users'] + i)}
+        for i in range(count // 2)
+        for k in range(3)
+    )
+    total = _bulk_insert(engine, Beneficiary.__table__, beneficiaries, batch_size)
+    if verbose:
+        print(f"  - {total} bénéficiaires créés")
+
+    # Factures (référence rendue unique par l'identifiant)
+    bills = (
+        {'id': starts['bills'] + i, **row}
+        for i, row in enumerate(BillFactory.iter_bills(count, rows=True))
+    )
+    total = _bulk_insert(engine, Bill.__table__, bills, batch_size)
+    if verbose:
+        print(f"  - {total} factures créées")
+
+    reset_sequences(engine, tables)
+    if verbose:
+        elapsed = time.perf_counter() - started
+        print(f"[SEED-BULK] Données insérées en {elapsed:.1f}s")
+
+
+def _seed_columnar(engine, count, batch_size, verbose, starts, rng=None, shard=(0, 1)):
+    """
+    Insertion en masse à partir de lots générés en colonnes (NumPy)
+
+    Args:
+        starts: Premier identifiant de chaque table ({'users': ..., ...})
+        rng: Générateur NumPy (non reproductible par défaut)
+        shard: (index, nombre de shards) : seule la tranche du shard est
+            générée, avec identifiants et clés étrangères globaux
+            (voir tests.data.sharding)
+    """
+    from tests.data import columnar
+    from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+
+    rng = rng if rng is not None else columnar.default_rng()
+
+    def insert_columns(table, total, build):
+        low, high = shard_range(total, *shard)
+        inserted = 0
+        for offset in range(low, high, batch_size):
+            size = min(batch_size, high - offset)
+            for rows in columnar.iter_column_rows(build(offset, size), batch_size):
+                with engine.begin() as conn:
+                    inserted += load_rows(conn, table, rows)
+        return inserted
+
+    # Utilisateurs
+    total = insert_columns(User.__table__, count, lambda offset, size: columnar.user_columns(
+        columnar.id_range(starts['users'] + offset, size), rng
+    ))
+    if verbose:
+        print(f"  - {total} utilisateurs créés")
+
+    # 2 comptes par utilisateur
+    total = insert_columns(Account.__table__, count * 2, lambda offset, size: columnar.account_columns(
+        columnar.id_range(starts['accounts'] + offset, size),
+        starts['users'] + columnar.id_range(offset, size) // 2,
+        rng,
+    ))
+    if verbose:
+        print(f"  - {total} comptes créés")
+
+    # 5 transactions pour chacun des `count` premiers comptes créés
+    total = insert_columns(Transaction.__table__, count * 5, lambda offset, size: columnar.transaction_columns(
+        columnar.id_range(starts['transactions'] + offset, size),
+        starts['accounts'] + columnar.id_range(offset, size) // 5,
+        rng,
+    ))
+    if verbose:
+        print(f"  - {total} transactions créées")
+
+    # 3 bénéficiaires pour la moitié des utilisateurs
+    total = insert_columns(Beneficiary.__table__, (count // 2) * 3, lambda offset, size: columnar.beneficiary_columns(
+        columnar.id_range(starts['beneficiaries'] + offset, size),
+        starts['users'] + columnar.id_range(offset, size) // 3,
+        rng,
+    ))
+    if verbose:
+        print(f"  - {total} bénéficiaires créés")
+
+    # Factures
+    total = insert_columns(Bill.__table__, count, lambda offset, size: columnar.bill_columns(
+        columnar.id_range(starts['bills'] + offset, size), rng
+    ))
+    if verbose:
+        print(f"  - {total} factures créées")
+
+
+# ═══════════════════════════════════════════════════════════════
+# EXPORT
+# ═══════════════════════════════════════════════════════════════
+
+def export_data(env: str = 'dev', output: str = 'exports', fmt: str = 'ndjson',
+                batch_size: int = EXPORT_BATCH_SIZE, verbose: bool = False,
+                backend: str = FILE_BACKEND) -> None:
+    """
+    Exporte toutes les tables sans passer par l'ORM (voir tests.data.export)
+
+    Args:
+        env: Environnement cible
+        output: Répertoire de sortie ({table}.{fmt})
+        fmt: 'ndjson' ou 'csv'
+        batch_size: Nombre de lignes lues par lot
+        verbose: Afficher les détails
+        backend: 'file' (défaut) ou 'server'
+    """
+    started = time.perf_counter()
+    counts = export_dataset(get_db(env, backend=backend).engine, output, fmt, batch_size=batch_size)
+
+    if verbose:
+        elapsed = time.perf_counter() - started
+        print(f"[OK] Export {fmt} de l'environnement {env} vers {output} en {elapsed:.1f}s")
+        for table, count in counts.items():
+            print(f"  - {table}: {count} lignes")
+
+
+# ═══════════════════════════════════════════════════════════════
+# JEUX DE DONNÉES REPRODUCTIBLES
+# ═══════════════════════════════════════════════════════════════
+
+def load_dataset_profile(env: str = 'dev', profile: str = 'small', force: bool = False,
+                         verbose: bool = False) -> None:
+    """
+    Charge un jeu de données reproductible (voir tests.data.datasets)
+
+    Généré avec la graine du profil au premier appel (ou avec force), puis
+    copié depuis le cache : le contenu de la base est remplacé.
+
+    Args:
+        env: Environnement cible
+        profile: Profil du jeu (small, medium, large, xl)
+        force: Régénérer le jeu même s'il est en cache
+        verbose: Afficher les détails
+    """
+    from tests.data.datasets import build_dataset, load_dataset
+
+    if force:
+        build_dataset(profile, force=True, verbose=verbose)
+    load_dataset(get_db(env), profile, verbose=verbose)
+
+
+# ═══════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════
+
+def bench_seeding(sizes=None, methods=None, batch_size: int = BULK_BATCH_SIZE,
+                  output: Optional[str] = None, verbose: bool = False) -> str:
+    """
+    Mesure le débit des méthodes de seeding (voir tests.data.benchmark)
+
+    Les bases de mesure (test_data_bench_*.db) sont supprimées après usage.
+
+    Args:
+        sizes: Nombres de lignes par entité (défaut: DEFAULT_SIZES)
+        methods: Méthodes mesurées (défaut: orm, bulk, columnar)
+        batch_size: Nombre de lignes par lot / transaction
+        output: Fichier JSON (défaut: reports/benchmarks/seed-bench-{horodatage}.json)
+        verbose: Afficher chaque mesure
+
+    Returns:
+        Chemin du fichier JSON écrit
+    """
+    from tests.data.benchmark import DEFAULT_SIZES, METHODS, run_benchmark, write_benchmark
+
+    if verbose:
+        print("[BENCH] Mesure du débit de seeding (lignes/s, pic mémoire, taille de base)...")
+    result = run_benchmark(sizes or DEFAULT_SIZES, methods or METHODS, batch_size=batch_size, verbose=verbose)
+    path = write_benchmark(result, output)
+    if verbose:
+        print(f"[BENCH] Résultats écrits dans {path}")
+    return path
+
+
 # ═══════════════════════════════════════════════════════════════
 # HOOKS PYTEST
 # ═══════════════════════════════════════════════════════════════
@@ -174,6 +536,11 @@ def pytest_cleanup_hook(env: str = 'dev') -> None:
 # CLI
 # ═══════════════════════════════════════════════════════════════
 
+def _int_list(value: str):
+    """Liste d'entiers séparés par des virgules (option --sizes)"""
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
 def main():
     """Point d'entrée CLI"""
     parser = argparse.ArgumentParser(
@@ -183,15 +550,25 @@ def main():
 Exemples:
   python -m tests.data.seed_data seed --env=dev
   python -m tests.data.seed_data seed --env=uat -v
+  python -m tests.data.seed_data seed --env=dev --force -v
   python -m tests.data.seed_data cleanup --env=dev
   python -m tests.data.seed_data reset --env=int -v
+  python -m tests.data.seed_data track --env=dev -v
   python -m tests.data.seed_data random --env=dev --count=20 -v
+  python -m tests.data.seed_data random --env=dev --count=1000000 --bulk -v
+  python -m tests.data.seed_data random --env=dev --count=1000000 --columnar -v
+  python -m tests.data.seed_data random --env=dev --count=1000000 --workers=8 --seed=42 -v
+  python -m tests.data.seed_data export --env=dev --format=csv --output=exports -v
+  python -m tests.data.seed_data bench --sizes=1000,10000,100000 --methods=bulk,columnar -v
+  python -m tests.data.seed_data reset --env=dev --sql-stats --slow-query-ms=20
+  python -m tests.data.seed_data dataset --env=dev --profile=medium -v
+  DB_USER=digitalbank DB_PASSWORD=digitalbank python -m tests.data.seed_data random --env=dev --count=100000 --bulk --backend=server -v
         """
     )
 
     parser.add_argument(
         'command',
-        choices=['seed', 'cleanup', 'reset', 'random'],
+        choices=['seed', 'cleanup', 'reset', 'track', 'untrack', 'random', 'export', 'bench', 'dataset'],
         help="Commande à exécuter"
     )
     parser.add_argument(
@@ -211,18 +588,127 @@ Exemples:
         default=10,
         help="Nombre d'enregistrements pour la commande 'random' (défaut: 10)"
     )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help="Commande 'random' : insertion en masse via SQLAlchemy Core"
+    )
+    parser.add_argument(
+        '--columnar',
+        action='store_true',
+        help="Commande 'random' : insertion en masse avec génération columnaire NumPy"
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=BULK_BATCH_SIZE,
+        help=f"Taille des lots pour --bulk (défaut: {BULK_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help="Commande 'random' : nombre de processus de génération (shards fusionnés, 10 max, défaut: 1)"
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help="Commande 'random' : graine de la génération columnaire (reproductible)"
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help="Commande 'seed' : réappliquer les données de référence même si elles sont à jour ; "
+             "commande 'dataset' : régénérer le jeu même s'il est en cache"
+    )
+    parser.add_argument(
+        '--format',
+        default='ndjson',
+        choices=FORMATS,
+        help="Commande 'export' : format des fichiers (défaut: ndjson)"
+    )
+    parser.add_argument(
+        '--output',
+        default=None,
+        help="Commande 'export' : répertoire de sortie (défaut: exports) ; "
+             "commande 'bench' : fichier JSON (défaut: reports/benchmarks/seed-bench-*.json)"
+    )
+    parser.add_argument(
+        '--sizes',
+        type=_int_list,
+        default=None,
+        help="Commande 'bench' : nombres de lignes par entité, séparés par des virgules (défaut: 1000,10000)"
+    )
+    parser.add_argument(
+        '--methods',
+        type=lambda value: [method.strip() for method in value.split(',') if method.strip()],
+        default=None,
+        help="Commande 'bench' : méthodes mesurées parmi orm,bulk,columnar (défaut: toutes)"
+    )
+    parser.add_argument(
+        '--profile',
+        default='small',
+        help="Commande 'dataset' : profil du jeu de données reproductible "
+             "(small, medium, large, xl ; défaut: small)"
+    )
+    parser.add_argument(
+        '--backend',
+        default=os.getenv('DB_BACKEND') or FILE_BACKEND,
+        choices=[backend for backend in BACKENDS if backend != 'memory'],
+        help="Base cible: file (SQLite, défaut) ou server (bloc database de "
+             "config/environments.yaml, repli sur SQLite si non configuré)"
+    )
+    parser.add_argument(
+        '--sql-stats',
+        action='store_true',
+        help="Afficher le bilan SQL de la commande (empreintes les plus coûteuses, N+1, requêtes lentes)"
+    )
+    parser.add_argument(
+        '--slow-query-ms',
+        type=float,
+        default=100.0,
+        help="Avec --sql-stats : seuil des requêtes lentes en millisecondes (défaut: 100)"
+    )
 
     args = parser.parse_args()
 
+    recorder = None
+    if args.sql_stats:
+        recorder = SQLRecorder(slow_query_ms=args.slow_query_ms)
+        recorder.install()
+        recorder.start(args.command)
+
     try:
         if args.command == 'seed':
-            seed_database(args.env, args.verbose)
+            seed_database(args.env, args.verbose, force=args.force, backend=args.backend)
         elif args.command == 'cleanup':
-            cleanup_database(args.env, args.verbose)
+            cleanup_database(args.env, args.verbose, backend=args.backend)
         elif args.command == 'reset':
-            reset_database(args.env, args.verbose)
+            reset_database(args.env, args.verbose, backend=args.backend)
+        elif args.command == 'track':
+            track_changes(args.env, args.verbose)
+        elif args.command == 'untrack':
+            untrack_changes(args.env, args.verbose)
+        elif args.command == 'random' and (args.bulk or args.columnar or args.workers > 1):
+            seed_random_data_bulk(
+                args.env, args.count, args.batch_size, args.verbose,
+                columnar=args.columnar, workers=args.workers, seed=args.seed,
+                backend=args.backend
+            )
         elif args.command == 'random':
-            seed_random_data(args.env, args.count, args.verbose)
+            seed_random_data(args.env, args.count, args.verbose, backend=args.backend)
+        elif args.command == 'export':
+            export_data(args.env, args.output or 'exports', args.format, verbose=args.verbose,
+                        backend=args.backend)
+        elif args.command == 'bench':
+            bench_seeding(args.sizes, args.methods, args.batch_size, args.output, args.verbose)
+        elif args.command == 'dataset':
+            load_dataset_profile(args.env, args.profile, force=args.force, verbose=args.verbose)
+
+        if recorder is not None:
+            print(f"\n[SQL] {format_summary(recorder.stop())}")
+            recorder.uninstall()
 
         if args.verbose:
             print("\n[OK] Opération terminée avec succès")
@@ -230,6 +716,10 @@ Exemples:
     except Exception as e:
         print(f"[ERREUR] {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        # Fermeture des connexions : le WAL des profils shared / seeding est
+        # reporté dans le fichier principal (lisible en immutable=1)
+        DatabaseManager.close_all()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,188 @@
+"""
+Génération multi-processus des gros volumes (shards) puis fusion
+
+Chaque processus génère, en colonnes NumPy, une tranche disjointe des
+identifiants de chaque entité (utilisateurs, comptes, transactions,
+bénéficiaires, factures) dans sa propre base SQLite
+test_data_{env}_shard{n}.db. Les identifiants et clés étrangères sont
+globaux : la fusion attache tous les shards à la base cible et les recopie
+(INSERT ... SELECT, tables parentes d'abord) en une seule transaction, et
+l'intégrité référentielle est celle d'une génération mono-processus. Un
+échec pendant la fusion laisse la base cible inchangée.
+
+SQLite limite le nombre de bases attachées (SQLITE_MAX_ATTACHED, 10 par
+défaut) : MAX_SHARDS processus au plus.
+
+Reproductibilité : les générateurs des shards dérivent d'une graine unique
+(np.random.SeedSequence.spawn) ; l'espace de noms des valeurs uniques est
+suffixé par le numéro de shard (DATA_SHARD).
+
+Exemple:
+    python -m tests.data.seed_data random --env=dev --count=1000000 --workers=8 --seed=42 -v
+"""
+
+import multiprocessing
+import os
+import random
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tests.data.database import DatabaseManager, get_db
+from tests.data.models import User, Account, Transaction, Beneficiary, Bill
+from tests.data.unique import SHARD_ENV, unique
+
+
+# Ordre de fusion (tables parentes d'abord)
+MERGE_ORDER = (User, Account, Transaction, Beneficiary, Bill)
+
+# Bases attachables simultanément (SQLITE_MAX_ATTACHED par défaut)
+MAX_SHARDS = 10
+
+
+def shard_range(total: int, index: int, workers: int) -> Tuple[int, int]:
+    """Tranche [début, fin) des décalages 0..total attribuée au shard index"""
+    return total * index // workers, total * (index + 1) // workers
+
+
+def shard_env(env: str, index: int) -> str:
+    """Nom d'environnement de la base d'un shard (fichier test_data_{env}_shard{n}.db)"""
+    return f"{env}_shard{index}"
+
+
+def shard_seeds(workers: int, seed: Optional[int] = None) -> List[np.random.SeedSequence]:
+    """Graines indépendantes des shards, dérivées d'une graine unique (aléatoire si None)"""
+    return np.random.SeedSequence(seed).spawn(workers)
+
+
+def _remove_database(path: str) -> None:
+    for suffix in ('', '-journal', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _generate_shard(env: str, index: int, workers: int, count: int, batch_size: int,
+                    starts: Dict[str, int], seed_sequence: np.random.SeedSequence,
+                    namespace: str, profile: str) -> str:
+    """Génère la tranche index/workers dans la base du shard (processus fils)"""
+    from tests.data.factories import fake
+    from tests.data.seed_data import _seed_columnar
+
+    os.environ[SHARD_ENV] = str(index)
+    unique.reset(f"{namespace}s{index}")
+    seed = int(seed_sequence.generate_state(1)[0])
+    random.seed(seed)
+    fake.seed_instance(seed)
+
+    db = get_db(shard_env(env, index), profile=profile)
+    _remove_database(db.db_path)
+    db.create_tables()
+    _seed_columnar(db.engine, count, batch_size, False, starts,
+                   rng=np.random.default_rng(seed_sequence), shard=(index, workers))
+    # Processus réutilisé par le pool : instance du shard retirée du registre
+    db.close()
+    return db.db_path
+
+
+def merge_shards(target_path: str, shard_paths: Sequence[str], remove: bool = True) -> Dict[str, int]:
+    """
+    Fusionne les bases des shards dans la base cible (une seule transaction)
+
+    Tous les shards sont attachés avant le BEGIN : en cas d'échec, rien
+    n'est fusionné.
+
+    Args:
+        target_path: Base cible (tables déjà créées)
+        shard_paths: Bases des shards (MAX_SHARDS au plus)
+        remove: Supprimer les bases des shards après fusion
+
+    Returns:
+        Dictionnaire {table: lignes fusionnées}
+
+    Raises:
+        ValueError: Plus de MAX_SHARDS bases à fusionner
+    """
+    if len(shard_paths) > MAX_SHARDS:
+        raise ValueError(f"Fusion limitée à {MAX_SHARDS} shards (bases attachées): {len(shard_paths)}")
+    counts = {model.__tablename__: 0 for model in MERGE_ORDER}
+    aliases = [f"shard{index}" for index in range(len(shard_paths))]
+    # isolation_level=None : ATTACH est interdit dans une transaction ouverte
+    with closing(sqlite3.connect(target_path, isolation_level=None)) as conn:
+        try:
+            for alias, path in zip(aliases, shard_paths):
+                conn.execute("ATTACH DATABASE ? AS " + alias, (path,))
+            conn.execute("BEGIN")
+            try:
+                for model in MERGE_ORDER:
+                    table = model.__tablename__
+                    columns = ', '.join(column.name for column in model.__table__.columns)
+                    for alias in aliases:
+                        cursor = conn.execute(
+                            f"INSERT INTO main.{table} ({columns}) SELECT {columns} FROM {alias}.{table}"
+                        )
+                        counts[table] += cursor.rowcount
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+            for alias in aliases:
+                if alias in attached:
+                    conn.execute("DETACH DATABASE " + alias)
+    if remove:
+        for path in shard_paths:
+            _remove_database(path)
+    return counts
+
+
+def seed_sharded(db: DatabaseManager, count: int, batch_size: int, workers: int,
+                 starts: Dict[str, int], seed: Optional[int] = None,
+                 profile: Optional[str] = None, verbose: bool = False) -> Dict[str, int]:
+    """
+    Génère `count` enregistrements par entité sur `workers` processus puis fusionne
+
+    Args:
+        db: Base cible (fichier)
+        count: Nombre d'utilisateurs (volumétrie de seed_random_data_bulk)
+        batch_size: Nombre de lignes par lot
+        workers: Nombre de processus (MAX_SHARDS au plus)
+        starts: Premier identifiant de chaque table ({'users': ..., ...})
+        seed: Graine globale (reproductible si fournie)
+        profile: Profil SQLite des bases des shards
+        verbose: Afficher les détails
+
+    Returns:
+        Dictionnaire {table: lignes fusionnées}
+
+    Raises:
+        ValueError: Base mémoire ou serveur, ou plus de MAX_SHARDS processus
+    """
+    if db.is_memory or db.is_server:
+        raise ValueError("La génération par shards cible une base fichier")
+    if workers > MAX_SHARDS:
+        raise ValueError(f"Génération par shards limitée à {MAX_SHARDS} processus: {workers}")
+    started = time.perf_counter()
+    seeds = shard_seeds(workers, seed)
+    # spawn : processus neufs, sans connexions SQLite héritées du parent
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(_generate_shard, db.env, index, workers, count, batch_size, starts,
+                        seeds[index], unique.namespace, profile or db.profile)
+            for index in range(workers)
+        ]
+        shard_paths = [future.result() for future in futures]
+    generated = time.perf_counter()
+
+    db.engine.dispose()
+    counts = merge_shards(db.db_path, shard_paths)
+
+    if verbose:
+        print(f"[SEED-SHARD] {workers} shards générés en {generated - started:.1f}s, "
+              f"fusionnés en {time.perf_counter() - generated:.1f}s")
+    return counts
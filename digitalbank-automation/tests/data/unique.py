@@ -0,0 +1,239 @@
+"""
+Génération de valeurs uniques pour les colonnes unique=True
+
+Les factories tirent emails, numéros de compte et références au hasard : sur
+de gros volumes, les doublons provoquent des IntegrityError. Ce module garantit
+l'unicité sans aller-retour en base, selon quatre schémas :
+
+- suffixe compteur : espace de noms du processus + compteur par clé
+  (ex. jean.dupont.k3j9x2gw1-42@free.fr, EDF-2026-K3J9X2GW1-42)
+- hachage à clé : jeton déterministe dérivé d'une clé naturelle (blake2b)
+- code numérique : formats à chiffres imposés (ex. numéros de compte des
+  IBAN : code banque/guichet dérivé de l'espace de noms + compteur)
+- tirage contrôlé : nouveau tirage tant que la valeur a déjà été vue
+  (filtre de Bloom, mémoire bornée, aucun faux négatif) ; réservé aux
+  petits volumes, sans garantie entre processus
+
+L'espace de noms combine un jeton aléatoire tiré au démarrage du processus
+et le shard courant (worker xdist PYTEST_XDIST_WORKER ou DATA_SHARD) : deux
+lots, processus, workers ou sessions ne produisent jamais le même suffixe.
+UNIQUE_NAMESPACE force un espace de noms fixe (jeux de données reproductibles).
+"""
+
+import hashlib
+import math
+import os
+import secrets
+import string
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+
+# Alphabet des jetons (base 36)
+_ALPHABET = string.digits + string.ascii_lowercase
+
+# Longueur du jeton aléatoire de processus (36^6 ≈ 2 milliards)
+TOKEN_LENGTH = 6
+
+NAMESPACE_ENV = "UNIQUE_NAMESPACE"
+SHARD_ENV = "DATA_SHARD"
+
+
+def _base36(value: int) -> str:
+    digits = []
+    while True:
+        value, rest = divmod(value, 36)
+        digits.append(_ALPHABET[rest])
+        if value == 0:
+            return ''.join(reversed(digits))
+
+
+def default_namespace() -> str:
+    """
+    Espace de noms du processus courant
+
+    UNIQUE_NAMESPACE s'il est défini, sinon jeton aléatoire + shard
+    (worker xdist 'gw1', DATA_SHARD, ou rien pour un processus isolé).
+    """
+    if os.getenv(NAMESPACE_ENV):
+        return os.getenv(NAMESPACE_ENV).lower()
+    token = ''.join(secrets.choice(_ALPHABET) for _ in range(TOKEN_LENGTH))
+    shard = os.getenv("PYTEST_XDIST_WORKER") or os.getenv(SHARD_ENV) or ''
+    return f"{token}{shard}".lower()
+
+
+class BloomFilter:
+    """
+    Filtre de Bloom : appartenance approximative en mémoire bornée
+
+    Pas de faux négatif : une valeur ajoutée est toujours reconnue. Les faux
+    positifs (taux error_rate à pleine capacité) ne provoquent qu'un tirage
+    supplémentaire dans UniqueValueGenerator.draw().
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        """
+        Args:
+            capacity: Nombre d'éléments attendus
+            error_rate: Taux de faux positifs visé à pleine capacité
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("Capacité positive et taux d'erreur dans ]0, 1[ requis")
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str) -> Iterator[int]:
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (first + i * second) % self.size
+
+    def add(self, value: str) -> bool:
+        """
+        Ajoute une valeur
+
+        Returns:
+            True si la valeur était absente (au faux positif près)
+        """
+        added = False
+        bits = self.bits
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class UniqueValueGenerator:
+    """Valeurs uniques par suffixe compteur, hachage à clé ou tirage contrôlé"""
+
+    def __init__(self, namespace: Optional[str] = None, bloom_capacity: int = 1_000_000,
+                 bloom_error_rate: float = 1e-4):
+        """
+        Args:
+            namespace: Espace de noms (default_namespace() si None)
+            bloom_capacity: Capacité des filtres de Bloom de draw()
+            bloom_error_rate: Taux de faux positifs des filtres de Bloom
+        """
+        self.namespace = namespace or default_namespace()
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self._counters: Dict[str, int] = {}
+        self._filters: Dict[str, BloomFilter] = {}
+        self._lock = threading.Lock()
+
+    def reset(self, namespace: Optional[str] = None):
+        """Réinitialise compteurs et filtres (nouvel espace de noms si fourni)"""
+        with self._lock:
+            if namespace is not None:
+                self.namespace = namespace
+            self._counters.clear()
+            self._filters.clear()
+
+    @contextmanager
+    def isolated(self, namespace: str) -> Iterator[None]:
+        """
+        Espace de noms temporaire, compteurs et filtres neufs
+
+        Compteurs et filtres courants sont rétablis en sortie : les valeurs
+        tirées ensuite ne recoupent pas celles tirées avant le bloc.
+        """
+        with self._lock:
+            saved = (self.namespace, dict(self._counters), dict(self._filters))
+        self.reset(namespace)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.namespace, counters, filters = saved
+                self._counters = counters
+                self._filters = filters
+
+    def reserve(self, key: str, count: int = 1) -> int:
+        """
+        Réserve count valeurs consécutives du compteur d'une clé
+
+        Utilisé par la génération columnaire pour suffixer un lot entier
+        (f"{namespace}-{start + i}") sans appel par ligne.
+
+        Returns:
+            Première valeur réservée
+        """
+        with self._lock:
+            start = self._counters.get(key, 0)
+            self._counters[key] = start + count
+            return start
+
+    def suffix(self, key: str = 'default') -> str:
+        """Suffixe unique pour une clé : espace de noms + compteur"""
+        return f"{self.namespace}-{self.reserve(key)}"
+
+    def email(self, local: str, domain: str) -> str:
+        """Email unique : partie locale suffixée (ex. jean.dupont.k3j9x2-42@free.fr)"""
+        return f"{local}.{self.suffix('email')}@{domain}"
+
+    def reference(self, prefix: str, key: Optional[str] = None) -> str:
+        """Référence unique (majuscules) : prefix + suffixe (compteur de key, prefix par défaut)"""
+        return f"{prefix}{self.suffix(key or prefix).upper()}"
+
+    def keyed(self, natural_key: str, length: int = 12) -> str:
+        """
+        Jeton déterministe dérivé d'une clé naturelle (hachage blake2b à clé)
+
+        Même clé naturelle et même espace de noms => même jeton ; deux clés
+        différentes ne collisionnent qu'avec une probabilité négligeable.
+        """
+        digest = hashlib.blake2b(
+            natural_key.encode('utf-8'), digest_size=16, key=self.namespace.encode('utf-8')[:64]
+        ).digest()
+        return _base36(int.from_bytes(digest, 'big'))[:length]
+
+    def numeric_code(self, length: int = 10) -> str:
+        """
+        Code numérique déterministe de l'espace de noms (blake2b)
+
+        Associé à reserve(), forme des valeurs uniques à chiffres imposés :
+        deux espaces de noms (processus, workers, shards) ne partagent un
+        code qu'avec une probabilité de l'ordre de 10^-length.
+        """
+        digest = hashlib.blake2b(self.namespace.encode('utf-8'), digest_size=16).digest()
+        return f"{int.from_bytes(digest, 'big') % 10 ** length:0{length}d}"
+
+    def draw(self, generate: Callable[[], str], key: str, max_attempts: int = 100) -> str:
+        """
+        Tire une valeur jamais vue pour cette clé (filtre de Bloom)
+
+        Les faux positifs croissent au-delà de bloom_capacity valeurs : pour
+        les gros volumes, préférer reserve() (compteur sans limite).
+
+        Args:
+            generate: Fonction de tirage (ex. generate_french_iban)
+            key: Colonne ou famille de valeurs
+            max_attempts: Nombre maximal de tirages
+
+        Raises:
+            RuntimeError: Aucune valeur nouvelle après max_attempts tirages
+        """
+        with self._lock:
+            seen = self._filters.get(key)
+            if seen is None:
+                seen = self._filters[key] = BloomFilter(self.bloom_capacity, self.bloom_error_rate)
+        for _ in range(max_attempts):
+            value = generate()
+            with self._lock:
+                if seen.add(value):
+                    return value
+        raise RuntimeError(f"Aucune valeur unique pour '{key}' après {max_attempts} tirages")
+
+
+# Générateur partagé par les factories
+unique = UniqueValueGenerator()
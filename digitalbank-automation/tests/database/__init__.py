@@ -0,0 +1,3 @@
+"""
+Package database - Tests de la couche de données de test
+"""
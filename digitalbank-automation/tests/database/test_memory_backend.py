@@ -0,0 +1,87 @@
+"""
+Tests de la base en mémoire partagée (backend 'memory') avec db_session
+
+Base dédiée, indépendante des options --env / --db-backend de la session.
+"""
+
+import pytest
+import allure
+from sqlalchemy import text
+
+from tests.data import data_manager
+from tests.data.database import MEMORY_BACKEND, get_db
+from tests.data.models import User
+
+ENV = "db_session_memory"
+RENAMED = "Nom modifié par db_session"
+
+
+@pytest.fixture(scope="module")
+def test_db():
+    """Remplace la base de session : base mémoire seedée avec les données de référence"""
+    db = get_db(ENV, backend=MEMORY_BACKEND)
+    db.create_tables()
+    data_manager.TestDataManager(ENV, db=db).seed_standard_data()
+    return db
+
+
+@allure.epic("DigitalBank")
+@allure.feature("Données de test")
+class TestMemoryBackendSession:
+    """Isolation db_session sur une base mémoire (cache partagé, verrous par table)"""
+
+    @allure.story("Backend mémoire")
+    @allure.title("Lecture par une autre connexion du pool pendant db_session")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    def test_pooled_read_during_session(self, test_db, db_session):
+        """
+        TC-DATA-001: Pas de "database table is locked" pendant la transaction du test
+
+        Étapes:
+        1. Modifier un utilisateur dans db_session (commit = savepoint)
+        2. Relire la table via test_db.session() et via une autre connexion du pool
+
+        Résultat attendu:
+        - Les deux lectures aboutissent et voient la modification
+        """
+        user = db_session.query(User).order_by(User.id).first()
+        user.name = RENAMED
+        db_session.commit()
+
+        with test_db.session() as session:
+            assert session.get(User, user.id).name == RENAMED
+        with test_db.engine.connect() as conn:
+            name = conn.execute(text("SELECT name FROM users WHERE id = :id"), {"id": user.id}).scalar()
+        assert name == RENAMED
+
+    @allure.story("Backend mémoire")
+    @allure.title("Écritures annulées en sortie de transactional_scope")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.regression
+    def test_scope_rolled_back(self, test_db):
+        """
+        TC-DATA-002: Les écritures validées dans le scope sont annulées en sortie
+
+        Étapes:
+        1. Renommer un utilisateur dans transactional_scope (commit = savepoint)
+        2. Sortir du scope puis relire l'utilisateur
+
+        Résultat attendu:
+        - Le nom d'origine est rétabli
+        """
+        with test_db.session() as session:
+            user = session.query(User).order_by(User.id).first()
+            user_id, original = user.id, user.name
+
+        with test_db.transactional_scope() as factory:
+            session = factory()
+            try:
+                session.get(User, user_id).name = RENAMED
+                session.commit()
+                assert session.get(User, user_id).name == RENAMED
+            finally:
+                session.close()
+
+        with test_db.session() as session:
+            assert session.get(User, user_id).name == original
@@ -0,0 +1,3 @@
+"""
+Package performance - Tests de performance DigitalBank
+"""
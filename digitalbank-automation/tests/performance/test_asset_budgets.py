@@ -0,0 +1,53 @@
+"""
+Tests de budgets de poids et de requêtes DigitalBank
+"""
+
+import json
+import pytest
+import allure
+
+from tests.utils.asset_budget import check_asset_budgets
+from tests.utils.pages.login_page import LoginPage
+from tests.utils.pages.dashboard_page import DashboardPage
+
+
+@allure.epic("DigitalBank")
+@allure.feature("Performance")
+class TestAssetBudgets:
+    """Contrôle du poids des ressources chargées par page et par onglet"""
+
+    @allure.story("Budgets de ressources")
+    @allure.title("Poids et nombre de requêtes dans les budgets")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    @pytest.mark.regression
+    def test_asset_budgets(self, web_driver, asset_recorder, standard_user, test_config):
+        """
+        TC-PERF-002: Budgets de ressources par page/onglet
+
+        Étapes:
+        1. Charger l'application (page de connexion)
+        2. Se connecter puis parcourir chaque onglet
+
+        Résultat attendu:
+        - Aucun dépassement des budgets asset_budgets (test_config.yaml)
+        """
+        login_page = LoginPage(web_driver)
+        dashboard = DashboardPage(web_driver)
+
+        asset_recorder.mark("dashboard")
+        login_page.login(standard_user['email'], standard_user['password'])
+        assert dashboard.is_dashboard_displayed()
+
+        for tab in ("transfer", "bills", "security"):
+            asset_recorder.mark(tab)
+            dashboard.navigate_to_tab(tab)
+
+        allure.attach(
+            json.dumps(asset_recorder.summary(), indent=2, ensure_ascii=False),
+            name="Ressources par page",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        violations = check_asset_budgets(asset_recorder.records, test_config.get("asset_budgets", {}))
+        assert not violations, "Budgets de ressources dépassés:\n" + "\n".join(violations)
@@ -0,0 +1,53 @@
+"""
+Test de temps de chargement DigitalBank sous le profil d'émulation actif
+
+Seuil : performance_thresholds.page_load_time (test_config.yaml), surchargé
+par le profil --perf-profile s'il en définit un.
+    pytest tests/performance/test_page_load.py --perf-profile=mobile-3g --browser chromium
+"""
+
+import pytest
+import allure
+
+from tests.utils.emulation import measure_page_load
+from tests.utils.pages.login_page import LoginPage
+
+
+@allure.epic("DigitalBank")
+@allure.feature("Performance")
+class TestPageLoad:
+    """Temps de chargement de la page de connexion"""
+
+    @allure.story("Temps de chargement")
+    @allure.title("Chargement de la page de connexion dans le seuil du profil")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_page_load_time(self, web_driver, perf_profile, performance_thresholds):
+        """
+        TC-PERF-003: Temps de chargement sous le profil d'émulation actif
+
+        Étapes:
+        1. Charger l'application (page de connexion)
+        2. Lire la durée de navigation (Navigation Timing, jusqu'à loadEventEnd)
+
+        Résultat attendu:
+        - Durée inférieure à performance_thresholds.page_load_time
+        """
+        threshold = performance_thresholds.get("page_load_time")
+        if not threshold:
+            pytest.skip("Aucun seuil page_load_time configuré")
+
+        assert LoginPage(web_driver).is_login_page_displayed()
+        duration = measure_page_load(web_driver)
+        if duration is None:
+            pytest.skip("Navigation Timing non disponible sur ce navigateur")
+
+        profile = perf_profile["name"] if perf_profile else "aucun"
+        allure.attach(
+            f"{duration:.0f} ms (seuil {threshold} ms, profil {profile})",
+            name="Temps de chargement",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        assert duration <= threshold, (
+            f"Chargement en {duration:.0f} ms, seuil {threshold} ms (profil {profile})"
+        )
@@ -0,0 +1,92 @@
+"""
+Test soak DigitalBank - détection de fuites mémoire sur exécution longue
+
+Désactivé par défaut, activé via --soak-duration (en minutes):
+    pytest tests/performance/test_soak.py --soak-duration=120 --browser chromium
+"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+import allure
+
+from tests.utils.soak import SoakRunner
+
+
+@allure.epic("DigitalBank")
+@allure.feature("Performance")
+class TestSoak:
+    """Exécution longue d'un mélange de parcours dans une même page"""
+
+    @allure.story("Soak")
+    @allure.title("Absence de fuite mémoire sur exécution longue")
+    @allure.severity(allure.severity_level.NORMAL)
+    @pytest.mark.performance
+    def test_soak_memory_trend(
+        self, request, web_driver, browser_name, browser_metrics, standard_user, test_config
+    ):
+        """
+        TC-PERF-001: Tendance mémoire / DOM / latence stable
+
+        Étapes:
+        1. Répéter les parcours configurés pendant --soak-duration minutes
+        2. Échantillonner tas JS, noeuds DOM, listeners et latence
+        3. Ajuster une tendance linéaire sur chaque série
+
+        Résultat attendu:
+        - Chaque parcours atteint ses points de contrôle
+        - Au moins soak.min_samples échantillons après la chauffe
+        - Aucune pente ne dépasse soak.max_slopes (test_config.yaml)
+        """
+        duration_min = request.config.getoption("--soak-duration")
+        if not duration_min:
+            pytest.skip("Mode soak désactivé (utiliser --soak-duration=<minutes>)")
+
+        soak_config = test_config.get("soak", {})
+        flows_option = request.config.getoption("--soak-flows")
+        flows = flows_option.split(",") if flows_option else soak_config.get("flows", [])
+
+        runner = SoakRunner(
+            web_driver,
+            browser_metrics,
+            standard_user,
+            flows,
+            sample_interval=soak_config.get("sample_interval_seconds", 30),
+            warmup_samples=soak_config.get("warmup_samples", 2),
+            min_samples=soak_config.get("min_samples", 3),
+        )
+        runner.run(duration_min * 60)
+
+        report = runner.to_report()
+        report_dir = "reports/metrics"
+        os.makedirs(report_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        with open(os.path.join(report_dir, f"soak-{timestamp}.json"), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        allure.attach(
+            json.dumps(report, indent=2),
+            name="Rapport soak",
+            attachment_type=allure.attachment_type.JSON,
+        )
+
+        analysed = len(runner.analysed_samples)
+        assert analysed >= runner.min_samples, (
+            f"{analysed} échantillon(s) après chauffe, {runner.min_samples} requis : "
+            "allonger --soak-duration ou réduire soak.sample_interval_seconds"
+        )
+
+        max_slopes = soak_config.get("max_slopes") or {}
+        unmeasured = runner.unmeasured(max_slopes)
+        if max_slopes and len(unmeasured) == len(max_slopes):
+            pytest.skip(f"Aucune métrique exploitable sur {browser_name}: {', '.join(unmeasured)}")
+        if unmeasured:
+            allure.attach(
+                f"Non mesurées sur {browser_name}: {', '.join(unmeasured)}",
+                name="Métriques non mesurées",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        violations = runner.violations(max_slopes)
+        assert not violations, "Croissance anormale détectée:\n" + "\n".join(violations)
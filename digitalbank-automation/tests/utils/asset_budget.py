@@ -0,0 +1,176 @@
+"""
+Enregistrement des ressources réseau et contrôle des budgets de poids
+
+Chaque réponse réseau terminée pendant un test est enregistrée : URL, type
+de ressource, octets transférés (corps + en-têtes), encodage de compression et
+en-têtes de cache. Les ressources sont regroupées par page / onglet via
+AssetRecorder.mark() (par défaut : chemin de l'URL courante).
+
+Les budgets (config/test_config.yaml, section asset_budgets) portent sur :
+- le nombre de requêtes et le volume transféré par page/onglet
+- le volume par type de ressource (document, stylesheet, script...)
+- la compression et les en-têtes de cache des ressources textuelles
+"""
+
+import json
+import logging
+import os
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = "reports/assets"
+
+
+class AssetRecorder:
+    """Enregistre les ressources réseau chargées par une page Playwright"""
+
+    def __init__(self, page):
+        """
+        Args:
+            page: Instance Playwright Page (enregistrement démarré immédiatement)
+        """
+        self.page = page
+        self.records = []
+        self._label = None
+        page.on("requestfinished", self._on_request_finished)
+
+    def mark(self, label):
+        """
+        Rattache les ressources suivantes à une page / un onglet.
+
+        Args:
+            label: Nom de la page ou de l'onglet ('login', 'transfer'...)
+        """
+        self._label = label
+
+    def stop(self):
+        """Arrête l'enregistrement"""
+        try:
+            self.page.remove_listener("requestfinished", self._on_request_finished)
+        except Exception:
+            pass
+
+    def _current_label(self):
+        if self._label:
+            return self._label
+        return urlparse(self.page.url).path or "/"
+
+    def _on_request_finished(self, request):
+        try:
+            response = request.response()
+            if response is None:
+                return
+            sizes = request.sizes()
+            headers = response.headers
+            self.records.append({
+                "page": self._current_label(),
+                "url": request.url,
+                "resource_type": request.resource_type,
+                "status": response.status,
+                "body_bytes": sizes.get("responseBodySize", 0),
+                "header_bytes": sizes.get("responseHeadersSize", 0),
+                "content_encoding": headers.get("content-encoding"),
+                "cache_control": headers.get("cache-control"),
+                "etag": headers.get("etag"),
+                "last_modified": headers.get("last-modified"),
+            })
+        except Exception as e:
+            logger.warning(f"Ressource non enregistrée ({request.url}): {e}")
+
+    def summary(self):
+        """
+        Agrège les ressources par page / onglet.
+
+        Returns:
+            Dictionnaire {page: {requests, transfer_bytes, by_type: {type: octets}}}
+        """
+        pages = {}
+        for record in self.records:
+            page = pages.setdefault(
+                record["page"], {"requests": 0, "transfer_bytes": 0, "by_type": {}}
+            )
+            size = transfer_size(record)
+            page["requests"] += 1
+            page["transfer_bytes"] += size
+            by_type = page["by_type"]
+            by_type[record["resource_type"]] = by_type.get(record["resource_type"], 0) + size
+        return pages
+
+
+def transfer_size(record):
+    """Octets transférés d'une ressource : en-têtes + corps (compressé le cas échéant)"""
+    return record["body_bytes"] + record["header_bytes"]
+
+
+def check_asset_budgets(records, budgets):
+    """
+    Vérifie les ressources enregistrées par rapport aux budgets.
+
+    Args:
+        records: Liste des ressources (AssetRecorder.records)
+        budgets: Section asset_budgets de test_config.yaml
+
+    Returns:
+        Liste de messages décrivant les dépassements
+    """
+    violations = []
+    per_page = budgets.get("per_page", {})
+    per_type = budgets.get("per_resource_type", {})
+    compression = budgets.get("compression", {})
+    cache = budgets.get("cache_headers", {})
+
+    pages = {}
+    for record in records:
+        pages.setdefault(record["page"], []).append(record)
+
+    for page, page_records in pages.items():
+        transfer = sum(transfer_size(r) for r in page_records)
+        max_requests = per_page.get("max_requests")
+        if max_requests is not None and len(page_records) > max_requests:
+            violations.append(f"[{page}] {len(page_records)} requêtes > budget {max_requests}")
+        max_bytes = per_page.get("max_transfer_bytes")
+        if max_bytes is not None and transfer > max_bytes:
+            violations.append(f"[{page}] {transfer} octets transférés > budget {max_bytes}")
+
+        by_type = {}
+        for r in page_records:
+            by_type[r["resource_type"]] = by_type.get(r["resource_type"], 0) + transfer_size(r)
+        for resource_type, size in by_type.items():
+            limit = per_type.get(resource_type)
+            if limit is not None and size > limit:
+                violations.append(f"[{page}] {resource_type}: {size} octets > budget {limit}")
+
+    for r in records:
+        if r["status"] >= 300:
+            continue
+        if (
+            compression.get("required")
+            and r["resource_type"] in compression.get("types", [])
+            and r["body_bytes"] >= compression.get("min_bytes", 0)
+            and not r["content_encoding"]
+        ):
+            violations.append(f"Ressource non compressée ({r['body_bytes']} octets): {r['url']}")
+        if (
+            cache.get("required")
+            and r["resource_type"] in cache.get("types", [])
+            and not (r["cache_control"] or r["etag"] or r["last_modified"])
+        ):
+            violations.append(f"En-têtes de cache absents: {r['url']}")
+
+    return violations
+
+
+def asset_report_path(directory=ASSETS_DIR):
+    """Fichier de rapport du run courant (un par worker xdist)"""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return os.path.join(directory, f"asset-report-{worker}.jsonl")
+
+
+def write_asset_report(test_id, recorder, path=None):
+    """Ajoute le bilan des ressources d'un test au rapport du run"""
+    path = path or asset_report_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    record = {"test": test_id, "pages": recorder.summary(), "resources": recorder.records}
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
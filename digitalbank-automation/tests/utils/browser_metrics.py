@@ -0,0 +1,136 @@
+"""
+Capture des métriques mémoire / DOM du navigateur pour chaque test
+
+Métriques relevées en début et fin de test :
+- js_heap_used / js_heap_total : taille du tas JavaScript (octets)
+- dom_nodes : nombre de noeuds DOM
+- listeners : nombre d'event listeners JavaScript
+- documents : nombre de documents
+
+Chromium : CDP Performance.getMetrics (toutes les métriques).
+Firefox / WebKit : performance.memory si disponible + comptage DOM en JS,
+les listeners et documents ne sont alors pas mesurables (None).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR = "reports/metrics"
+
+# Correspondance métriques CDP -> noms exposés
+_CDP_METRICS = {
+    "JSHeapUsedSize": "js_heap_used",
+    "JSHeapTotalSize": "js_heap_total",
+    "Nodes": "dom_nodes",
+    "JSEventListeners": "listeners",
+    "Documents": "documents",
+}
+
+_JS_METRICS = """() => ({
+    js_heap_used: performance.memory ? performance.memory.usedJSHeapSize : null,
+    js_heap_total: performance.memory ? performance.memory.totalJSHeapSize : null,
+    dom_nodes: document.getElementsByTagName('*').length,
+    listeners: null,
+    documents: null,
+})"""
+
+
+class BrowserMetricsSampler:
+    """Échantillonne les métriques mémoire/DOM d'une page Playwright"""
+
+    def __init__(self, page, browser_name):
+        """
+        Args:
+            page: Instance Playwright Page
+            browser_name: Navigateur courant (chromium, firefox, webkit)
+        """
+        self.page = page
+        self.browser_name = browser_name
+        self._cdp = None
+        self.samples = {}
+
+        if browser_name == "chromium":
+            try:
+                self._cdp = page.context.new_cdp_session(page)
+                self._cdp.send("Performance.enable")
+            except Exception as e:
+                logger.warning(f"CDP indisponible, repli sur performance.memory: {e}")
+                self._cdp = None
+
+    def sample(self, label):
+        """
+        Relève les métriques courantes et les mémorise sous un libellé.
+
+        Args:
+            label: Libellé de l'échantillon ('start', 'end'...)
+
+        Returns:
+            Dictionnaire des métriques, vide si la page n'est plus accessible
+        """
+        try:
+            metrics = self._sample_cdp() if self._cdp else self.page.evaluate(_JS_METRICS)
+        except Exception as e:
+            logger.warning(f"Échantillonnage des métriques impossible ({label}): {e}")
+            metrics = {}
+        self.samples[label] = metrics
+        return metrics
+
+    def collect_garbage(self):
+        """Force un passage du ramasse-miettes (Chromium uniquement) avant mesure"""
+        if self._cdp is None:
+            return
+        try:
+            self._cdp.send("HeapProfiler.collectGarbage")
+        except Exception as e:
+            logger.warning(f"Ramasse-miettes CDP indisponible: {e}")
+
+    def _sample_cdp(self):
+        response = self._cdp.send("Performance.getMetrics")
+        values = {m["name"]: m["value"] for m in response.get("metrics", [])}
+        return {
+            key: int(values[cdp_name]) if cdp_name in values else None
+            for cdp_name, key in _CDP_METRICS.items()
+        }
+
+    def deltas(self, start="start", end="end"):
+        """Retourne la variation de chaque métrique entre deux échantillons"""
+        first = self.samples.get(start, {})
+        last = self.samples.get(end, {})
+        return {
+            key: last[key] - first[key]
+            for key in last
+            if last.get(key) is not None and first.get(key) is not None
+        }
+
+    def to_record(self, test_id, outcome):
+        """Construit l'enregistrement JSON écrit dans le fichier de métriques"""
+        return {
+            "test": test_id,
+            "browser": self.browser_name,
+            "outcome": outcome,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "samples": self.samples,
+            "deltas": self.deltas(),
+        }
+
+
+def metrics_file_path(directory=METRICS_DIR):
+    """
+    Chemin du fichier de métriques du run courant.
+
+    Un fichier par worker xdist pour éviter les écritures concurrentes.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return os.path.join(directory, f"browser-metrics-{worker}.jsonl")
+
+
+def write_metrics_record(record, path=None):
+    """Ajoute un enregistrement (une ligne JSON) au fichier de métriques"""
+    path = path or metrics_file_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
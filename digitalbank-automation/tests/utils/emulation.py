@@ -0,0 +1,172 @@
+"""
+Profils d'émulation CPU / réseau pour les tests DigitalBank
+
+Le viewport (--viewport) ne change que les dimensions de la fenêtre : un
+run "mobile" garde le CPU et le réseau du poste de test. Les profils définis
+dans config/test_config.yaml (section emulation_profiles) ajoutent :
+- Chromium : bridage CPU et réseau via CDP (Emulation / Network)
+- Firefox / WebKit : latence réseau simulée via page.route (pas de bridage CPU)
+
+Limites de l'émulation Firefox / WebKit (page.route) :
+- le handler synchrone attend dans le répartiteur d'événements unique de
+  Playwright : les requêtes sont retardées l'une après l'autre (latence
+  cumulée pour les requêtes parallèles, pire qu'un vrai réseau lent)
+- le routage désactive le cache HTTP du navigateur
+- download_kbps / upload_kbps sont ignorés (pas de bridage de débit)
+Les mesures sous profil ne sont donc comparables qu'entre runs d'un même
+navigateur.
+
+Un profil peut surcharger les seuils globaux performance_thresholds
+(clé performance_thresholds du profil), voir resolve_performance_thresholds().
+
+Sélection via l'option --perf-profile (ou 'auto' pour suivre --viewport).
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Valeur de --perf-profile désactivant toute émulation
+NO_PROFILE = "none"
+# Valeur de --perf-profile sélectionnant le profil associé au viewport
+AUTO_PROFILE = "auto"
+
+
+def resolve_emulation_profile(profiles, name, viewport):
+    """
+    Résout le profil d'émulation à appliquer.
+
+    Args:
+        profiles: Section emulation_profiles de test_config.yaml
+        name: Valeur de --perf-profile ('none', 'auto' ou nom de profil)
+        viewport: Valeur de --viewport (utilisée en mode 'auto')
+
+    Returns:
+        Dictionnaire du profil (avec sa clé 'name'), ou None si aucune émulation
+    """
+    profiles = profiles or {}
+    if not name or name == NO_PROFILE:
+        return None
+
+    if name == AUTO_PROFILE:
+        matches = [key for key, value in profiles.items() if value.get("viewport") == viewport]
+        if not matches:
+            return None
+        name = matches[0]
+
+    if name not in profiles:
+        raise ValueError(
+            f"Profil d'émulation inconnu: {name} (disponibles: {', '.join(sorted(profiles))})"
+        )
+    return {**profiles[name], "name": name}
+
+
+def resolve_performance_thresholds(thresholds, profile):
+    """
+    Seuils de performance applicables au profil d'émulation actif.
+
+    Args:
+        thresholds: Section performance_thresholds de test_config.yaml
+        profile: Profil résolu par resolve_emulation_profile() (ou None)
+
+    Returns:
+        Seuils globaux surchargés par la clé performance_thresholds du profil
+    """
+    resolved = dict(thresholds or {})
+    if profile:
+        resolved.update(profile.get("performance_thresholds") or {})
+    return resolved
+
+
+def measure_page_load(page):
+    """
+    Durée de chargement de la page courante (Navigation Timing).
+
+    Attend l'événement load puis lit l'entrée 'navigation' de l'API
+    Performance : de startTime à loadEventEnd.
+
+    Returns:
+        Durée en millisecondes, ou None si le navigateur ne l'expose pas
+    """
+    page.wait_for_load_state("load")
+    return page.evaluate(
+        """() => {
+            const [entry] = performance.getEntriesByType('navigation');
+            return entry && entry.loadEventEnd > 0 ? entry.loadEventEnd - entry.startTime : null;
+        }"""
+    )
+
+
+def apply_emulation_profile(page, browser_name, profile):
+    """
+    Applique un profil d'émulation à une page Playwright.
+
+    Args:
+        page: Instance Playwright Page
+        browser_name: Navigateur courant (chromium, firefox, webkit)
+        profile: Profil résolu par resolve_emulation_profile()
+
+    Returns:
+        Session CDP ouverte (Chromium) ou None
+    """
+    if not profile:
+        return None
+
+    network = profile.get("network") or {}
+    cpu_rate = profile.get("cpu_throttling_rate", 1)
+
+    if browser_name == "chromium":
+        cdp = page.context.new_cdp_session(page)
+        if cpu_rate and cpu_rate > 1:
+            cdp.send("Emulation.setCPUThrottlingRate", {"rate": cpu_rate})
+        if network:
+            cdp.send("Network.enable")
+            cdp.send("Network.emulateNetworkConditions", _cdp_network_conditions(network))
+        logger.info(f"Profil d'émulation '{profile['name']}' appliqué via CDP")
+        return cdp
+
+    # Firefox / WebKit : pas de CDP, seule la latence réseau est simulée
+    if cpu_rate and cpu_rate > 1:
+        logger.warning(
+            f"Bridage CPU non supporté sur {browser_name}, "
+            f"profil '{profile['name']}' appliqué sans bridage CPU"
+        )
+    if network.get("download_kbps") or network.get("upload_kbps"):
+        logger.warning(
+            f"Bridage de débit non supporté sur {browser_name}, "
+            f"profil '{profile['name']}' appliqué sans limite de débit"
+        )
+    latency_ms = network.get("latency_ms", 0)
+    if latency_ms:
+        page.route("**/*", _delayed_route_handler(latency_ms / 1000))
+    logger.info(f"Profil d'émulation '{profile['name']}' appliqué (latence {latency_ms} ms)")
+    return None
+
+
+def _cdp_network_conditions(network):
+    """Convertit la section network d'un profil en paramètres CDP (débits en octets/s)"""
+    def throughput(kbps):
+        # -1 désactive le bridage côté CDP
+        return kbps * 1000 / 8 if kbps else -1
+
+    return {
+        "offline": network.get("offline", False),
+        "latency": network.get("latency_ms", 0),
+        "downloadThroughput": throughput(network.get("download_kbps")),
+        "uploadThroughput": throughput(network.get("upload_kbps")),
+    }
+
+
+def _delayed_route_handler(delay_seconds):
+    """
+    Handler page.route ajoutant une latence fixe avant chaque requête
+
+    Bloquant : les requêtes routées sont retardées en série (voir limites
+    Firefox / WebKit en tête de module).
+    """
+    def handler(route):
+        time.sleep(delay_seconds)
+        route.continue_()
+
+    return handler
@@ -0,0 +1,358 @@
+"""
+Base de référence des performances et détection de régressions entre runs
+
+Les durées de chaque test (phase call) et de chaque step Allure sont
+enregistrées dans une base SQLite locale (reports/perf_baseline.db) avec le
+navigateur, le viewport et le profil d'émulation du run.
+
+En fin de session, les durées du run courant sont comparées aux N derniers
+runs de la même branche :
+- Mann-Whitney U unilatéral lorsque le run courant a assez d'échantillons
+- score z robuste (médiane / MAD) sinon (un seul échantillon par test)
+
+Une régression n'est signalée que si l'écart est significatif ET supérieur à
+un pourcentage minimal d'augmentation de la médiane.
+"""
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from contextlib import closing, contextmanager
+from datetime import datetime
+
+import allure_commons
+
+logger = logging.getLogger(__name__)
+
+# Variable d'environnement partageant l'identifiant du run avec les workers xdist
+RUN_ID_ENV = "PERF_RUN_ID"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    branch TEXT NOT NULL,
+    commit_sha TEXT,
+    started_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id TEXT NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    browser TEXT NOT NULL,
+    viewport TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    duration_ms REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_samples_run ON samples (run_id);
+CREATE INDEX IF NOT EXISTS ix_runs_branch ON runs (branch, started_at);
+"""
+
+# Colonnes identifiant une série de mesures comparable d'un run à l'autre
+_SERIES_KEY = ("test", "kind", "name", "browser", "viewport", "profile")
+
+
+def current_branch():
+    """Branche courante (variables CI GitHub, puis git), 'unknown' à défaut"""
+    for var in ("GITHUB_HEAD_REF", "GITHUB_REF_NAME"):
+        if os.getenv(var):
+            return os.getenv(var)
+    return _git("rev-parse", "--abbrev-ref", "HEAD") or "unknown"
+
+
+def current_commit():
+    """SHA du commit courant, None hors dépôt git"""
+    return os.getenv("GITHUB_SHA") or _git("rev-parse", "HEAD")
+
+
+def _git(*args):
+    try:
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, timeout=5, check=True
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class PerfRecorder:
+    """
+    Collecte en mémoire les durées des tests et des steps Allure.
+
+    Enregistré comme plugin allure_commons pour recevoir start_step/stop_step
+    de tous les @allure.step des Page Objects sans les modifier.
+    """
+
+    def __init__(self, viewport, profile):
+        """
+        Args:
+            viewport: Viewport du run (--viewport)
+            profile: Profil d'émulation du run (--perf-profile)
+        """
+        self.viewport = viewport
+        self.profile = profile
+        self.samples = []
+        self.current_test = None
+        self.current_browser = "n/a"
+        self._open_steps = {}
+
+    def start_test(self, nodeid, browser):
+        """Marque le début d'un test : les steps suivants lui sont rattachés"""
+        self.current_test = nodeid
+        self.current_browser = browser or "n/a"
+
+    def add_test_duration(self, nodeid, browser, duration_ms):
+        """Enregistre la durée de la phase call d'un test"""
+        self._add(nodeid, "test", nodeid, browser or "n/a", duration_ms)
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._open_steps[uuid] = (title, time.perf_counter())
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        title, started = self._open_steps.pop(uuid, (None, None))
+        if title is None or self.current_test is None or exc_type is not None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        self._add(self.current_test, "step", title, self.current_browser, duration_ms)
+
+    def _add(self, test, kind, name, browser, duration_ms):
+        self.samples.append({
+            "test": test,
+            "kind": kind,
+            "name": name,
+            "browser": browser,
+            "viewport": self.viewport,
+            "profile": self.profile,
+            "duration_ms": duration_ms,
+        })
+
+
+class PerfBaselineStore:
+    """Stockage SQLite des runs et des durées mesurées"""
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Chemin du fichier SQLite (créé si absent)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Connexion transactionnelle (commit en sortie), fermée après usage"""
+        # Timeout élevé : plusieurs workers xdist peuvent écrire en fin de session
+        with closing(sqlite3.connect(self.path, timeout=60)) as conn:
+            with conn:
+                yield conn
+
+    def start_run(self, run_id, branch, commit_sha=None):
+        """Déclare un nouveau run (idempotent)"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO runs (id, branch, commit_sha, started_at) VALUES (?, ?, ?, ?)",
+                (run_id, branch, commit_sha, datetime.now().isoformat(timespec="seconds")),
+            )
+
+    def add_samples(self, run_id, samples):
+        """Insère les échantillons d'un run (une transaction)"""
+        if not samples:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO samples (run_id, test, kind, name, browser, viewport, profile, duration_ms) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, *(s[k] for k in _SERIES_KEY), s["duration_ms"]) for s in samples],
+            )
+
+    def previous_runs(self, branch, exclude_run_id, limit):
+        """Identifiants des derniers runs de la branche (du plus récent au plus ancien)"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id FROM runs WHERE branch = ? AND id != ? "
+                "AND EXISTS (SELECT 1 FROM samples WHERE samples.run_id = runs.id) "
+                "ORDER BY started_at DESC, rowid DESC LIMIT ?",
+                (branch, exclude_run_id, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def series(self, run_ids):
+        """
+        Regroupe les durées par série pour un ensemble de runs.
+
+        Returns:
+            Dictionnaire {clé de série: [durées ms]}
+        """
+        if not run_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in run_ids)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(_SERIES_KEY)}, duration_ms FROM samples "
+                f"WHERE run_id IN ({placeholders})",
+                list(run_ids),
+            ).fetchall()
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(tuple(row[:-1]), []).append(row[-1])
+        return grouped
+
+
+# ═══════════════════════════════════════════════════════════════
+# COMPARAISON STATISTIQUE
+# ═══════════════════════════════════════════════════════════════
+
+def mann_whitney_greater(current, baseline):
+    """
+    Test de Mann-Whitney U unilatéral (current > baseline), approximation normale.
+
+    Returns:
+        p-value (1.0 si non calculable)
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    ranked = sorted([(v, 0) for v in current] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+    rank_sum = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def robust_z(value, baseline):
+    """Score z robuste de value par rapport à baseline (médiane / MAD normalisée)"""
+    median = statistics.median(baseline)
+    mad = statistics.median(abs(v - median) for v in baseline) * 1.4826
+    if mad == 0:
+        return math.inf if value > median else 0.0
+    return (value - median) / mad
+
+
+def detect_regressions(current_series, baseline_series, alpha=0.01, z_threshold=3.0,
+                       min_increase_pct=10.0, min_samples=5):
+    """
+    Compare les séries du run courant aux séries de référence.
+
+    Args:
+        current_series: {clé: [durées]} du run courant
+        baseline_series: {clé: [durées]} des runs de référence
+        alpha: Seuil de significativité du test de Mann-Whitney
+        z_threshold: Seuil du score z robuste (échantillons courants insuffisants)
+        min_increase_pct: Augmentation minimale de la médiane (%) pour signaler
+        min_samples: Taille minimale des deux échantillons pour Mann-Whitney
+
+    Returns:
+        Liste de régressions (dictionnaires), triée par augmentation décroissante
+    """
+    regressions = []
+    for key, current in current_series.items():
+        baseline = baseline_series.get(key)
+        if not baseline or len(baseline) < 2:
+            continue
+        base_median = statistics.median(baseline)
+        cur_median = statistics.median(current)
+        if base_median <= 0:
+            continue
+        increase_pct = (cur_median - base_median) / base_median * 100
+        if increase_pct < min_increase_pct:
+            continue
+
+        if len(current) >= min_samples and len(baseline) >= min_samples:
+            method = "mann-whitney"
+            p_value = mann_whitney_greater(current, baseline)
+            significant = p_value < alpha
+            score = p_value
+        else:
+            method = "robust-z"
+            score = robust_z(cur_median, baseline)
+            significant = score > z_threshold
+
+        if significant:
+            regressions.append({
+                **dict(zip(_SERIES_KEY, key)),
+                "baseline_median_ms": round(base_median, 2),
+                "current_median_ms": round(cur_median, 2),
+                "increase_pct": round(increase_pct, 1),
+                "method": method,
+                "score": score if math.isfinite(score) else None,
+                "baseline_samples": len(baseline),
+                "current_samples": len(current),
+            })
+    return sorted(regressions, key=lambda r: r["increase_pct"], reverse=True)
+
+
+def compare_run(store, run_id, branch, settings):
+    """
+    Compare un run aux derniers runs de la même branche.
+
+    Args:
+        store: PerfBaselineStore
+        run_id: Run courant
+        branch: Branche du run
+        settings: Section performance_baseline de test_config.yaml
+
+    Returns:
+        Résultat sérialisable (runs de référence, régressions)
+    """
+    baseline_runs = store.previous_runs(branch, run_id, settings.get("window_runs", 10))
+    result = {
+        "run_id": run_id,
+        "branch": branch,
+        "baseline_runs": baseline_runs,
+        "regressions": [],
+        "status": "insufficient_baseline",
+    }
+    if len(baseline_runs) < settings.get("min_baseline_runs", 3):
+        return result
+
+    result["regressions"] = detect_regressions(
+        store.series([run_id]),
+        store.series(baseline_runs),
+        alpha=settings.get("alpha", 0.01),
+        z_threshold=settings.get("z_threshold", 3.0),
+        min_increase_pct=settings.get("min_increase_pct", 10.0),
+    )
+    result["status"] = "regression" if result["regressions"] else "ok"
+    return result
+
+
+def write_result(result, path):
+    """Écrit le résultat de comparaison (JSON) pour le gating CI"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+def new_run_id():
+    """Identifiant unique de run"""
+    return f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
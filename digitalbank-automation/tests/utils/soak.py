@@ -0,0 +1,252 @@
+"""
+Mode soak : détection de fuites mémoire sur une exécution longue
+
+Répète un enchaînement de parcours (login → transfer → bills → security → logout)
+dans une même page via les Page Objects existants, échantillonne à intervalle
+régulier le tas JS, le nombre de noeuds DOM et la latence des actions, puis
+ajuste une tendance linéaire (moindres carrés) sur chaque série.
+
+Chaque parcours vérifie ses points de contrôle (page affichée, virement
+confirmé...) : un parcours en échec interrompt le run au lieu de mesurer une
+page d'erreur.
+
+Le run échoue si une pente dépasse le seuil configuré dans test_config.yaml
+(section soak.max_slopes, unités par minute). Une pente n'est calculée
+qu'à partir de soak.min_samples échantillons exploitables après la chauffe :
+les métriques non exposées par le navigateur (tas JS hors Chromium) sont
+signalées comme non mesurées, pas comme stables.
+"""
+
+import logging
+import time
+
+from tests.utils.pages.login_page import LoginPage
+from tests.utils.pages.dashboard_page import DashboardPage
+from tests.utils.pages.transfer_page import TransferPage
+from tests.utils.pages.bills_page import BillsPage
+from tests.utils.pages.security_page import SecurityPage
+
+logger = logging.getLogger(__name__)
+
+# Séries dont la tendance est analysée
+METRICS = ("js_heap_used", "dom_nodes", "listeners", "action_latency_ms")
+
+
+# ═══════════════════════════════════════════════════════════════
+# PARCOURS
+# ═══════════════════════════════════════════════════════════════
+
+def _check(condition, message):
+    """Point de contrôle d'un parcours"""
+    if not condition:
+        raise AssertionError(message)
+
+
+def _flow_login(pages, user):
+    pages["login"].login(user["email"], user["password"])
+    _check(pages["dashboard"].is_dashboard_displayed(), "tableau de bord non affiché après connexion")
+
+
+def _flow_transfer(pages, user):
+    pages["dashboard"].navigate_to_tab("transfer")
+    _check(pages["transfer"].is_transfer_page_displayed(), "page de virement non affichée")
+    pages["transfer"].make_internal_transfer(1, "Soak test")
+    _check(pages["transfer"].get_success_message(), "virement non confirmé")
+
+
+def _flow_bills(pages, user):
+    pages["dashboard"].navigate_to_tab("bills")
+    _check(pages["bills"].is_bills_page_displayed(), "page des factures non affichée")
+    pages["bills"].get_pending_bills()
+
+
+def _flow_security(pages, user):
+    pages["dashboard"].navigate_to_tab("security")
+    _check(pages["security"].is_security_page_displayed(), "page sécurité non affichée")
+    # Double bascule : l'état final reste identique
+    initial = pages["security"].is_email_notifications_enabled()
+    pages["security"].toggle_email_notifications()
+    pages["security"].toggle_email_notifications()
+    _check(
+        pages["security"].is_email_notifications_enabled() == initial,
+        "notifications email modifiées après double bascule",
+    )
+
+
+def _flow_logout(pages, user):
+    pages["dashboard"].logout()
+    _check(pages["login"].is_login_page_displayed(), "page de connexion non affichée après déconnexion")
+
+
+FLOWS = {
+    "login": _flow_login,
+    "transfer": _flow_transfer,
+    "bills": _flow_bills,
+    "security": _flow_security,
+    "logout": _flow_logout,
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# TENDANCE
+# ═══════════════════════════════════════════════════════════════
+
+def linear_slope(xs, ys):
+    """
+    Pente de la droite des moindres carrés ajustée sur (xs, ys).
+
+    Returns:
+        Pente, ou None si moins de deux points exploitables (ou x constants)
+    """
+    points = [(x, y) for x, y in zip(xs, ys) if y is not None]
+    n = len(points)
+    if n < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return cov / var_x
+
+
+class SoakRunner:
+    """Exécute un mélange de parcours en boucle et analyse les tendances"""
+
+    def __init__(self, page, sampler, user, flows, sample_interval=30, warmup_samples=2, min_samples=3):
+        """
+        Args:
+            page: Instance Playwright Page (réutilisée pendant tout le run)
+            sampler: BrowserMetricsSampler attaché à la page
+            user: Utilisateur de test (dict avec email/password)
+            flows: Liste ordonnée des parcours (clés de FLOWS)
+            sample_interval: Intervalle d'échantillonnage en secondes
+            warmup_samples: Nombre d'échantillons ignorés pour la tendance
+            min_samples: Échantillons exploitables requis pour calculer une pente
+        """
+        unknown = [name for name in flows if name not in FLOWS]
+        if unknown:
+            raise ValueError(
+                f"Parcours inconnus: {', '.join(unknown)} (disponibles: {', '.join(FLOWS)})"
+            )
+
+        self.page = page
+        self.sampler = sampler
+        self.user = user
+        self.flows = flows
+        self.sample_interval = sample_interval
+        self.warmup_samples = warmup_samples
+        self.min_samples = max(2, min_samples)
+        self.pages = {
+            "login": LoginPage(page),
+            "dashboard": DashboardPage(page),
+            "transfer": TransferPage(page),
+            "bills": BillsPage(page),
+            "security": SecurityPage(page),
+        }
+        self.samples = []
+        self.iterations = 0
+
+    def run(self, duration_seconds):
+        """
+        Boucle sur les parcours jusqu'à épuisement de la durée.
+
+        Args:
+            duration_seconds: Durée totale du run
+
+        Returns:
+            Liste des échantillons relevés
+        """
+        started = time.monotonic()
+        next_sample = started
+        latencies = []
+
+        while time.monotonic() - started < duration_seconds:
+            for name in self.flows:
+                flow_start = time.perf_counter()
+                try:
+                    FLOWS[name](self.pages, self.user)
+                except AssertionError as error:
+                    raise AssertionError(
+                        f"Parcours '{name}' en échec (itération {self.iterations + 1}): {error}"
+                    ) from error
+                latencies.append((time.perf_counter() - flow_start) * 1000)
+            self.iterations += 1
+
+            now = time.monotonic()
+            if now >= next_sample:
+                self._record_sample(now - started, latencies)
+                latencies = []
+                next_sample = now + self.sample_interval
+
+        return self.samples
+
+    def _record_sample(self, elapsed_seconds, latencies):
+        self.sampler.collect_garbage()
+        metrics = self.sampler.sample(f"soak-{len(self.samples)}")
+        sample = {
+            "elapsed_min": round(elapsed_seconds / 60, 3),
+            "iterations": self.iterations,
+            "js_heap_used": metrics.get("js_heap_used"),
+            "dom_nodes": metrics.get("dom_nodes"),
+            "listeners": metrics.get("listeners"),
+            "action_latency_ms": sum(latencies) / len(latencies) if latencies else None,
+        }
+        self.samples.append(sample)
+        logger.info(f"Soak échantillon {len(self.samples)}: {sample}")
+
+    @property
+    def analysed_samples(self):
+        """Échantillons retenus pour la tendance (après la période de chauffe)"""
+        return self.samples[self.warmup_samples:]
+
+    def slopes(self):
+        """
+        Pente (par minute) de chaque série après la période de chauffe
+
+        Returns:
+            {métrique: pente}, None pour une série de moins de min_samples
+            valeurs exploitables (métrique non exposée, run trop court)
+        """
+        samples = self.analysed_samples
+        xs = [s["elapsed_min"] for s in samples]
+        slopes = {}
+        for key in METRICS:
+            ys = [s[key] for s in samples]
+            usable = sum(y is not None for y in ys)
+            slopes[key] = linear_slope(xs, ys) if usable >= self.min_samples else None
+        return slopes
+
+    def unmeasured(self, metrics):
+        """Métriques parmi metrics dont la pente n'a pas pu être calculée"""
+        slopes = self.slopes()
+        return [key for key in metrics if key in slopes and slopes[key] is None]
+
+    def violations(self, max_slopes):
+        """
+        Compare les pentes aux seuils configurés.
+
+        Args:
+            max_slopes: Dictionnaire {métrique: pente maximale par minute}
+
+        Returns:
+            Liste de messages décrivant les dépassements (métriques non
+            mesurées exclues, voir unmeasured())
+        """
+        slopes = self.slopes()
+        return [
+            f"{key}: pente {slopes[key]:.2f}/min > seuil {limit}/min"
+            for key, limit in (max_slopes or {}).items()
+            if slopes.get(key) is not None and slopes[key] > limit
+        ]
+
+    def to_report(self):
+        """Construit le rapport JSON du run"""
+        return {
+            "flows": self.flows,
+            "iterations": self.iterations,
+            "samples": self.samples,
+            "slopes": self.slopes(),
+            "unmeasured": self.unmeasured(METRICS),
+        }